@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+TradePulse Chunked Uploads
+Resumable upload sessions that append checksummed chunks to a part file on disk
+"""
+
+from typing import Dict, Any, Optional
+import asyncio
+import hashlib
+import logging
+import json
+import uuid
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+class ChunkedUploadError(Exception):
+    """Raised when a chunk or completion request does not fit the upload session"""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+class ChunkedUploadManager:
+    """Upload sessions persisted as <id>.json + <id>.part under SESSION_DIR
+
+    The part file's size is the committed offset, so a client that lost its connection asks
+    for the session status and resumes from there, even across server restarts. A chunk is
+    only kept if its SHA-256 matches; otherwise the part file is truncated back. Sessions with
+    no activity for SESSION_TTL seconds are removed (lock, metadata and part file) on the next
+    initiate().
+    """
+
+    SESSION_DIR = os.getenv('TRADEPULSE_CHUNKED_UPLOAD_DIR', 'uploads/.chunked')
+    CHUNK_SIZE = int(os.getenv('TRADEPULSE_UPLOAD_CHUNK_MB', '8')) * 1024 * 1024
+    MAX_CHUNK_SIZE = 64 * 1024 * 1024
+    WRITE_BUFFER = 1024 * 1024   # bytes of a streamed chunk handed to a worker thread per write
+    SESSION_TTL = float(os.getenv('TRADEPULSE_CHUNKED_UPLOAD_TTL_HOURS', '24')) * 3600
+
+    def __init__(self, session_dir: Optional[str] = None):
+        self.session_dir = Path(session_dir or self.SESSION_DIR)   # created by the first initiate()
+        self._locks = {}
+
+    def _session_lock(self, upload_id: str) -> asyncio.Lock:
+        """Get the lock serializing writes to one session"""
+        return self._locks.setdefault(upload_id, asyncio.Lock())
+
+    def _paths(self, upload_id: str):
+        """Get the session and part file paths for an upload"""
+        if not upload_id.isalnum():
+            raise ChunkedUploadError(f"Invalid upload id: {upload_id}")
+        return self.session_dir / f"{upload_id}.json", self.session_dir / f"{upload_id}.part"
+
+    def _load(self, upload_id: str) -> Dict[str, Any]:
+        """Load a session, raising 404 when it does not exist"""
+        session_path, _ = self._paths(upload_id)
+        if not session_path.exists():
+            raise ChunkedUploadError(f"Upload {upload_id} not found", 404)
+        with open(session_path, 'r') as f:
+            return json.load(f)
+
+    def sweep_expired(self) -> int:
+        """Remove sessions idle for longer than SESSION_TTL and locks left without a session"""
+        removed = 0
+        if self.session_dir.exists():
+            cutoff = time.time() - self.SESSION_TTL
+            for session_path in self.session_dir.glob('*.json'):
+                upload_id = session_path.stem
+                part_path = session_path.with_suffix('.part')
+                lock = self._locks.get(upload_id)
+                if lock is not None and lock.locked():
+                    continue
+                try:
+                    # The part file's mtime moves with every committed chunk
+                    last_active = max(path.stat().st_mtime for path in (session_path, part_path) if path.exists())
+                except (OSError, ValueError):
+                    continue
+                if last_active < cutoff:
+                    part_path.unlink(missing_ok=True)
+                    session_path.unlink(missing_ok=True)
+                    self._locks.pop(upload_id, None)
+                    removed += 1
+                    logger.info(f"🧹 Expired chunked upload {upload_id}")
+        for upload_id in [upload_id for upload_id, lock in self._locks.items()
+                          if not lock.locked() and not (self.session_dir / f"{upload_id}.json").exists()]:
+            del self._locks[upload_id]
+        return removed
+
+    def initiate(self, filename: str, total_size: int, sha256: Optional[str] = None,
+                 file_type: str = "upload") -> Dict[str, Any]:
+        """Start a session and return its id, the starting offset and the suggested chunk size"""
+        self.sweep_expired()
+        upload_id = uuid.uuid4().hex
+        session_path, part_path = self._paths(upload_id)
+        self.session_dir.mkdir(parents=True, exist_ok=True)
+        session = {
+            'upload_id': upload_id,
+            'filename': Path(filename).name,
+            'total_size': total_size,
+            'sha256': sha256.lower() if sha256 else None,
+            'file_type': file_type,
+            'created_at': datetime.now().isoformat()
+        }
+        with open(session_path, 'w') as f:
+            json.dump(session, f)
+        part_path.touch()
+        logger.info(f"📦 Started chunked upload {upload_id} for {session['filename']} ({total_size} bytes)")
+        return {**session, 'offset': 0, 'chunk_size': self.CHUNK_SIZE}
+
+    def status(self, upload_id: str) -> Dict[str, Any]:
+        """Get a session with the committed offset a client should resume from"""
+        session = self._load(upload_id)
+        _, part_path = self._paths(upload_id)
+        return {**session, 'offset': part_path.stat().st_size}
+
+    async def append(self, upload_id: str, offset: int, chunks, checksum: Optional[str]) -> Dict[str, Any]:
+        """Append a streamed chunk at offset, keeping it only if its SHA-256 matches checksum"""
+        session = self._load(upload_id)
+        _, part_path = self._paths(upload_id)
+        async with self._session_lock(upload_id):
+            committed = part_path.stat().st_size
+            if offset != committed:
+                raise ChunkedUploadError(f"Expected offset {committed}, got {offset}", 409)
+
+            digest = hashlib.sha256()
+            written = 0
+            buffer = bytearray()
+            f = open(part_path, 'r+b')
+            try:
+                f.seek(committed)
+                async for piece in chunks:
+                    written += len(piece)
+                    if written > self.MAX_CHUNK_SIZE or committed + written > session['total_size']:
+                        raise ChunkedUploadError("Chunk exceeds the chunk limit or the declared file size", 413)
+                    digest.update(piece)
+                    buffer += piece
+                    if len(buffer) >= self.WRITE_BUFFER:
+                        await asyncio.to_thread(f.write, bytes(buffer))
+                        buffer.clear()
+                if checksum and digest.hexdigest() != checksum.lower():
+                    raise ChunkedUploadError("Chunk checksum mismatch", 422)
+                await asyncio.to_thread(self._write_and_sync, f, bytes(buffer))
+            except BaseException:
+                # Drop partial or corrupt chunks so the committed offset stays valid
+                f.truncate(committed)
+                raise
+            finally:
+                f.close()
+        return {'upload_id': upload_id, 'offset': committed + written, 'total_size': session['total_size']}
+
+    async def complete(self, upload_id: str, destination_dir: str) -> Dict[str, Any]:
+        """Verify size and checksum, then move the assembled file into destination_dir"""
+        session_path, part_path = self._paths(upload_id)
+        async with self._session_lock(upload_id):
+            session = self.status(upload_id)
+            if session['offset'] != session['total_size']:
+                raise ChunkedUploadError(f"Upload incomplete: {session['offset']} of {session['total_size']} bytes", 409)
+            if session['sha256'] and await asyncio.to_thread(self._file_sha256, part_path) != session['sha256']:
+                raise ChunkedUploadError("File checksum mismatch", 422)
+
+            # The upload id keeps the file (and its converted sibling) from replacing an earlier upload
+            name = Path(session['filename'])
+            destination = Path(destination_dir) / f"{name.stem}_{upload_id[:12]}{name.suffix}"
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(part_path, destination)
+            session_path.unlink(missing_ok=True)
+        self._locks.pop(upload_id, None)
+        logger.info(f"✅ Chunked upload {upload_id} assembled at {destination}")
+        return {**session, 'file_path': str(destination)}
+
+    async def abort(self, upload_id: str):
+        """Discard a session and its part file"""
+        session_path, part_path = self._paths(upload_id)
+        self._load(upload_id)
+        async with self._session_lock(upload_id):
+            part_path.unlink(missing_ok=True)
+            session_path.unlink(missing_ok=True)
+        self._locks.pop(upload_id, None)
+
+    @staticmethod
+    def _write_and_sync(f, data: bytes):
+        """Write the last buffered bytes of a chunk and flush it to disk"""
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    def _file_sha256(self, path: Path) -> str:
+        """Hash a file in blocks without loading it"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(self.CHUNK_SIZE), b''):
+                digest.update(block)
+        return digest.hexdigest()
@@ -10,6 +10,7 @@ from . import portfolio_endpoints
 from . import alert_endpoints
 from . import system_endpoints
 from . import file_upload_endpoints
+from . import file_import_endpoints
 
 __all__ = [
     'data_endpoints',
@@ -17,5 +18,6 @@ __all__ = [
     'portfolio_endpoints',
     'alert_endpoints',
     'system_endpoints',
-    'file_upload_endpoints'
+    'file_upload_endpoints',
+    'file_import_endpoints'
 ]
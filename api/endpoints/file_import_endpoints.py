@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+TradePulse File Import Endpoints
+FastAPI endpoints for whole-file uploads, M3 hard drive access and the uploaded-file registry
+"""
+
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form
+from api.models import M3ImportRequest
+from typing import Dict, Any, Optional
+import asyncio
+import logging
+import os
+import shutil
+from pathlib import Path
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+# Configure upload directories (created on first use)
+UPLOAD_DIR = Path("uploads")
+UPLOAD_DATA_DIR = Path("upload_data")
+
+ALLOWED_TYPES = ["csv", "json", "feather", "parquet", "duckdb", "h5", "xlsx"]
+SCAN_EXTENSIONS = {"csv": ".csv", "json": ".json", "feather": ".feather", "parquet": ".parquet",
+                   "duckdb": ".duckdb", "keras": ".h5", "excel": ".xlsx"}
+MAX_FILES_PER_TYPE = 50
+
+# file_id -> file info for every file uploaded, imported or assembled from chunks
+uploaded_files: Dict[str, Dict[str, Any]] = {}
+
+def _destination_dir(file_type: str) -> Path:
+    """Get the directory a file of this type is saved to"""
+    directory = UPLOAD_DATA_DIR if file_type == "upload" else UPLOAD_DIR / file_type
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+def register_file(prefix: str, file_path: Path, file_type: str, **info) -> str:
+    """Record a stored file in the registry and return its file id"""
+    file_id = f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{file_path.name}"
+    uploaded_files[file_id] = {
+        "filename": file_path.name,
+        "file_type": file_type,
+        "file_extension": file_path.suffix.lstrip(".").lower(),
+        "file_path": str(file_path),
+        "uploaded_at": datetime.now().isoformat(),
+        "file_size": file_path.stat().st_size,
+        **info
+    }
+    return file_id
+
+@router.post("/upload")
+async def upload_file(file: UploadFile = File(...), file_type: str = Form("data")):
+    """Upload a whole file to TradePulse (use /uploads for large, resumable uploads)"""
+    file_extension = file.filename.split(".")[-1].lower()
+    if file_extension not in ALLOWED_TYPES:
+        raise HTTPException(status_code=400,
+                            detail=f"File type {file_extension} not supported. Allowed: {ALLOWED_TYPES}")
+    try:
+        logger.info(f"📁 Uploading file: {file.filename} (type: {file_type})")
+        file_path = _destination_dir(file_type) / Path(file.filename).name
+        with open(file_path, "wb") as buffer:
+            await asyncio.to_thread(shutil.copyfileobj, file.file, buffer)
+        file_id = register_file("file", file_path, file_type)
+        logger.info(f"✅ File uploaded successfully: {file_path}")
+        return {"file_id": file_id, **uploaded_files[file_id]}
+    except Exception as e:
+        logger.error(f"❌ File upload failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
+
+def _scan(path: str) -> Dict[str, list]:
+    """Walk a directory once, collecting up to MAX_FILES_PER_TYPE data files per type"""
+    found = {}
+    types_by_extension = {extension: file_type for file_type, extension in SCAN_EXTENSIONS.items()}
+    for directory, _, filenames in os.walk(path):
+        for filename in filenames:
+            file_type = types_by_extension.get(os.path.splitext(filename)[1].lower())
+            if file_type is None or len(found.get(file_type, [])) >= MAX_FILES_PER_TYPE:
+                continue
+            file_path = os.path.join(directory, filename)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            found.setdefault(file_type, []).append({
+                "path": file_path,
+                "filename": filename,
+                "size": stat.st_size,
+                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
+            })
+    return found
+
+@router.get("/m3-drive/scan")
+async def scan_m3_drive(path: str = "/Volumes"):
+    """Scan M3 hard drive for data files"""
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail=f"Path not found: {path}")
+    try:
+        logger.info(f"🔍 Scanning M3 drive at: {path}")
+        found_files = await asyncio.to_thread(_scan, path)
+        total_files = sum(len(files) for files in found_files.values())
+        logger.info(f"✅ Found {total_files} files")
+        return {
+            "scan_path": path,
+            "found_files": found_files,
+            "total_files": total_files,
+            "scanned_at": datetime.now().isoformat()
+        }
+    except Exception as e:
+        logger.error(f"❌ M3 drive scan failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Scan failed: {str(e)}")
+
+@router.post("/m3-drive/import")
+async def import_from_m3_drive(request: M3ImportRequest):
+    """Import file from M3 hard drive to TradePulse"""
+    if not os.path.exists(request.file_path):
+        raise HTTPException(status_code=404, detail=f"File not found: {request.file_path}")
+    if not os.path.isfile(request.file_path):
+        raise HTTPException(status_code=400, detail=f"Path is not a file: {request.file_path}")
+    try:
+        logger.info(f"📥 Importing file from M3: {request.file_path}")
+        dest_path = _destination_dir(request.file_type) / os.path.basename(request.file_path)
+        await asyncio.to_thread(shutil.copy2, request.file_path, dest_path)
+        file_id = register_file("m3_import", dest_path, request.file_type,
+                                original_path=request.file_path, source="m3_drive")
+        logger.info(f"✅ File imported successfully: {dest_path}")
+        return {"file_id": file_id, "imported_path": str(dest_path), **uploaded_files[file_id]}
+    except Exception as e:
+        logger.error(f"❌ M3 import failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
+
+@router.get("/files")
+async def list_uploaded_files(file_type: Optional[str] = None):
+    """List all uploaded files"""
+    files = uploaded_files
+    if file_type:
+        files = {k: v for k, v in files.items() if v["file_type"] == file_type}
+    return {
+        "files": files,
+        "count": len(files),
+        "file_types": sorted(set(f["file_type"] for f in files.values()))
+    }
+
+@router.get("/files/{file_id}")
+async def get_file_info(file_id: str):
+    """Get information about a specific file"""
+    if file_id not in uploaded_files:
+        raise HTTPException(status_code=404, detail=f"File {file_id} not found")
+    return uploaded_files[file_id]
+
+@router.delete("/files/{file_id}")
+async def delete_file(file_id: str):
+    """Delete an uploaded file"""
+    if file_id not in uploaded_files:
+        raise HTTPException(status_code=404, detail=f"File {file_id} not found")
+    file_path = Path(uploaded_files[file_id]["file_path"])
+    try:
+        file_path.unlink(missing_ok=True)
+        logger.info(f"🗑️ Deleted file: {file_path}")
+        del uploaded_files[file_id]
+        return {"message": f"File {file_id} deleted successfully"}
+    except Exception as e:
+        logger.error(f"❌ File deletion failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Deletion failed: {str(e)}")
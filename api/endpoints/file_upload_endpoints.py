@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+TradePulse File Upload Endpoints
+FastAPI endpoints for resumable chunked uploads of very large files
+"""
+
+from fastapi import APIRouter, HTTPException, Request, Header
+from api.models import ChunkedUploadInitRequest, ChunkedUploadCompleteRequest
+from api.chunked_uploads import ChunkedUploadManager, ChunkedUploadError
+from api.endpoints.file_import_endpoints import register_file
+from typing import Optional
+import asyncio
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+# Assembled files land where the upload-data scan picks them up
+UPLOAD_DATA_DIR = Path("upload_data")
+
+chunked_uploads = ChunkedUploadManager()
+
+# Formats a completed upload is loaded from as a dataset (others are only indexed)
+DATASET_FORMATS = ('csv', 'json', 'feather', 'parquet')
+
+_data_access = None
+
+def _get_data_access():
+    """Create the data access layer (and its data manager) completed uploads are registered with"""
+    global _data_access
+    if _data_access is None:
+        from ui_components.data_manager import DataManager
+        from ui_components.data_access import DataAccessManager
+        _data_access = DataAccessManager(DataManager())
+    return _data_access
+
+def _register_upload(file_path: Path, metadata: dict) -> Optional[str]:
+    """Index a completed upload in the upload manifest and add it to the data manager as a dataset"""
+    data_access = _get_data_access()
+    data_access.file_ops.manifest.refresh(force=True)
+    format_name = file_path.suffix.lstrip('.').lower()
+    if format_name not in DATASET_FORMATS:
+        return None
+    data = data_access.file_ops.readers.get_file_reader(format_name)(str(file_path))
+    if data.empty:
+        return None
+    return data_access.core.data_manager.add_uploaded_data(file_path.stem, data, metadata)
+
+def _http_error(e: ChunkedUploadError) -> HTTPException:
+    """Map a session error to its HTTP status"""
+    return HTTPException(status_code=e.status_code, detail=str(e))
+
+@router.post("/uploads")
+async def initiate_upload(request: ChunkedUploadInitRequest):
+    """Start a chunked upload; returns the upload id, offset 0 and the suggested chunk size"""
+    return chunked_uploads.initiate(request.filename, request.total_size, request.sha256, request.file_type)
+
+@router.get("/uploads/{upload_id}")
+async def get_upload_status(upload_id: str):
+    """Get the committed offset to resume a dropped upload from"""
+    try:
+        return chunked_uploads.status(upload_id)
+    except ChunkedUploadError as e:
+        raise _http_error(e)
+
+@router.put("/uploads/{upload_id}/chunks")
+async def append_chunk(upload_id: str, offset: int, request: Request,
+                       x_chunk_sha256: Optional[str] = Header(None)):
+    """Append the raw request body at offset; X-Chunk-SHA256 is verified before it is committed"""
+    try:
+        return await chunked_uploads.append(upload_id, offset, request.stream(), x_chunk_sha256)
+    except ChunkedUploadError as e:
+        raise _http_error(e)
+
+@router.post("/uploads/{upload_id}/complete")
+async def complete_upload(upload_id: str, request: Optional[ChunkedUploadCompleteRequest] = None):
+    """Verify and assemble an upload, stream CSVs into Parquet, and register the result as a dataset"""
+    request = request or ChunkedUploadCompleteRequest()
+    try:
+        result = await chunked_uploads.complete(upload_id, str(UPLOAD_DATA_DIR))
+    except ChunkedUploadError as e:
+        raise _http_error(e)
+
+    file_path = Path(result['file_path'])
+    if request.ingest and file_path.suffix.lower() == '.csv':
+        try:
+            from modular_panels.data_upload.streaming_ingest import StreamingCSVIngest
+            ingest = await asyncio.to_thread(StreamingCSVIngest().ingest, str(file_path),
+                                             str(file_path.with_suffix('.parquet')), 'parquet')
+            if not request.keep_source:
+                file_path.unlink(missing_ok=True)
+            result['ingest'] = ingest
+            result['file_path'] = ingest['output_path']
+        except Exception as e:
+            logger.error(f"❌ Ingest failed for {file_path}: {e}")
+            raise HTTPException(status_code=500, detail=f"Upload assembled but ingest failed: {str(e)}")
+
+    file_path = Path(result['file_path'])
+    result['file_id'] = register_file('chunked', file_path, result['file_type'], upload_id=upload_id)
+    try:
+        metadata = {'filename': result['filename'], 'file_path': str(file_path), 'upload_id': upload_id}
+        result['dataset_id'] = await asyncio.to_thread(_register_upload, file_path, metadata)
+    except Exception as e:
+        logger.error(f"❌ Could not register {file_path} as a dataset: {e}")
+        raise HTTPException(status_code=500, detail=f"Upload assembled but not registered: {str(e)}")
+    return result
+
+@router.delete("/uploads/{upload_id}")
+async def abort_upload(upload_id: str):
+    """Discard an unfinished upload"""
+    try:
+        await chunked_uploads.abort(upload_id)
+        return {"message": f"Upload {upload_id} aborted"}
+    except ChunkedUploadError as e:
+        raise _http_error(e)
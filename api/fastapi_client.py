@@ -78,6 +78,21 @@ class TradePulseAPIClient:
     
     async def delete_alert(self, alert_id: str) -> Dict:
         return await self.core.delete_alert(alert_id)
+    
+    async def scan_m3_drive(self, path: str = "/Volumes") -> Dict:
+        return await self.core.scan_m3_drive(path)
+    
+    async def import_from_m3_drive(self, file_path: str, file_type: str = "upload") -> Dict:
+        return await self.core.import_from_m3_drive(file_path, file_type)
+    
+    async def list_uploaded_files(self, file_type: Optional[str] = None) -> Dict:
+        return await self.core.list_uploaded_files(file_type)
+    
+    async def get_file_info(self, file_id: str) -> Dict:
+        return await self.core.get_file_info(file_id)
+    
+    async def delete_file(self, file_id: str) -> Dict:
+        return await self.core.delete_file(file_id)
 
 # Example usage
 async def example_usage():
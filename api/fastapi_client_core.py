@@ -7,6 +7,7 @@ Core FastAPI client functionality
 import aiohttp
 import asyncio
 import logging
+from urllib.parse import quote, urlencode
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
@@ -158,6 +159,32 @@ class TradePulseAPIClient:
     async def delete_alert(self, alert_id: str) -> Dict:
         """Delete an alert"""
         return await self._make_request("DELETE", f"/api/v1/alerts/{alert_id}")
+    
+    # File endpoints
+    async def scan_m3_drive(self, path: str = "/Volumes") -> Dict:
+        """Scan M3 hard drive for data files"""
+        return await self._make_request("GET", f"/api/v1/files/m3-drive/scan?{urlencode({'path': path})}")
+    
+    async def import_from_m3_drive(self, file_path: str, file_type: str = "upload") -> Dict:
+        """Import file from M3 hard drive"""
+        data = {
+            "file_path": file_path,
+            "file_type": file_type
+        }
+        return await self._make_request("POST", "/api/v1/files/m3-drive/import", data)
+    
+    async def list_uploaded_files(self, file_type: Optional[str] = None) -> Dict:
+        """List uploaded files"""
+        query = f"?{urlencode({'file_type': file_type})}" if file_type else ""
+        return await self._make_request("GET", f"/api/v1/files/files{query}")
+    
+    async def get_file_info(self, file_id: str) -> Dict:
+        """Get file information"""
+        return await self._make_request("GET", f"/api/v1/files/files/{quote(file_id)}")
+    
+    async def delete_file(self, file_id: str) -> Dict:
+        """Delete uploaded file"""
+        return await self._make_request("DELETE", f"/api/v1/files/files/{quote(file_id)}")
 
 # Global instance
 fastapi_client_core = TradePulseAPIClient()
@@ -14,7 +14,7 @@ import logging
 from datetime import datetime
 
 # Import modular endpoints
-from api.endpoints import data_endpoints, model_endpoints, portfolio_endpoints, alert_endpoints, system_endpoints, file_upload_endpoints
+from api.endpoints import data_endpoints, model_endpoints, portfolio_endpoints, alert_endpoints, system_endpoints, file_upload_endpoints, file_import_endpoints
 from api.models import DataRequest, ModelPredictionRequest, PortfolioRequest, AlertRequest
 
 # Configure logging
@@ -75,7 +75,8 @@ async def root():
             "models": "/api/v1/models",
             "portfolio": "/api/v1/portfolio",
             "alerts": "/api/v1/alerts",
-            "system": "/api/v1/system"
+            "system": "/api/v1/system",
+            "files": "/api/v1/files"
         }
     }
 
@@ -95,6 +96,7 @@ app.include_router(portfolio_endpoints.router, prefix="/api/v1/portfolio", tags=
 app.include_router(alert_endpoints.router, prefix="/api/v1/alerts", tags=["alerts"])
 app.include_router(system_endpoints.router, prefix="/api/v1/system", tags=["system"])
 app.include_router(file_upload_endpoints.router, prefix="/api/v1/files", tags=["files"])
+app.include_router(file_import_endpoints.router, prefix="/api/v1/files", tags=["files"])
 
 # Error handlers
 @app.exception_handler(Exception)
@@ -76,3 +76,20 @@ class SystemMetricsResponse(BaseModel):
     memory_usage: str
     cpu_usage: str
     disk_usage: str
+
+class ChunkedUploadInitRequest(BaseModel):
+    """Request model for starting a resumable chunked upload"""
+    filename: str = Field(..., description="Original file name")
+    total_size: int = Field(..., ge=0, description="Total file size in bytes")
+    sha256: Optional[str] = Field(None, description="SHA-256 of the whole file, verified on completion")
+    file_type: str = Field(default="upload", description="Upload category")
+
+class ChunkedUploadCompleteRequest(BaseModel):
+    """Request model for finishing a chunked upload"""
+    ingest: bool = Field(default=True, description="Stream CSV uploads into Parquet after assembly")
+    keep_source: bool = Field(default=False, description="Keep the assembled CSV after ingest")
+
+class M3ImportRequest(BaseModel):
+    """Request model for importing a file from the M3 hard drive"""
+    file_path: str = Field(..., description="Path of the file on the drive")
+    file_type: str = Field(default="upload", description="Upload category (upload goes to upload_data/)")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+TradePulse Integrated Panels - Chart Updater
+Streams bars for the selected symbol and timeframe into the live chart
+"""
+
+import os
+from typing import Any, Optional
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+class ChartUpdater:
+    """Streams bars for the selected symbol and timeframe into the live chart"""
+    
+    DATA_SOURCE = os.getenv('TRADEPULSE_LIVE_CHART_SOURCE', 'mock')
+    # Live charts are opt-in; without them the chart area keeps its placeholder
+    ENABLED = os.getenv('TRADEPULSE_LIVE_CHARTS', 'false').lower() == 'true'
+    
+    def __init__(self, update_manager):
+        self.update_manager = update_manager
+        self.ui_components = update_manager.ui_components
+    
+    def update_chart(self):
+        """Update the live chart; the full chart is only sent when the symbol or timeframe changes"""
+        if not self.ENABLED:
+            return
+        try:
+            symbol = self._selected('symbol_selector', 'current_symbol')
+            timeframe = self._selected('timeframe_selector', 'current_timeframe')
+            if not symbol:
+                return
+            
+            bars = self._load_bars(symbol, timeframe)
+            if bars is None or bars.empty:
+                logger.warning(f"⚠️ No bars for {symbol} ({timeframe})")
+                return
+            
+            live_chart = self._get_live_chart()
+            result = live_chart.update(symbol, bars, timeframe)
+            logger.debug(f"📈 Chart {result} for {symbol} ({timeframe})")
+            
+        except Exception as e:
+            logger.error(f"Failed to update chart: {e}")
+    
+    def _selected(self, selector: str, state_key: str) -> Optional[str]:
+        """Get a selector value, falling back to the tracked component state"""
+        widget = self.ui_components.get(selector)
+        value = getattr(widget, 'value', None)
+        return value or self.update_manager.component_states.get(state_key)
+    
+    def _load_bars(self, symbol: str, timeframe: Optional[str]) -> pd.DataFrame:
+        """Get bars from the shared bar pyramid (cached between refreshes)"""
+        data_access = getattr(self.update_manager, 'data_access', None)
+        if data_access is None:
+            from ui_components.data_access import DataAccessManager
+            data_access = self.update_manager.data_access = DataAccessManager(None)
+        return data_access.get_bars(self.DATA_SOURCE, symbol, timeframe)
+    
+    def _get_live_chart(self) -> Any:
+        """Get the update manager's live chart, placing it in the chart area on first use"""
+        if self.update_manager.live_chart is None:
+            from ui_components.live_chart import LiveCandlestickChart
+            
+            self.update_manager.live_chart = LiveCandlestickChart()
+            chart_area = self.ui_components.get('chart_area')
+            if chart_area is not None and hasattr(chart_area, 'objects'):
+                chart_area.objects = [self.update_manager.live_chart.get_layout()]
+        return self.update_manager.live_chart
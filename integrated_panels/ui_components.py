@@ -122,10 +122,13 @@ class UIComponents:
         try:
             charts = {}
             
-            # Placeholder for chart components
-            charts['chart_area'] = pn.pane.Markdown(
-                '**Chart Area** - Charts will be displayed here',
-                style={'font-size': '16px', 'text-align': 'center'}
+            # Placeholder until the first live chart update replaces it
+            charts['chart_area'] = pn.Column(
+                pn.pane.Markdown(
+                    '**Chart Area** - Charts will be displayed here',
+                    style={'font-size': '16px', 'text-align': 'center'}
+                ),
+                sizing_mode='stretch_width'
             )
             
             return charts
@@ -20,6 +20,7 @@ class UpdateManager:
         self.is_running = False
         self.update_callbacks = {}
         self.component_states = {}
+        self.live_chart = None  # created by ChartUpdater on the first chart update
         
         # Setup update system
         self.setup_update_system()
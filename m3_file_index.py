@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+TradePulse M3 File Index
+Incrementally refreshed os.scandir index of data files with per-subtree aggregates
+"""
+
+import os
+import logging
+import threading
+from typing import Dict, List, Optional, Any, Iterator
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+class M3FileIndex:
+    """In-memory index of supported data files under a set of root directories
+
+    Each directory node keeps its own mtime, its data files (name → size, mtime), its
+    subdirectories and an aggregate of everything below it. A refresh re-lists only directories
+    whose mtime changed (an entry was added, removed or renamed), re-stats the known files of the
+    others (in-place rewrites) and recomputes aggregates bottom-up, so browse, search and status
+    are answered from memory.
+    """
+
+    REFRESH_INTERVAL = float(os.getenv('TRADEPULSE_M3_INDEX_INTERVAL', '60'))
+
+    def __init__(self, supported_extensions: List[str], refresh_interval: Optional[float] = None):
+        self.supported_extensions = tuple(ext.lower() for ext in supported_extensions)
+        self.refresh_interval = refresh_interval or self.REFRESH_INTERVAL
+        self._nodes = {}     # directory path -> node (replaced, never modified in place)
+        self._roots = set()
+        self._lock = threading.RLock()           # guards _nodes and _roots; never held while scanning
+        self._refresh_lock = threading.RLock()   # one tree walk at a time
+        self._thread = None
+        self._stop = threading.Event()
+        self._ready = threading.Event()          # set once the background build indexed every root
+        self.stats = {'refreshes': 0, 'directories_listed': 0, 'directories_reused': 0}
+
+    def add_root(self, directory: str):
+        """Index a directory tree (synchronously the first time)"""
+        directory = os.path.abspath(directory)
+        with self._refresh_lock:
+            if directory not in self._nodes:
+                self._refresh_node(directory)
+            with self._lock:
+                self._roots.add(directory)
+
+    def refresh(self):
+        """Bring every indexed tree up to date"""
+        with self._refresh_lock:
+            with self._lock:
+                roots = list(self._roots)
+            for root in roots:
+                self._refresh_node(root)
+            self.stats['refreshes'] += 1
+
+    def _refresh_node(self, directory: str) -> Optional[Dict[str, Any]]:
+        """Refresh one directory node and its subtree, returning the node (None if gone)"""
+        try:
+            mtime = os.stat(directory).st_mtime
+        except OSError:
+            self._drop(directory)
+            return None
+
+        node = self._nodes.get(directory)
+        if node is None or node['mtime'] != mtime:
+            listed = self._list(directory, mtime)
+            for name in set(node['subdirs'] if node else ()) - set(listed['subdirs']):
+                self._drop(os.path.join(directory, name))
+            node = listed
+            self.stats['directories_listed'] += 1
+        else:
+            # Files rewritten in place do not change the directory mtime
+            node = {**node, 'files': self._restat(directory, node['files'])}
+            self.stats['directories_reused'] += 1
+
+        subdirs, children = [], []
+        for name in node['subdirs']:
+            child = self._refresh_node(os.path.join(directory, name))
+            if child is not None:
+                subdirs.append(name)
+                children.append(child)
+        node = {**node, 'subdirs': subdirs, **self._aggregate(node['files'], children)}
+        with self._lock:
+            self._nodes[directory] = node
+        return node
+
+    @staticmethod
+    def _aggregate(files: Dict[str, tuple], children: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Get file count, size and extension counts for a node's files plus its child aggregates"""
+        file_count, size, extensions = len(files), 0, {}
+        for name, (file_size, _) in files.items():
+            size += file_size
+            ext = Path(name).suffix.lower()
+            extensions[ext] = extensions.get(ext, 0) + 1
+        for child in children:
+            file_count += child['file_count']
+            size += child['size']
+            for ext, count in child['extensions'].items():
+                extensions[ext] = extensions.get(ext, 0) + count
+        return {'file_count': file_count, 'size': size, 'extensions': extensions}
+
+    def _restat(self, directory: str, files: Dict[str, tuple]) -> Dict[str, tuple]:
+        """Re-read size and mtime of known files (a directory whose listing is unchanged)"""
+        fresh = {}
+        for name in files:
+            try:
+                stat = os.stat(os.path.join(directory, name))
+            except OSError:
+                continue
+            fresh[name] = (stat.st_size, stat.st_mtime)
+        return fresh
+
+    def _update_ancestors(self, directory: str):
+        """Recompute parent aggregates after a subtree was refreshed on its own"""
+        while directory not in self._roots:
+            parent = os.path.dirname(directory)
+            node = self._nodes.get(parent)
+            if parent == directory or node is None:
+                return
+            children = [self._nodes[p] for p in (os.path.join(parent, n) for n in node['subdirs']) if p in self._nodes]
+            with self._lock:
+                self._nodes[parent] = {**node, **self._aggregate(node['files'], children)}
+            directory = parent
+
+    def _list(self, directory: str, mtime: float) -> Dict[str, Any]:
+        """Scan one directory with os.scandir (stat results come from the directory listing)"""
+        files, subdirs = {}, []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        elif entry.name.lower().endswith(self.supported_extensions) and entry.is_file():
+                            stat = entry.stat()
+                            files[entry.name] = (stat.st_size, stat.st_mtime)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.debug(f"Cannot list {directory}: {e}")
+        return {'mtime': mtime, 'files': files, 'subdirs': subdirs}
+
+    def _drop(self, directory: str):
+        """Forget a directory and everything below it"""
+        prefix = directory.rstrip(os.sep) + os.sep
+        with self._lock:
+            for path in [p for p in self._nodes if p == directory or p.startswith(prefix)]:
+                del self._nodes[path]
+
+    def _indexed(self, directory: str) -> bool:
+        """Check whether a directory lies under an indexed root"""
+        with self._lock:
+            return any(directory == root or directory.startswith(root.rstrip(os.sep) + os.sep) for root in self._roots)
+
+    def get_node(self, directory: str) -> Optional[Dict[str, Any]]:
+        """Get an up-to-date node; directories outside the roots are walked once, not indexed"""
+        directory = os.path.abspath(directory)
+        try:
+            mtime = os.stat(directory).st_mtime
+        except OSError:
+            return None
+        if not self._indexed(directory):
+            listed = self._list(directory, mtime)
+            children = [self._summarize(os.path.join(directory, name)) for name in listed['subdirs']]
+            return {**listed, **self._aggregate(listed['files'], children)}
+        node = self._nodes.get(directory)
+        if node is None or node['mtime'] != mtime:
+            with self._refresh_lock:
+                node = self._refresh_node(directory)
+                if node is not None:
+                    self._update_ancestors(directory)
+        return node
+
+    def iter_files(self, directory: str) -> Iterator[Dict[str, Any]]:
+        """Yield every file below a directory (from the index, or a one-off walk outside the roots)"""
+        directory = os.path.abspath(directory)
+        if not self._indexed(directory):
+            yield from self._walk(directory)
+            return
+        if self.get_node(directory) is None:
+            return
+        prefix = directory.rstrip(os.sep) + os.sep
+        with self._lock:
+            nodes = [(path, node) for path, node in self._nodes.items()
+                     if path == directory or path.startswith(prefix)]
+        for path, node in nodes:
+            for name, (size, mtime) in node['files'].items():
+                yield {'name': name, 'path': os.path.join(path, name), 'size': size, 'mtime': mtime}
+
+    def _walk(self, directory: str) -> Iterator[Dict[str, Any]]:
+        """List a tree without indexing it"""
+        pending = [directory]
+        while pending:
+            path = pending.pop()
+            listed = self._list(path, 0.0)
+            pending.extend(os.path.join(path, name) for name in listed['subdirs'])
+            for name, (size, mtime) in listed['files'].items():
+                yield {'name': name, 'path': os.path.join(path, name), 'size': size, 'mtime': mtime}
+
+    def _summarize(self, directory: str) -> Dict[str, Any]:
+        """Get the subtree aggregate of a directory outside the roots"""
+        files = {f['path']: (f['size'], f['mtime']) for f in self._walk(directory)}
+        return self._aggregate(files, [])
+
+    def search(self, directory: str, pattern: str, extensions: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Find indexed files whose name contains pattern (case-insensitive), optionally by extension"""
+        pattern = pattern.lower()
+        wanted = tuple(ext.lower() for ext in extensions) if extensions else None
+        return [f for f in self.iter_files(directory)
+                if pattern in f['name'].lower() and (wanted is None or f['name'].lower().endswith(wanted))]
+
+    def start(self, roots: Optional[List[str]] = None):
+        """Index roots and keep the index fresh from a background thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(roots or [],), name='m3-file-index', daemon=True)
+        self._thread.start()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the background build of the roots; returns False if it is still running"""
+        return self._ready.wait(timeout)
+
+    def stop(self):
+        """Stop the background refresh"""
+        self._stop.set()
+
+    def _run(self, roots: List[str]):
+        """Background initial build and refresh loop"""
+        try:
+            for root in roots:
+                if os.path.isdir(root):
+                    self.add_root(root)
+        finally:
+            self._ready.set()
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"⚠️ M3 file index refresh failed: {e}")
@@ -10,11 +10,16 @@ from typing import Dict, List, Optional, Any
 from pathlib import Path
 from datetime import datetime
 
+from m3_file_index import M3FileIndex
+
 logger = logging.getLogger(__name__)
 
 class M3FileManager:
     """Manages M3 hard drive file access and operations"""
     
+    # Seconds get_m3_status waits for the first index build before reporting it as running
+    STATUS_WAIT = float(os.getenv('TRADEPULSE_M3_STATUS_WAIT', '5'))
+    
     def __init__(self):
         self.supported_extensions = ['.csv', '.json', '.feather', '.parquet', '.duckdb', '.h5', '.hdf5']
         self.scan_directories = [
@@ -24,8 +29,17 @@ class M3FileManager:
             "/Users/moose/Desktop"
         ]
         
+        # Browse, search and status are served from this index, built and refreshed in the
+        # background from the first call (not at import)
+        self.file_index = M3FileIndex(self.supported_extensions)
+        
         logger.info("📁 M3 File Manager initialized")
     
+    def _index(self) -> M3FileIndex:
+        """Get the file index, starting its background build on first use"""
+        self.file_index.start(self.scan_directories)
+        return self.file_index
+    
     def get_m3_status(self) -> Dict[str, Any]:
         """Get M3 drive status and statistics"""
         try:
@@ -34,25 +48,24 @@ class M3FileManager:
             total_size = 0
             file_types_found = {}
             
+            if not self._index().wait_ready(self.STATUS_WAIT):
+                return {
+                    'accessible_paths': [d for d in self.scan_directories if os.path.exists(d)],
+                    'total_files_found': 0,
+                    'total_size': 0,
+                    'file_types_found': {},
+                    'scan_time': datetime.now().isoformat(),
+                    'indexing': True
+                }
+            
             for directory in self.scan_directories:
-                if os.path.exists(directory):
+                node = self.file_index.get_node(directory) if os.path.exists(directory) else None
+                if node is not None:
                     accessible_paths.append(directory)
-                    
-                    # Count files in directory
-                    for root, dirs, files in os.walk(directory):
-                        for file in files:
-                            if any(file.endswith(ext) for ext in self.supported_extensions):
-                                total_files_found += 1
-                                file_path = os.path.join(root, file)
-                                try:
-                                    file_size = os.path.getsize(file_path)
-                                    total_size += file_size
-                                    
-                                    # Count file types
-                                    ext = Path(file).suffix.lower()
-                                    file_types_found[ext] = file_types_found.get(ext, 0) + 1
-                                except:
-                                    pass
+                    total_files_found += node['file_count']
+                    total_size += node['size']
+                    for ext, count in node['extensions'].items():
+                        file_types_found[ext] = file_types_found.get(ext, 0) + count
             
             return {
                 'accessible_paths': accessible_paths,
@@ -81,57 +94,45 @@ class M3FileManager:
                     'error': f'Directory does not exist: {directory_path}'
                 }
             
+            node = self._index().get_node(directory_path)
+            if node is None:
+                return {
+                    'error': f'Directory is not readable: {directory_path}'
+                }
+            
             files = []
             subdirectories = []
-            total_files = 0
-            total_subdirs = 0
-            total_size = 0
             file_types_found = set()
             
-            for item in os.listdir(directory_path):
-                item_path = os.path.join(directory_path, item)
-                
-                if os.path.isdir(item_path):
-                    # Count files in subdirectory
-                    subdir_files = 0
-                    subdir_size = 0
-                    for root, dirs, files_list in os.walk(item_path):
-                        for file in files_list:
-                            if any(file.endswith(ext) for ext in self.supported_extensions):
-                                subdir_files += 1
-                                try:
-                                    subdir_size += os.path.getsize(os.path.join(root, file))
-                                except:
-                                    pass
-                    
-                    subdirectories.append({
-                        'name': item,
-                        'path': item_path,
-                        'file_count': subdir_files,
-                        'size': subdir_size,
-                        'last_modified': datetime.fromtimestamp(os.path.getmtime(item_path)).isoformat()
-                    })
-                    total_subdirs += 1
-                    
-                elif os.path.isfile(item_path):
-                    if any(item.endswith(ext) for ext in self.supported_extensions):
-                        try:
-                            file_size = os.path.getsize(item_path)
-                            total_size += file_size
-                            
-                            files.append({
-                                'name': item,
-                                'path': item_path,
-                                'size': file_size,
-                                'extension': Path(item).suffix.lower(),
-                                'last_modified': datetime.fromtimestamp(os.path.getmtime(item_path)).isoformat(),
-                                'readable': os.access(item_path, os.R_OK)
-                            })
-                            
-                            file_types_found.add(Path(item).suffix.lower())
-                            total_files += 1
-                        except Exception as e:
-                            logger.warning(f"⚠️ Error processing file {item_path}: {e}")
+            # Subdirectory counts and sizes come from the index's per-subtree aggregates
+            for name in sorted(node['subdirs']):
+                item_path = os.path.join(directory_path, name)
+                child = self.file_index.get_node(item_path)
+                if child is None:
+                    continue
+                subdirectories.append({
+                    'name': name,
+                    'path': item_path,
+                    'file_count': child['file_count'],
+                    'size': child['size'],
+                    'last_modified': datetime.fromtimestamp(child['mtime']).isoformat()
+                })
+            
+            for name, (file_size, mtime) in sorted(node['files'].items()):
+                item_path = os.path.join(directory_path, name)
+                files.append({
+                    'name': name,
+                    'path': item_path,
+                    'size': file_size,
+                    'extension': Path(name).suffix.lower(),
+                    'last_modified': datetime.fromtimestamp(mtime).isoformat(),
+                    'readable': os.access(item_path, os.R_OK)
+                })
+                file_types_found.add(Path(name).suffix.lower())
+            
+            total_files = len(files)
+            total_subdirs = len(subdirectories)
+            total_size = sum(f['size'] for f in files)
             
             return {
                 'directory': directory_path,
@@ -155,22 +156,15 @@ class M3FileManager:
         try:
             results = []
             
-            for root, dirs, files in os.walk(search_path):
-                for file in files:
-                    if pattern.lower() in file.lower():
-                        if file_types is None or any(file.endswith(ext) for ext in self.supported_extensions):
-                            file_path = os.path.join(root, file)
-                            try:
-                                results.append({
-                                    'name': file,
-                                    'path': file_path,
-                                    'size': os.path.getsize(file_path),
-                                    'extension': Path(file).suffix.lower(),
-                                    'last_modified': datetime.fromtimestamp(os.path.getmtime(file_path)).isoformat(),
-                                    'readable': os.access(file_path, os.R_OK)
-                                })
-                            except Exception as e:
-                                logger.warning(f"⚠️ Error processing file {file_path}: {e}")
+            for match in self._index().search(search_path, pattern, file_types):
+                results.append({
+                    'name': match['name'],
+                    'path': match['path'],
+                    'size': match['size'],
+                    'extension': Path(match['name']).suffix.lower(),
+                    'last_modified': datetime.fromtimestamp(match['mtime']).isoformat(),
+                    'readable': os.access(match['path'], os.R_OK)
+                })
             
             return results
             
@@ -187,24 +181,18 @@ class M3FileManager:
                     'error': 'File does not exist'
                 }
             
-            # Create upload directory
-            upload_dir = "uploads"
-            os.makedirs(upload_dir, exist_ok=True)
-            
-            # Generate destination filename
-            filename = Path(file_path).name
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            destination = os.path.join(upload_dir, f"{timestamp}_{filename}")
-            
-            # Copy file
-            import shutil
-            shutil.copy2(file_path, destination)
+            # Store content-addressed: identical files are copied (and hashed) only once
+            from ui_components.upload_content_store import get_upload_content_store
+            stored = get_upload_content_store("uploads").store_file(file_path)
             
             return {
                 'success': True,
-                'filename': f"{timestamp}_{filename}",
-                'destination': destination,
-                'size': os.path.getsize(destination)
+                'filename': Path(stored['path']).name,
+                'destination': stored['path'],
+                'size': stored['size'],
+                'digest': stored['digest'],
+                'duplicate': stored['duplicate'],
+                'dataset_id': stored.get('dataset_id')
             }
             
         except Exception as e:
@@ -7,18 +7,42 @@ Handles chart data processing and filtering
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict
+from typing import Dict, Optional, Tuple
+
+from ui_components.time_index import TimeIndex
+from .chart_downsampler import ChartDownsampler
 
 logger = logging.getLogger(__name__)
 
 class ChartDataProcessor:
     """Handles chart data processing and filtering"""
     
-    def __init__(self):
-        pass
+    # Look-back windows for the time range selector ('All' has no cutoff)
+    TIME_RANGES = {
+        '1D': pd.Timedelta(days=1),
+        '1W': pd.Timedelta(weeks=1),
+        '1M': pd.Timedelta(days=30),
+        '3M': pd.Timedelta(days=90),
+        '6M': pd.Timedelta(days=180),
+        '1Y': pd.Timedelta(days=365)
+    }
+    
+    # Chart types whose x axis is the Date column; zooming these slices a time range
+    TIME_AXIS_CHARTS = ('Candlestick', 'Line')
+    # Chart types re-sampled on zoom (Bar x values are categories or row labels, and bars
+    # are never downsampled, so Plotly zooms them client side)
+    WINDOWED_CHARTS = TIME_AXIS_CHARTS + ('Scatter',)
     
-    def generate_chart_data(self, chart_type: str, active_datasets: Dict, time_range: str) -> Dict:
-        """Generate chart data from uploaded datasets"""
+    def __init__(self, max_points: Optional[int] = None):
+        self.downsampler = ChartDownsampler(max_points)
+    
+    def generate_chart_data(self, chart_type: str, active_datasets: Dict, time_range: str,
+                            max_points: Optional[int] = None, x_range: Optional[Tuple] = None) -> Dict:
+        """Generate chart data from uploaded datasets
+        
+        Each series is downsampled to about max_points points. Pass the visible x_range
+        (start, end) after a zoom to re-sample that window at higher resolution.
+        """
         chart_data = {}
         
         for dataset_id, data in active_datasets.items():
@@ -26,49 +50,64 @@ class ChartDataProcessor:
             
             # Filter data based on time range
             filtered_data = self.filter_data_by_time(data, time_range)
+            if x_range is not None and chart_type in self.TIME_AXIS_CHARTS:
+                filtered_data = self.filter_data_by_window(filtered_data, *x_range)
             
             # Process data based on chart type
             if chart_type == 'Candlestick':
-                chart_data[dataset_id] = self.process_candlestick_data(filtered_data)
+                processed_data = self.process_candlestick_data(filtered_data)
             elif chart_type == 'Line':
-                chart_data[dataset_id] = self.process_line_data(filtered_data)
+                processed_data = self.process_line_data(filtered_data)
             elif chart_type == 'Bar':
-                chart_data[dataset_id] = self.process_bar_data(filtered_data)
+                processed_data = self.process_bar_data(filtered_data)
             elif chart_type == 'Scatter':
-                chart_data[dataset_id] = self.process_scatter_data(filtered_data)
+                processed_data = self.process_scatter_data(filtered_data)
             else:
-                chart_data[dataset_id] = filtered_data
+                processed_data = filtered_data
+            
+            # Scatter x values are the first plotted column, not dates
+            if x_range is not None and chart_type == 'Scatter' and processed_data.shape[1] >= 2:
+                processed_data = self.filter_data_by_window(processed_data, *x_range,
+                                                            column=processed_data.columns[0])
+            
+            # Only the points that fit on screen are sent to the browser
+            chart_data[dataset_id] = self.downsampler.downsample(chart_type, processed_data, max_points)
         
         return chart_data
     
+    def process_data_for_chart(self, chart_type: str, active_datasets: Dict, time_range: str,
+                               max_points: Optional[int] = None, x_range: Optional[Tuple] = None) -> Dict:
+        """Process active datasets for a chart (used by the charts panel callbacks)"""
+        return self.generate_chart_data(chart_type, active_datasets, time_range, max_points, x_range)
+    
+    def filter_data_by_window(self, data: pd.DataFrame, start, end, column: str = 'Date') -> pd.DataFrame:
+        """Keep the rows whose plotted x value lies inside a zoomed window
+        
+        'Date' is sliced as a time range; any other column is compared by value. Frames
+        without the column are matched on their index, which is what Plotly plots for them.
+        """
+        try:
+            if column == 'Date' and 'Date' in data.columns:
+                return TimeIndex.slice(data, start, end, column='Date')
+            x = data[column] if column in data.columns else data.index.to_series()
+            x = pd.to_numeric(x, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            mask = ~np.isnan(x)
+            if start is not None:
+                mask &= x >= float(start)
+            if end is not None:
+                mask &= x <= float(end)
+            return data[mask]
+        except Exception as e:
+            logger.error(f"Failed to filter data by window: {e}")
+            return data
+    
     def filter_data_by_time(self, data: pd.DataFrame, time_range: str) -> pd.DataFrame:
-        """Filter data based on selected time range"""
+        """Filter data based on selected time range (the caller's frame is never modified)"""
         try:
-            if 'Date' in data.columns:
-                # Convert to datetime if needed
-                if not pd.api.types.is_datetime64_any_dtype(data['Date']):
-                    data['Date'] = pd.to_datetime(data['Date'])
-                
-                # Apply time filtering
-                if time_range == '1D':
-                    cutoff = pd.Timestamp.now() - pd.Timedelta(days=1)
-                elif time_range == '1W':
-                    cutoff = pd.Timestamp.now() - pd.Timedelta(weeks=1)
-                elif time_range == '1M':
-                    cutoff = pd.Timestamp.now() - pd.Timedelta(days=30)
-                elif time_range == '3M':
-                    cutoff = pd.Timestamp.now() - pd.Timedelta(days=90)
-                elif time_range == '6M':
-                    cutoff = pd.Timestamp.now() - pd.Timedelta(days=180)
-                elif time_range == '1Y':
-                    cutoff = pd.Timestamp.now() - pd.Timedelta(days=365)
-                else:  # All
-                    return data
-                
-                filtered_data = data[data['Date'] >= cutoff]
-                return filtered_data
-            else:
+            if 'Date' not in data.columns or time_range not in self.TIME_RANGES:
                 return data
+            cutoff = pd.Timestamp.now() - self.TIME_RANGES[time_range]
+            return TimeIndex.slice(data, start=cutoff, column='Date')
         except Exception as e:
             logger.error(f"Failed to filter data by time: {e}")
             return data
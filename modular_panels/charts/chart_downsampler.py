@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+TradePulse Charts - Chart Downsampler
+Reduces chart series to a target number of on-screen points before they are rendered
+"""
+
+import pandas as pd
+import numpy as np
+import logging
+import os
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+class ChartDownsampler:
+    """Downsample chart data to roughly max_points points
+
+    - line and scatter series use Largest-Triangle-Three-Buckets (LTTB), which keeps the
+      points that carry the visual shape (peaks, troughs, gaps)
+    - candlesticks are merged into equal-count buckets that keep each bucket's first open,
+      highest high, lowest low, last close and total volume
+    Callers pass the visible window when the user zooms in, so the same point budget is
+    spent on fewer rows and the chart gets more detail.
+    """
+
+    MAX_POINTS = int(os.getenv('TRADEPULSE_CHART_MAX_POINTS', '2000'))
+
+    def __init__(self, max_points: Optional[int] = None):
+        self.max_points = max_points or self.MAX_POINTS
+
+    @staticmethod
+    def _as_float(values: pd.Series) -> np.ndarray:
+        """Get a series as float64 (datetimes as epoch nanoseconds)"""
+        if not pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_datetime64_any_dtype(values):
+            parsed = pd.to_datetime(values, errors='coerce')
+            values = parsed if parsed.notna().any() else values
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return values.to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(np.float64)
+        return pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def lttb_indices(self, x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+        """Get the row positions LTTB keeps for n_out points (x must be sorted)"""
+        n = len(x)
+        if n_out >= n or n_out < 3:
+            return np.arange(n)
+        y = np.nan_to_num(y, nan=np.nanmean(y) if np.isfinite(y).any() else 0.0)
+
+        # Bucket edges for the n - 2 interior rows; first and last rows are always kept
+        edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+        keep = np.empty(n_out, dtype=np.int64)
+        keep[0], keep[-1] = 0, n - 1
+        a = 0
+        for i in range(n_out - 2):
+            start, stop = edges[i], edges[i + 1]
+            # Average of the next bucket is the third triangle vertex
+            next_stop = edges[i + 2] if i + 2 < len(edges) else n
+            avg_x = x[stop:next_stop].mean()
+            avg_y = y[stop:next_stop].mean()
+            # Pick the point in this bucket with the largest triangle area
+            area = np.abs((x[a] - avg_x) * (y[start:stop] - y[a]) - (x[a] - x[start:stop]) * (avg_y - y[a]))
+            a = start + int(np.argmax(area))
+            keep[i + 1] = a
+        return keep
+
+    def downsample_line(self, data: pd.DataFrame, x_col: str, y_cols: List[str],
+                        max_points: Optional[int] = None) -> pd.DataFrame:
+        """LTTB-downsample line series sharing an x column (union of the points each series keeps)"""
+        max_points = max_points or self.max_points
+        if len(data) <= max_points or not y_cols:
+            return data
+        x = self._as_float(data[x_col])
+        per_series = max(max_points // len(y_cols), 3)
+        keep = np.unique(np.concatenate([
+            self.lttb_indices(x, self._as_float(data[col]), per_series) for col in y_cols
+        ]))
+        return data.iloc[keep]
+
+    def downsample_scatter(self, data: pd.DataFrame, x_col: str, y_col: str,
+                           max_points: Optional[int] = None) -> pd.DataFrame:
+        """LTTB-downsample a scatter series after ordering it by x"""
+        max_points = max_points or self.max_points
+        if len(data) <= max_points:
+            return data
+        ordered = data.iloc[np.argsort(self._as_float(data[x_col]), kind='stable')]
+        keep = self.lttb_indices(self._as_float(ordered[x_col]), self._as_float(ordered[y_col]), max_points)
+        return ordered.iloc[keep]
+
+    def downsample_ohlc(self, data: pd.DataFrame, max_points: Optional[int] = None) -> pd.DataFrame:
+        """Merge time-ordered candles into at most max_points OHLC-preserving buckets"""
+        max_points = max_points or self.max_points
+        if len(data) <= max_points:
+            return data
+        starts = np.unique(np.linspace(0, len(data), max_points, endpoint=False).astype(np.int64))
+        ends = np.r_[starts[1:], len(data)] - 1
+        result = {'Date': data['Date'].to_numpy()[starts]} if 'Date' in data.columns else {}
+        result.update({
+            'Open': data['Open'].to_numpy()[starts],
+            'High': np.maximum.reduceat(data['High'].to_numpy(dtype=np.float64), starts),
+            'Low': np.minimum.reduceat(data['Low'].to_numpy(dtype=np.float64), starts),
+            'Close': data['Close'].to_numpy()[ends]
+        })
+        if 'Volume' in data.columns:
+            result['Volume'] = np.add.reduceat(data['Volume'].to_numpy(dtype=np.float64), starts)
+        return pd.DataFrame(result, index=data.index[starts])
+
+    def downsample(self, chart_type: str, data: pd.DataFrame, max_points: Optional[int] = None) -> pd.DataFrame:
+        """Downsample processed chart data according to its chart type"""
+        if data is None or data.empty or len(data) <= (max_points or self.max_points):
+            return data
+        try:
+            if chart_type == 'Candlestick' and {'Open', 'High', 'Low', 'Close'} <= set(data.columns):
+                result = self.downsample_ohlc(data, max_points)
+            elif chart_type == 'Line' and 'Date' in data.columns:
+                y_cols = [col for col in data.columns if col != 'Date']
+                result = self.downsample_line(data, 'Date', y_cols, max_points)
+            elif chart_type == 'Scatter' and data.shape[1] >= 2:
+                result = self.downsample_scatter(data, data.columns[0], data.columns[1], max_points)
+            else:
+                return data
+            logger.info(f"📉 Downsampled {chart_type} data: {len(data)} -> {len(result)} points")
+            return result
+        except Exception as e:
+            logger.error(f"Failed to downsample {chart_type} data: {e}")
+            return data
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+TradePulse Charts - Chart Figure
+Builds the Plotly figure for processed chart data and reads zoom windows back from it
+"""
+
+import plotly.graph_objects as go
+import pandas as pd
+import logging
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class ChartFigure:
+    """Plotly figures for the charts panel, one trace group per dataset"""
+
+    # Keeps the user's zoom and pan when the figure is replaced with re-sampled data
+    UI_REVISION = 'charts'
+
+    @staticmethod
+    def build(chart_type: str, chart_data: Dict[str, pd.DataFrame], show_volume: bool = False,
+              x_range: Optional[Tuple] = None) -> go.Figure:
+        """Build a figure from {dataset_id: processed frame}"""
+        fig = go.Figure()
+        for dataset_id, data in chart_data.items():
+            if data is None or data.empty:
+                continue
+            x = data['Date'] if 'Date' in data.columns else data.index
+            if chart_type == 'Candlestick' and {'Open', 'High', 'Low', 'Close'} <= set(data.columns):
+                fig.add_trace(go.Candlestick(x=x, open=data['Open'], high=data['High'], low=data['Low'],
+                                             close=data['Close'], name=dataset_id))
+                if show_volume and 'Volume' in data.columns:
+                    fig.add_trace(go.Bar(x=x, y=data['Volume'], name=f"{dataset_id} Volume",
+                                         yaxis='y2', opacity=0.3))
+            elif chart_type == 'Scatter':
+                columns = data.select_dtypes('number').columns
+                if len(columns) >= 2:
+                    fig.add_trace(go.Scattergl(x=data[columns[0]], y=data[columns[1]], mode='markers',
+                                               name=dataset_id))
+            else:
+                trace = go.Bar if chart_type == 'Bar' else go.Scattergl
+                for column in data.select_dtypes('number').columns:
+                    fig.add_trace(trace(x=x, y=data[column], name=f"{dataset_id} {column}"))
+
+        fig.update_layout(uirevision=ChartFigure.UI_REVISION, xaxis_rangeslider_visible=False,
+                          margin=dict(l=40, r=40, t=30, b=30), height=450)
+        if show_volume and chart_type == 'Candlestick':
+            fig.update_layout(yaxis2=dict(overlaying='y', side='right', showgrid=False))
+        if x_range is not None:
+            fig.update_xaxes(range=list(x_range))
+        return fig
+
+    @staticmethod
+    def read_x_range(relayout_data: Optional[Dict]):
+        """Get the x window from a Plotly relayout event: (start, end), None for autorange, False if unchanged"""
+        if not relayout_data:
+            return False
+        if relayout_data.get('xaxis.autorange'):
+            return None
+        if 'xaxis.range[0]' in relayout_data and 'xaxis.range[1]' in relayout_data:
+            return relayout_data['xaxis.range[0]'], relayout_data['xaxis.range[1]']
+        if 'xaxis.range' in relayout_data:
+            return tuple(relayout_data['xaxis.range'])
+        return False
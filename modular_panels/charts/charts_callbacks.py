@@ -6,7 +6,9 @@ Callback management for the charts panel
 
 import pandas as pd
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+from .chart_figure import ChartFigure
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,7 @@ class ChartsCallbacks:
     
     def __init__(self, core_panel):
         self.core_panel = core_panel
+        self.x_range = None   # zoomed x window of the rendered chart (None = full range)
     
     def update_chart(self, event):
         """Update the chart using the chart manager and data processor"""
@@ -45,10 +48,9 @@ class ChartsCallbacks:
                     logger.error(f"❌ Invalid chart configuration: {errors}")
                     return
                 
-                # Process data for chart
-                processed_data = self.core_panel.data_processor.process_data_for_chart(
-                    chart_type, active_datasets, time_range
-                )
+                # Process and render the full range; zooming later re-samples the visible window
+                self.x_range = None
+                processed_data = self._render(chart_type, active_datasets, time_range, show_volume)
                 
                 # Create or update chart
                 chart_id = self.core_panel.chart_manager.create_chart(chart_config)
@@ -66,6 +68,37 @@ class ChartsCallbacks:
         except Exception as e:
             logger.error(f"❌ Chart update failed: {e}")
     
+    def _render(self, chart_type: str, active_datasets: Dict, time_range: str, show_volume: bool,
+                x_range: Optional[Tuple] = None) -> Dict:
+        """Downsample the datasets (to the x window when zoomed) and show them in the chart pane"""
+        processed_data = self.core_panel.data_processor.process_data_for_chart(
+            chart_type, active_datasets, time_range, x_range=x_range
+        )
+        self.core_panel.components.chart_plot.object = ChartFigure.build(chart_type, processed_data, show_volume, x_range)
+        return processed_data
+    
+    def on_relayout(self, event):
+        """Re-sample the chart at full resolution for the zoomed window (or the whole range on reset)"""
+        try:
+            x_range = ChartFigure.read_x_range(event.new)
+            if x_range is False or x_range == self.x_range:
+                return
+            chart_type = self.core_panel.components.chart_type.value
+            if chart_type not in self.core_panel.data_processor.WINDOWED_CHARTS:
+                return
+            active_datasets = self.core_panel.dataset_selector.get_active_datasets()
+            if not active_datasets:
+                return
+            self.x_range = x_range
+            components = self.core_panel.components
+            processed_data = self._render(chart_type, active_datasets,
+                                          components.time_range.value, components.show_volume.value, x_range)
+            self.core_panel._update_chart_statistics(chart_type, processed_data,
+                                                     components.time_range.value)
+            logger.info(f"🔍 Chart re-sampled for window {x_range}")
+        except Exception as e:
+            logger.error(f"❌ Chart zoom update failed: {e}")
+    
     def export_chart(self, event):
         """Export the current chart"""
         try:
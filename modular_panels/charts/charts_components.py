@@ -21,6 +21,7 @@ class ChartsComponents:
         self.export_chart = None
         self.save_chart = None
         self.chart_display = None
+        self.chart_plot = None
         self.chart_stats = None
     
     def create_basic_components(self, chart_manager):
@@ -79,6 +80,9 @@ class ChartsComponents:
         Select a dataset and chart type to visualize your data
         """)
         
+        # Rendered chart; zooming re-samples the visible window (see ChartsCallbacks.on_relayout)
+        self.chart_plot = pn.pane.Plotly(None, sizing_mode='stretch_width', height=450)
+        
         # Chart statistics
         self.chart_stats = pn.pane.Markdown("""
         **Chart Statistics:**
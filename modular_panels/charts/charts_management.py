@@ -42,6 +42,7 @@ class ChartsManagement:
             chart_display = pn.Column(
                 pn.pane.Markdown("### 📈 Chart Visualization"),
                 components.chart_display,
+                components.chart_plot,
                 components.chart_stats,
                 sizing_mode='stretch_width'
             )
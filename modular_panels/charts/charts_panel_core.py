@@ -48,6 +48,8 @@ class ChartsPanelCore(BasePanel):
         self.components.update_chart.on_click(self.callbacks.update_chart)
         self.components.export_chart.on_click(self.callbacks.export_chart)
         self.components.save_chart.on_click(self.callbacks.save_chart)
+        # Zoom and pan on the rendered chart re-sample the visible window
+        self.components.chart_plot.param.watch(self.callbacks.on_relayout, 'relayout_data')
         
         # Dataset selector callback
         self.dataset_selector.add_dataset_change_callback(self.callbacks.on_dataset_change)
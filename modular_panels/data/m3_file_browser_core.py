@@ -115,6 +115,9 @@ class M3FileBrowserCore:
             ### 📁 Accessible Directories:
             """
             
+            if status.get('indexing'):
+                status_text += "⏳ The file index is still being built; totals will appear once it finishes.\n\n"
+            
             for path in status.get('accessible_paths', []):
                 file_count = status.get('file_types_found', {}).get('.csv', 0) + \
                            status.get('file_types_found', {}).get('.json', 0) + \
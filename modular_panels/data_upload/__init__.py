@@ -8,10 +8,12 @@ from .data_upload_component import DataUploadComponent
 from .file_processor import FileProcessor
 from .format_detector import FormatDetector
 from .upload_manager import UploadManager
+from .streaming_ingest import StreamingCSVIngest
 
 __all__ = [
     'DataUploadComponent',
     'FileProcessor',
     'FormatDetector', 
-    'UploadManager'
+    'UploadManager',
+    'StreamingCSVIngest'
 ]
@@ -6,19 +6,70 @@ Handles integration with the data manager
 
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Any, Optional
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
 import logging
+import os
+
+from .streaming_ingest import StreamingCSVIngest
+from ui_components.upload_content_store import get_upload_content_store
 
 logger = logging.getLogger(__name__)
 
 class DataManagerIntegration:
     """Handles integration with the data manager"""
     
+    # CSV uploads above this size are parsed block by block instead of with one read_csv call
+    STREAMING_THRESHOLD = int(os.getenv('TRADEPULSE_STREAMING_UPLOAD_MB', '100')) * 1024 * 1024
+    INGEST_DIR = os.path.join("uploads", "ingested")
+    
     def __init__(self, data_manager):
         self.data_manager = data_manager
         self.uploaded_data = {}
+        self.content_store = get_upload_content_store()
+        self.streaming_ingest = StreamingCSVIngest()
+    
+    def should_stream(self, file_content: bytes, filename: str) -> bool:
+        """Check whether an upload is a CSV large enough to go through the streaming ingest"""
+        return (Path(filename or '').suffix.lower() == '.csv' and len(file_content) > self.STREAMING_THRESHOLD
+                and hasattr(self.data_manager, 'add_uploaded_file'))
+    
+    def ingest_csv_bytes(self, file_content: bytes, filename: str, digest: Optional[str] = None) -> Tuple[Optional[str], Dict[str, Any]]:
+        """Stream CSV upload bytes into an Arrow file and register it, returning (dataset_id, ingest metadata)"""
+        destination = os.path.join(self.INGEST_DIR, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{Path(filename).stem}.arrow")
+        metadata = self.streaming_ingest.ingest(file_content, destination, output_format='arrow')
+        metadata.update({
+            'name': Path(filename).stem,
+            'type': 'uploaded',
+            'source': 'file_upload',
+            'original_filename': filename,
+            'upload_component': 'DataUploadComponent'
+        })
+        
+        # The data manager may move the Arrow file into columnar storage
+        dataset_id = self.data_manager.add_uploaded_file(Path(filename).stem, destination, metadata)
+        logger.info(f"✅ Streamed {metadata['rows']} rows from {filename} into dataset {dataset_id}")
+        if digest and dataset_id:
+            self.content_store.link_dataset(digest, dataset_id, filename)
+        
+        self.uploaded_data[filename] = {
+            'data': None,
+            'dataset_id': dataset_id,
+            'format': self._detect_file_format(filename),
+            'timestamp': pd.Timestamp.now()
+        }
+        return dataset_id, metadata
+    
+    def find_existing_dataset(self, file_content: bytes) -> Tuple[str, Optional[str]]:
+        """Hash upload content and return (digest, dataset_id) for a dataset already parsed from it"""
+        digest = self.content_store.digest_bytes(file_content)
+        dataset_id = self.content_store.get_dataset_id(digest)
+        # A membership check; reading the dataset would reload it if it was spilled
+        if dataset_id and dataset_id in getattr(self.data_manager, 'uploaded_datasets', {}):
+            return digest, dataset_id
+        return digest, None
     
-    def add_to_data_manager(self, data: pd.DataFrame, filename: str) -> Optional[str]:
+    def add_to_data_manager(self, data: pd.DataFrame, filename: str, digest: Optional[str] = None) -> Optional[str]:
         """Add the loaded data to the data manager for use by all modules"""
         try:
             # Generate metadata for the dataset
@@ -34,6 +85,8 @@ class DataManagerIntegration:
             if hasattr(self.data_manager, 'add_uploaded_data'):
                 dataset_id = self.data_manager.add_uploaded_data(filename, data, metadata)
                 logger.info(f"✅ Added uploaded data to data manager with dataset ID: {dataset_id}")
+                if digest and dataset_id:
+                    self.content_store.link_dataset(digest, dataset_id, filename)
                 
                 # Store reference in local storage for component access
                 self.uploaded_data[filename] = {
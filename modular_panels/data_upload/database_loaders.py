@@ -7,28 +7,35 @@ Handles database file loading (DuckDB, SQLite)
 import pandas as pd
 import sqlite3
 import duckdb
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import logging
-import tempfile
 import os
+from pathlib import Path
+
+from ui_components.upload_content_store import get_upload_content_store
 
 logger = logging.getLogger(__name__)
 
 class DatabaseLoaders:
     """Handles database file loading (DuckDB, SQLite)"""
     
+    # Database uploads need a real file; each distinct content is stored here once and kept
+    UPLOAD_DIR = os.getenv('TRADEPULSE_UPLOAD_DIR', 'uploads')
+    
+    @staticmethod
+    def store_upload(file_content: bytes, filename: str) -> Tuple[Path, bool]:
+        """Store uploaded database bytes by content digest; returns (path, whether this call wrote it)"""
+        safe_name = "".join(c if c.isalnum() or c in '-_.' else '_' for c in Path(filename).name)
+        stored = get_upload_content_store(DatabaseLoaders.UPLOAD_DIR).store_bytes(file_content, safe_name)
+        return Path(stored['path']), not stored['duplicate']
+    
     @staticmethod
     def load_duckdb_file(file_content: bytes, filename: str) -> pd.DataFrame:
         """Load DuckDB format file"""
+        path, created = DatabaseLoaders.store_upload(file_content, filename)
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix='.duckdb', delete=False) as tmp_file:
-                tmp_file.write(file_content)
-                tmp_file.flush()
-                
-                # Connect to DuckDB and read
-                con = duckdb.connect(tmp_file.name)
-                
+            con = duckdb.connect(str(path), read_only=True)
+            try:
                 # Get table names
                 tables = con.execute("SHOW TABLES").fetchall()
                 if not tables:
@@ -36,29 +43,22 @@ class DatabaseLoaders:
                 
                 # Read first table (you could add UI to select specific table)
                 table_name = tables[0][0]
-                df = con.execute(f"SELECT * FROM {table_name}").fetchdf()
-                
+                return con.execute(f'SELECT * FROM "{table_name}"').fetchdf()
+            finally:
                 con.close()
-                
-                # Clean up
-                os.unlink(tmp_file.name)
-                
-                return df
         except Exception as e:
+            # Keep only uploads that could actually be read
+            if created:
+                path.unlink(missing_ok=True)
             raise Exception(f"Failed to load DuckDB file: {e}")
     
     @staticmethod
     def load_sqlite_file(file_content: bytes, filename: str) -> pd.DataFrame:
         """Load SQLite format file"""
+        path, created = DatabaseLoaders.store_upload(file_content, filename)
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp_file:
-                tmp_file.write(file_content)
-                tmp_file.flush()
-                
-                # Connect to SQLite and read
-                con = sqlite3.connect(tmp_file.name)
-                
+            con = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            try:
                 # Get table names
                 cursor = con.cursor()
                 cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
@@ -69,13 +69,11 @@ class DatabaseLoaders:
                 
                 # Read first table (you could add UI to select specific table)
                 table_name = tables[0][0]
-                df = pd.read_sql_query(f"SELECT * FROM {table_name}", con)
-                
+                return pd.read_sql_query(f'SELECT * FROM "{table_name}"', con)
+            finally:
                 con.close()
-                
-                # Clean up
-                os.unlink(tmp_file.name)
-                
-                return df
         except Exception as e:
+            # Keep only uploads that could actually be read
+            if created:
+                path.unlink(missing_ok=True)
             raise Exception(f"Failed to load SQLite file: {e}")
@@ -9,8 +9,8 @@ import sqlite3
 import duckdb
 from typing import Dict, Any, Tuple
 import logging
-import tempfile
-import os
+
+from .database_loaders import DatabaseLoaders
 
 logger = logging.getLogger(__name__)
 
@@ -20,16 +20,11 @@ class DatabaseProcessors:
     @staticmethod
     def process_duckdb(file_content: bytes, filename: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """Process DuckDB format file"""
+        # Stored once per distinct content in the upload directory and opened there
+        path, created = DatabaseLoaders.store_upload(file_content, filename)
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix='.duckdb', delete=False) as temp_file:
-                temp_file.write(file_content)
-                temp_file_path = temp_file.name
-            
+            con = duckdb.connect(str(path), read_only=True)
             try:
-                # Connect to DuckDB and read data
-                con = duckdb.connect(temp_file_path)
-                
                 # Get table names
                 tables = con.execute("SHOW TABLES").fetchall()
                 if not tables:
@@ -37,42 +32,37 @@ class DatabaseProcessors:
                 
                 # Read first table
                 table_name = tables[0][0]
-                data = con.execute(f"SELECT * FROM {table_name}").fetchdf()
-                
-                metadata = {
-                    'format': 'duckdb',
-                    'filename': filename,
-                    'table_name': table_name,
-                    'tables': [t[0] for t in tables],
-                    'shape': data.shape,
-                    'columns': data.columns.tolist(),
-                    'dtypes': data.dtypes.to_dict()
-                }
-                
-                con.close()
-                return data, metadata
-                
+                data = con.execute(f'SELECT * FROM "{table_name}"').fetchdf()
             finally:
-                # Clean up temporary file
-                os.unlink(temp_file_path)
+                con.close()
+            
+            metadata = {
+                'format': 'duckdb',
+                'filename': filename,
+                'file_path': str(path),
+                'table_name': table_name,
+                'tables': [t[0] for t in tables],
+                'shape': data.shape,
+                'columns': data.columns.tolist(),
+                'dtypes': data.dtypes.to_dict()
+            }
+            
+            return data, metadata
                 
         except Exception as e:
+            if created:
+                path.unlink(missing_ok=True)
             logger.error(f"Failed to process DuckDB file: {e}")
             raise
     
     @staticmethod
     def process_sqlite(file_content: bytes, filename: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """Process SQLite format file"""
+        # Stored once per distinct content in the upload directory and opened there
+        path, created = DatabaseLoaders.store_upload(file_content, filename)
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as temp_file:
-                temp_file.write(file_content)
-                temp_file_path = temp_file.name
-            
+            con = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
             try:
-                # Connect to SQLite and read data
-                con = sqlite3.connect(temp_file_path)
-                
                 # Get table names
                 cursor = con.cursor()
                 cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
@@ -83,25 +73,25 @@ class DatabaseProcessors:
                 
                 # Read first table
                 table_name = tables[0][0]
-                data = pd.read_sql_query(f"SELECT * FROM {table_name}", con)
-                
-                metadata = {
-                    'format': 'sqlite',
-                    'filename': filename,
-                    'table_name': table_name,
-                    'tables': [t[0] for t in tables],
-                    'shape': data.shape,
-                    'columns': data.columns.tolist(),
-                    'dtypes': data.dtypes.to_dict()
-                }
-                
-                con.close()
-                return data, metadata
-                
+                data = pd.read_sql_query(f'SELECT * FROM "{table_name}"', con)
             finally:
-                # Clean up temporary file
-                os.unlink(temp_file_path)
+                con.close()
+            
+            metadata = {
+                'format': 'sqlite',
+                'filename': filename,
+                'file_path': str(path),
+                'table_name': table_name,
+                'tables': [t[0] for t in tables],
+                'shape': data.shape,
+                'columns': data.columns.tolist(),
+                'dtypes': data.dtypes.to_dict()
+            }
+            
+            return data, metadata
                 
         except Exception as e:
+            if created:
+                path.unlink(missing_ok=True)
             logger.error(f"Failed to process SQLite file: {e}")
             raise
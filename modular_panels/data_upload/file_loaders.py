@@ -7,10 +7,9 @@ Handles file format loading (Feather, Parquet, Excel, CSV)
 import pandas as pd
 import pyarrow as pa
 import pyarrow.feather as feather
+import pyarrow.parquet as pq
 from typing import Dict, Any
 import logging
-import tempfile
-import os
 import io
 
 logger = logging.getLogger(__name__)
@@ -22,18 +21,9 @@ class FileLoaders:
     def load_feather_file(file_content: bytes) -> pd.DataFrame:
         """Load Feather format file"""
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix='.feather', delete=False) as tmp_file:
-                tmp_file.write(file_content)
-                tmp_file.flush()
-                
-                # Read with pandas (feather.read_feather returns DataFrame directly)
-                df = pd.read_feather(tmp_file.name)
-                
-                # Clean up
-                os.unlink(tmp_file.name)
-                
-                return df
+            # BufferReader wraps the upload bytes; uncompressed columns are read without copying
+            table = feather.read_table(pa.BufferReader(file_content))
+            return table.to_pandas()
         except Exception as e:
             raise Exception(f"Failed to load Feather file: {e}")
     
@@ -41,18 +31,8 @@ class FileLoaders:
     def load_parquet_file(file_content: bytes) -> pd.DataFrame:
         """Load Parquet format file"""
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix='.parquet', delete=False) as tmp_file:
-                tmp_file.write(file_content)
-                tmp_file.flush()
-                
-                # Read with pandas
-                df = pd.read_parquet(tmp_file.name)
-                
-                # Clean up
-                os.unlink(tmp_file.name)
-                
-                return df
+            table = pq.read_table(pa.BufferReader(file_content))
+            return table.to_pandas()
         except Exception as e:
             raise Exception(f"Failed to load Parquet file: {e}")
     
@@ -60,22 +40,11 @@ class FileLoaders:
     def load_excel_file(file_content: bytes) -> pd.DataFrame:
         """Load Excel format file"""
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp_file:
-                tmp_file.write(file_content)
-                tmp_file.flush()
-                
-                # Read Excel file
-                excel_file = pd.ExcelFile(tmp_file.name)
-                
-                # Read first sheet (you could add UI to select specific sheet)
-                sheet_name = excel_file.sheet_names[0]
-                df = pd.read_excel(tmp_file.name, sheet_name=sheet_name)
-                
-                # Clean up
-                os.unlink(tmp_file.name)
-                
-                return df
+            excel_file = pd.ExcelFile(io.BytesIO(file_content))
+            
+            # Read first sheet (you could add UI to select specific sheet)
+            sheet_name = excel_file.sheet_names[0]
+            return excel_file.parse(sheet_name)
         except Exception as e:
             raise Exception(f"Failed to load Excel file: {e}")
     
@@ -83,9 +52,8 @@ class FileLoaders:
     def load_csv_file(file_content: bytes) -> pd.DataFrame:
         """Load CSV format file"""
         try:
-            # Try to decode and parse CSV
-            content_str = file_content.decode('utf-8')
-            df = pd.read_csv(io.StringIO(content_str))
+            # Parse the bytes directly; decoding to one str first held the file in memory twice more
+            df = pd.read_csv(io.BytesIO(file_content), encoding='utf-8')
             return df
         except Exception as e:
             raise Exception(f"Failed to load CSV file: {e}")
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+TradePulse Data Upload - Streaming Ingest
+Chunked CSV ingest that writes Arrow IPC or Parquet incrementally with constant memory
+"""
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from typing import Dict, Any, Optional, Union
+import logging
+import re
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+class StreamingCSVIngest:
+    """Parse a CSV one block at a time and append each record batch to an Arrow or Parquet file
+
+    The schema is inferred from the first block and locked for the rest of the file. If a
+    later block holds values that do not fit a locked column (e.g. 'N/A' in a numeric column),
+    one validation pass finds every such column and the ingest restarts once with all of them
+    read as string instead of failing. Date-only columns are written as timestamps so they load
+    as datetime64 like the rest of the store.
+    """
+
+    BLOCK_SIZE = int(os.getenv('TRADEPULSE_INGEST_BLOCK_MB', '16')) * 1024 * 1024
+    OUTPUT_FORMATS = {'arrow': '.arrow', 'parquet': '.parquet'}
+    ENCODINGS = ['utf8', 'latin-1']
+
+    def __init__(self, block_size: Optional[int] = None):
+        self.block_size = block_size or self.BLOCK_SIZE
+
+    def ingest(self, source: Union[str, bytes], output_path: str,
+               output_format: str = 'arrow') -> Dict[str, Any]:
+        """Stream a CSV file path or upload bytes into output_path and return ingest metadata"""
+        if output_format not in self.OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        column_types = {}
+        encodings = list(self.ENCODINGS)
+        encoding = encodings.pop(0)
+        while True:
+            try:
+                result = self._write(source, output_path, output_format, encoding, column_types)
+            except pa.ArrowInvalid as e:
+                if 'invalid utf8' in str(e).lower() and encodings:
+                    encoding = encodings.pop(0)
+                    logger.info(f"🔤 CSV is not valid UTF-8, retrying as {encoding}")
+                    continue
+                column = self._column_from_error(e, source, encoding)
+                if column is None or column in column_types:
+                    raise
+                # A later block did not fit the schema locked from the first one: find every such
+                # column in one pass rather than restarting once per column
+                columns = self._mismatched_columns(source, encoding, column_types) | {column}
+                logger.warning(f"⚠️ Columns {sorted(columns)} do not match their inferred types, re-reading them as string")
+                column_types.update({name: pa.string() for name in columns})
+                continue
+            logger.info(f"📥 Ingested {result['rows']} rows in {result['batches']} batches -> {output_path}")
+            return result
+
+    def _open_source(self, source: Union[str, bytes]) -> pa.NativeFile:
+        """Open a path as a buffered input stream, or wrap upload bytes without copying them"""
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return pa.BufferReader(source)
+        return pa.input_stream(str(source))
+
+    def _open_reader(self, source: Union[str, bytes], encoding: str,
+                     column_types: Dict[str, pa.DataType]) -> pa_csv.CSVStreamingReader:
+        """Open a streaming CSV reader that infers types from the first block"""
+        return pa_csv.open_csv(
+            self._open_source(source),
+            read_options=pa_csv.ReadOptions(block_size=self.block_size, encoding=encoding),
+            convert_options=pa_csv.ConvertOptions(column_types=column_types)
+        )
+
+    @contextmanager
+    def _open_writer(self, path: Path, output_format: str, schema: pa.Schema):
+        """Open an incremental Parquet or uncompressed Arrow IPC file writer"""
+        if output_format == 'parquet':
+            with pq.ParquetWriter(str(path), schema) as writer:
+                yield writer
+            return
+        # Uncompressed so the result can be memory-mapped like the columnar store's files
+        with pa.OSFile(str(path), 'wb') as sink, pa.ipc.new_file(sink, schema) as writer:
+            yield writer
+
+    def _write(self, source: Union[str, bytes], output_path: Path, output_format: str,
+               encoding: str, column_types: Dict[str, pa.DataType]) -> Dict[str, Any]:
+        """Copy every record batch of the CSV into the output file, written atomically"""
+        reader = self._open_reader(source, encoding, column_types)
+        binary_columns = [field.name for field in reader.schema if pa.types.is_binary(field.type)]
+        if binary_columns and encoding == 'utf8':
+            # Arrow infers binary for text that does not decode, rather than failing
+            raise pa.ArrowInvalid(f"invalid UTF8 data in columns {binary_columns}")
+        schema = pa.schema([field.with_type(pa.timestamp('s')) if pa.types.is_date32(field.type) else field
+                            for field in reader.schema])
+        tmp_path = output_path.with_name(output_path.name + '.tmp')
+        rows = batches = 0
+        try:
+            with self._open_writer(tmp_path, output_format, schema) as writer:
+                for batch in reader:
+                    if batch.schema == schema:
+                        writer.write_batch(batch)
+                    else:
+                        # Table.cast: RecordBatch.cast needs pyarrow 16, requirements allow 12
+                        writer.write_table(pa.Table.from_batches([batch]).cast(schema))
+                    rows += batch.num_rows
+                    batches += 1
+            os.replace(tmp_path, output_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        return {
+            'format': 'csv',
+            'output_path': str(output_path),
+            'output_format': output_format,
+            'encoding': 'utf-8' if encoding == 'utf8' else encoding,
+            'rows': rows,
+            'batches': batches,
+            'columns': schema.names,
+            'schema': {field.name: str(field.type) for field in schema},
+            'string_fallback_columns': sorted(column_types),
+            'source_bytes': len(source) if isinstance(source, (bytes, bytearray, memoryview)) else os.path.getsize(source),
+            'output_bytes': output_path.stat().st_size
+        }
+
+    def _mismatched_columns(self, source: Union[str, bytes], encoding: str,
+                            column_types: Dict[str, pa.DataType]) -> set:
+        """Read the whole CSV as text once and get the typed columns that some value does not convert to"""
+        locked = {field.name: field.type for field in self._open_reader(source, encoding, column_types).schema
+                  if field.name not in column_types and not pa.types.is_string(field.type)}
+        reader = pa_csv.open_csv(
+            self._open_source(source),
+            read_options=pa_csv.ReadOptions(block_size=self.block_size, encoding=encoding),
+            convert_options=pa_csv.ConvertOptions(column_types={name: pa.string() for name in locked},
+                                                  strings_can_be_null=True)
+        )
+        mismatched = set()
+        for batch in reader:
+            for name in [name for name in locked if name not in mismatched]:
+                try:
+                    pc.cast(batch.column(name), locked[name])
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                    mismatched.add(name)
+        return mismatched
+
+    def _column_from_error(self, error: Exception, source: Union[str, bytes], encoding: str) -> Optional[str]:
+        """Get the name of the column a conversion error refers to"""
+        match = re.search(r"In CSV column #(\d+)", str(error))
+        if not match:
+            return None
+        names = self._open_reader(source, encoding, {}).schema.names
+        index = int(match.group(1))
+        return names[index] if index < len(names) else None
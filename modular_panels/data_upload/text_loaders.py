@@ -19,9 +19,8 @@ class TextLoaders:
     def load_csv_file(file_content: bytes) -> pd.DataFrame:
         """Load CSV format file"""
         try:
-            # Try to decode and parse CSV
-            content_str = file_content.decode('utf-8')
-            df = pd.read_csv(io.StringIO(content_str))
+            # Parse the bytes directly; decoding to one str first held the file in memory twice more
+            df = pd.read_csv(io.BytesIO(file_content), encoding='utf-8')
             return df
         except Exception as e:
             raise Exception(f"Failed to load CSV file: {e}")
@@ -19,14 +19,13 @@ class TextProcessors:
     def process_csv(file_content: bytes, filename: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """Process CSV format file"""
         try:
-            # Try to decode content
+            # Parse the bytes directly; decoding to one str first held the file in memory twice more
+            encoding = 'utf-8'
             try:
-                content_str = file_content.decode('utf-8')
+                data = pd.read_csv(io.BytesIO(file_content), encoding=encoding)
             except UnicodeDecodeError:
-                content_str = file_content.decode('latin-1')
-            
-            # Read CSV from string
-            data = pd.read_csv(io.StringIO(content_str))
+                encoding = 'latin-1'
+                data = pd.read_csv(io.BytesIO(file_content), encoding=encoding)
             
             metadata = {
                 'format': 'csv',
@@ -34,7 +33,7 @@ class TextProcessors:
                 'shape': data.shape,
                 'columns': data.columns.tolist(),
                 'dtypes': data.dtypes.to_dict(),
-                'encoding': 'utf-8' if file_content.decode('utf-8', errors='ignore') == content_str else 'latin-1'
+                'encoding': encoding
             }
             
             return data, metadata
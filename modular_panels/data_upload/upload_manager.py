@@ -5,13 +5,15 @@ Manages file uploads and data processing
 """
 
 import os
-import shutil
 import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pathlib import Path
 import panel as pn
 
+from .streaming_ingest import StreamingCSVIngest
+from ui_components.upload_content_store import get_upload_content_store
+
 logger = logging.getLogger(__name__)
 
 class UploadManager:
@@ -23,9 +25,16 @@ class UploadManager:
         self.upload_dir = "uploads"
         self.max_file_size = 100 * 1024 * 1024  # 100MB
         
+        # CSVs are parsed block by block into Arrow files, so they are not bound by max_file_size
+        self.streaming_ingest = StreamingCSVIngest()
+        self.ingest_dir = os.path.join(self.upload_dir, "ingested")
+        
         # Create upload directory if it doesn't exist
         os.makedirs(self.upload_dir, exist_ok=True)
         
+        # Uploads are stored once per content hash; repeat imports link to the existing copy
+        self.content_store = get_upload_content_store(self.upload_dir)
+        
         # Create file input widget for compatibility
         self.file_input = pn.widgets.FileInput(
             name='📁 Upload File',
@@ -47,6 +56,8 @@ class UploadManager:
             
             # Validate file size
             file_size = os.path.getsize(file_path)
+            if file_size > self.max_file_size and Path(file_path).suffix.lower() == '.csv':
+                return self.ingest_csv_file(file_path, file_type)
             if file_size > self.max_file_size:
                 return {
                     'success': False,
@@ -54,14 +65,11 @@ class UploadManager:
                     'file_path': file_path
                 }
             
-            # Generate unique filename
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            # Copy into the content-addressed store (hashed while copying, skipped for known content)
+            stored = self.content_store.store_file(file_path)
             filename = Path(file_path).name
-            new_filename = f"{timestamp}_{filename}"
-            destination = os.path.join(self.upload_dir, new_filename)
-            
-            # Copy file to upload directory
-            shutil.copy2(file_path, destination)
+            destination = stored['path']
+            new_filename = Path(destination).name
             
             # Record upload
             upload_record = {
@@ -71,19 +79,23 @@ class UploadManager:
                 'file_type': file_type,
                 'size': file_size,
                 'upload_time': datetime.now(),
-                'status': 'uploaded'
+                'status': 'duplicate' if stored['duplicate'] else 'uploaded',
+                'digest': stored['digest']
             }
             
             self.upload_history.append(upload_record)
             
-            logger.info(f"✅ File uploaded: {filename} -> {new_filename}")
+            logger.info(f"✅ File uploaded: {filename} -> {new_filename}{' (already stored)' if stored['duplicate'] else ''}")
             
             return {
                 'success': True,
                 'file_path': destination,
                 'filename': new_filename,
                 'size': file_size,
-                'upload_time': upload_record['upload_time']
+                'upload_time': upload_record['upload_time'],
+                'digest': stored['digest'],
+                'duplicate': stored['duplicate'],
+                'dataset_id': self._live_dataset(stored.get('dataset_id'))
             }
             
         except Exception as e:
@@ -94,6 +106,75 @@ class UploadManager:
                 'file_path': file_path
             }
     
+    def ingest_csv_file(self, file_path: str, file_type: str = "upload") -> Dict[str, Any]:
+        """Stream a CSV of any size into an Arrow file and register it with the data manager"""
+        try:
+            # An unchanged file that was already ingested links straight to its dataset
+            digest = self.content_store.digest_file(file_path)
+            dataset_id = self._live_dataset(self.content_store.get_dataset_id(digest))
+            if dataset_id:
+                logger.info(f"♻️ {Path(file_path).name} was already ingested as {dataset_id}")
+                return {'success': True, 'file_path': file_path, 'filename': Path(file_path).name,
+                        'size': os.path.getsize(file_path), 'upload_time': datetime.now(),
+                        'digest': digest, 'duplicate': True, 'dataset_id': dataset_id}
+            
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            filename = Path(file_path).name
+            new_filename = f"{timestamp}_{Path(file_path).stem}.arrow"
+            destination = os.path.join(self.ingest_dir, new_filename)
+            
+            metadata = self.streaming_ingest.ingest(file_path, destination, output_format='arrow')
+            metadata['filename'] = filename
+            
+            # The data manager may move the Arrow file into columnar storage
+            dataset_id = None
+            if hasattr(self.data_manager, 'add_uploaded_file'):
+                dataset_id = self.data_manager.add_uploaded_file(Path(file_path).stem, destination, metadata)
+            if dataset_id:
+                self.content_store.link_dataset(digest, dataset_id, filename)
+            
+            upload_record = {
+                'original_path': file_path,
+                'uploaded_path': destination,
+                'filename': new_filename,
+                'file_type': file_type,
+                'size': metadata['source_bytes'],
+                'upload_time': datetime.now(),
+                'status': 'ingested',
+                'dataset_id': dataset_id,
+                'digest': digest
+            }
+            self.upload_history.append(upload_record)
+            
+            logger.info(f"✅ File ingested: {filename} -> {new_filename} ({metadata['rows']} rows)")
+            
+            return {
+                'success': True,
+                'file_path': destination,
+                'filename': new_filename,
+                'size': metadata['source_bytes'],
+                'upload_time': upload_record['upload_time'],
+                'dataset_id': dataset_id,
+                'digest': digest,
+                'duplicate': False,
+                'rows': metadata['rows'],
+                'columns': metadata['columns']
+            }
+            
+        except Exception as e:
+            logger.error(f"❌ Ingest failed for {file_path}: {e}")
+            return {
+                'success': False,
+                'error': str(e),
+                'file_path': file_path
+            }
+    
+    def _live_dataset(self, dataset_id: Optional[str]) -> Optional[str]:
+        """Return dataset_id if the data manager still holds that dataset (without reading it)"""
+        if not dataset_id or dataset_id not in getattr(self.data_manager, 'uploaded_datasets', {}):
+            return None
+        return dataset_id
+    
     def get_upload_history(self) -> List[Dict[str, Any]]:
         """Get upload history"""
         return self.upload_history.copy()
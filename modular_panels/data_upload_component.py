@@ -8,6 +8,7 @@ import panel as pn
 import pandas as pd
 from typing import Dict, List, Optional, Union, Any
 import logging
+import io
 
 from .data_upload.file_loader import FileLoader
 from .data_upload.data_manager_integration import DataManagerIntegration
@@ -88,6 +89,23 @@ class DataUploadComponent:
             
             logger.info(f"Processing file: {filename}, size: {len(file_content)} bytes")
             
+            # Identical content parsed before links to its dataset instead of being parsed again
+            digest, dataset_id = self.data_manager_integration.find_existing_dataset(file_content)
+            if dataset_id:
+                self.status_display.object = f"**Status:** ♻️ {filename} is already loaded as {dataset_id}"
+                logger.info(f"File {filename} matches existing dataset {dataset_id}, skipping parse")
+                return
+            
+            # Large CSVs are streamed into an Arrow file rather than parsed in one read_csv call
+            if self.data_manager_integration.should_stream(file_content, filename):
+                dataset_id, metadata = self.data_manager_integration.ingest_csv_bytes(file_content, filename, digest)
+                self.preview_table.value = pd.read_csv(io.BytesIO(file_content), nrows=10)
+                self.data_info.object = (f"**Data Info for {filename}**\n- **Format:** CSV (streamed)\n"
+                                         f"- **Shape:** {metadata['rows']} rows × {len(metadata['columns'])} columns\n"
+                                         f"- **Columns:** {', '.join(metadata['columns'])}")
+                self.status_display.object = f"**Status:** ✅ Successfully loaded {filename} as {dataset_id}"
+                return
+            
             # Load file using file loader
             data = self.file_loader.load_file(file_content, filename)
             
@@ -103,7 +121,7 @@ class DataUploadComponent:
             self.status_display.object = f"**Status:** ✅ Successfully loaded {filename}"
             
             # Add to data manager
-            self.data_manager_integration.add_to_data_manager(data, filename)
+            self.data_manager_integration.add_to_data_manager(data, filename, digest)
             
             logger.info(f"File {filename} processed and added to data manager successfully")
             
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+TradePulse Directory Listing
+Paginated os.scandir directory listing that stats only the entries being displayed
+"""
+
+import os
+import time
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Callable
+
+logger = logging.getLogger(__name__)
+
+class DirectoryListing:
+    """Sorted listing of one directory, served a page at a time
+
+    The scan keeps only what os.scandir already knows (name, directory flag), so listing a
+    directory with 100k+ entries costs no stat calls. Sizes and modification times are fetched
+    when a page is displayed and cached per entry; only sorting by size or date stats everything.
+    The scan is reused until the directory's own mtime changes.
+    """
+
+    SORT_KEYS = ('Name', 'Type', 'Size', 'Modified')
+    TEXT_EXTENSIONS = ('.txt', '.md', '.log')
+    CODE_EXTENSIONS = ('.py', '.js', '.html', '.css')
+    IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.svg')
+    # A directory modified this recently may change again without its coarse-grained mtime moving
+    RACY_SECONDS = 2.0
+
+    def __init__(self, supported_extensions: List[str]):
+        self.supported_extensions = supported_extensions
+        self.directory = None
+        self.mtime = None
+        self.entries = []    # (name, is_dir) in display order
+        self.stats = {}      # name -> (size, mtime), None when stat failed
+        self.sort_key = 'Name'
+        self.descending = False
+
+    def load(self, directory: str) -> int:
+        """Scan a directory unless the cached scan is still current; returns the entry count"""
+        directory = os.path.abspath(directory)
+        mtime = os.stat(directory).st_mtime
+        if directory == self.directory and mtime == self.mtime:
+            return len(self.entries)
+
+        entries = []
+        with os.scandir(directory) as scan:
+            for entry in scan:
+                try:
+                    entries.append((entry.name, entry.is_dir()))
+                except OSError:
+                    continue
+        # A scan taken in the same mtime tick as a change is redone on the next load
+        self.directory = directory
+        self.mtime = None if time.time() - mtime < self.RACY_SECONDS else mtime
+        self.entries, self.stats = entries, {}
+        self._sort()
+        logger.debug(f"Scanned {len(entries)} entries in {directory}")
+        return len(entries)
+
+    def sort(self, key: str = 'Name', descending: bool = False):
+        """Order the listing server-side; directories stay ahead of files except for size/date"""
+        if key not in self.SORT_KEYS:
+            raise ValueError(f"Unsupported sort key: {key}")
+        self.sort_key, self.descending = key, descending
+        self._sort()
+
+    def _sort(self):
+        """Apply the current sort to the scanned entries"""
+        key, reverse = self.sort_key, self.descending
+        if key == 'Name':
+            self.entries.sort(key=lambda e: e[0].lower(), reverse=reverse)
+            self.entries.sort(key=lambda e: not e[1])
+        elif key == 'Type':
+            self.entries.sort(key=lambda e: (not e[1], os.path.splitext(e[0])[1].lower(), e[0].lower()),
+                              reverse=reverse)
+        else:
+            # Sorting by size or date needs every stat; entries that cannot be stat'ed go last
+            known = [e for e in self.entries if self._stat(e[0]) is not None]
+            unknown = [e for e in self.entries if self._stat(e[0]) is None]
+            if key == 'Size':
+                known.sort(key=lambda e: 0 if e[1] else self.stats[e[0]][0], reverse=reverse)
+            else:
+                known.sort(key=lambda e: self.stats[e[0]][1], reverse=reverse)
+            self.entries = known + unknown
+
+    def _stat(self, name: str) -> Optional[tuple]:
+        """Get (size, mtime) for an entry, stat'ing it on first use"""
+        if name not in self.stats:
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+                self.stats[name] = (stat.st_size, stat.st_mtime)
+            except OSError:
+                self.stats[name] = None
+        return self.stats[name]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _icon(self, file_ext: str) -> str:
+        """Get the display icon for a file extension"""
+        if file_ext in self.supported_extensions:
+            return "📊"  # Data file
+        if file_ext in self.TEXT_EXTENSIONS:
+            return "📄"  # Text file
+        if file_ext in self.CODE_EXTENSIONS:
+            return "💻"  # Code file
+        if file_ext in self.IMAGE_EXTENSIONS:
+            return "🖼️"  # Image file
+        return "📄"  # Generic file
+
+    def skeleton(self) -> List[Dict[str, Any]]:
+        """Get display rows for every entry without stat data (filled in per page)"""
+        return [{'Name': self._display_name(name, is_dir), 'Type': 'Directory' if is_dir else 'File',
+                 'Size': '', 'Modified': ''} for name, is_dir in self.entries]
+
+    def _display_name(self, name: str, is_dir: bool) -> str:
+        """Get an entry's name prefixed with its icon"""
+        return f"{'📁' if is_dir else self._icon(os.path.splitext(name)[1].lower())} {name}"
+
+    def entry(self, index: int, format_size: Optional[Callable[[int], str]] = None) -> Dict[str, Any]:
+        """Get the full row for one entry, including its (lazily fetched) stat data"""
+        name, is_dir = self.entries[index]
+        stat = self._stat(name)
+        size, modified = '', ''
+        if stat is not None:
+            modified = datetime.fromtimestamp(stat[1]).strftime('%Y-%m-%d %H:%M')
+            if not is_dir:
+                size = format_size(stat[0]) if format_size else stat[0]
+        return {
+            'Name': self._display_name(name, is_dir),
+            'Type': 'Directory' if is_dir else 'File',
+            'Size': size,
+            'Modified': modified,
+            'Path': os.path.join(self.directory, name),
+            'Is Directory': is_dir,
+            'Extension': '' if is_dir else os.path.splitext(name)[1].lower()
+        }
+
+    def page(self, start: int, stop: int, format_size: Optional[Callable[[int], str]] = None) -> List[Dict[str, Any]]:
+        """Get full rows for entries start..stop, stat'ing only those"""
+        return [self.entry(i, format_size) for i in range(start, min(stop, len(self.entries)))]
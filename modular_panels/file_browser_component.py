@@ -13,11 +13,16 @@ from typing import Dict, List, Optional, Union, Any, Callable
 import logging
 from datetime import datetime
 
+from .directory_listing import DirectoryListing
+from .file_preview import FilePreviewReader
+
 logger = logging.getLogger(__name__)
 
 class FileBrowserComponent:
     """Component for browsing local directories and files"""
     
+    PAGE_SIZE = int(os.getenv('TRADEPULSE_FILE_BROWSER_PAGE_SIZE', '20'))
+    
     def __init__(self, data_manager, on_file_select: Optional[Callable] = None):
         self.data_manager = data_manager
         self.on_file_select = on_file_select
@@ -28,6 +33,9 @@ class FileBrowserComponent:
             '.csv', '.json', '.feather', '.parquet', '.duckdb', '.db', '.sqlite',
             '.xlsx', '.xls', '.h5', '.hdf5', '.pkl', '.pickle'
         ]
+        self.listing = DirectoryListing(self.supported_extensions)
+        self.preview_reader = FilePreviewReader()
+        self.parent_rows = 0  # 1 when a '..' row precedes the listing
         
         self.create_components()
         self.load_directory_contents()
@@ -64,13 +72,29 @@ class FileBrowserComponent:
             width=400
         )
         
-        # Directory contents display
+        # Directory contents display: remote pagination, so only the visible page is sent
+        # to the browser and stat'ed; sorting is done server-side by the listing
         self.directory_contents = pn.widgets.Tabulator(
-            pd.DataFrame(),
+            pd.DataFrame(columns=['Name', 'Type', 'Size', 'Modified']),
             height=300,
             name='Directory Contents',
             selectable='checkbox',
-            page_size=20
+            pagination='remote',
+            page_size=self.PAGE_SIZE,
+            sortable=False
+        )
+        
+        # Server-side sort controls
+        self.sort_select = pn.widgets.Select(
+            name='Sort by',
+            options=list(DirectoryListing.SORT_KEYS),
+            value='Name',
+            width=120
+        )
+        
+        self.sort_descending = pn.widgets.Checkbox(
+            name='Descending',
+            value=False
         )
         
         # File preview
@@ -113,12 +137,15 @@ class FileBrowserComponent:
         self.refresh_button.on_click(self.refresh_directory)
         self.path_input.param.watch(self.on_path_change, 'value')
         self.directory_contents.param.watch(self.on_file_selection, 'selection')
+        self.directory_contents.param.watch(self.on_page_change, 'page')
+        self.sort_select.param.watch(self.on_sort_change, 'value')
+        self.sort_descending.param.watch(self.on_sort_change, 'value')
         self.load_button.on_click(self.load_selected_file)
         self.add_to_data_button.on_click(self.add_file_to_data_manager)
         self.refresh_symbols_button.on_click(self.refresh_symbol_list)
     
     def load_directory_contents(self):
-        """Load and display the contents of the current directory"""
+        """Load the current directory listing and display its first page"""
         try:
             path = Path(self.current_path)
             if not path.exists():
@@ -129,79 +156,10 @@ class FileBrowserComponent:
                 self.status_display.object = f"**Status:** ❌ Not a directory: {self.current_path}"
                 return
             
-            # Get directory contents
-            contents = []
-            
-            # Add parent directory entry
-            if path.parent != path:
-                contents.append({
-                    'Name': '..',
-                    'Type': 'Directory',
-                    'Size': '',
-                    'Modified': '',
-                    'Path': str(path.parent),
-                    'Is Directory': True
-                })
-            
-            # Add directories
-            for item in sorted(path.iterdir()):
-                if item.is_dir():
-                    try:
-                        stat = item.stat()
-                        contents.append({
-                            'Name': f"📁 {item.name}",
-                            'Type': 'Directory',
-                            'Size': '',
-                            'Modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M'),
-                            'Path': str(item),
-                            'Is Directory': True
-                        })
-                    except (PermissionError, OSError):
-                        continue
-            
-            # Add files
-            for item in sorted(path.iterdir()):
-                if item.is_file():
-                    try:
-                        stat = item.stat()
-                        file_ext = item.suffix.lower()
-                        
-                        # Determine file type icon
-                        if file_ext in self.supported_extensions:
-                            icon = "📊"  # Data file
-                        elif file_ext in ['.txt', '.md', '.log']:
-                            icon = "📄"  # Text file
-                        elif file_ext in ['.py', '.js', '.html', '.css']:
-                            icon = "💻"  # Code file
-                        elif file_ext in ['.jpg', '.jpeg', '.png', '.gif', '.svg']:
-                            icon = "🖼️"  # Image file
-                        else:
-                            icon = "📄"  # Generic file
-                        
-                        contents.append({
-                            'Name': f"{icon} {item.name}",
-                            'Type': 'File',
-                            'Size': self.format_file_size(stat.st_size),
-                            'Modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M'),
-                            'Path': str(item),
-                            'Is Directory': False,
-                            'Extension': file_ext
-                        })
-                    except (PermissionError, OSError):
-                        continue
-            
-            # Create DataFrame and display
-            df = pd.DataFrame(contents)
-            if not df.empty:
-                # Reorder columns for display
-                display_columns = ['Name', 'Type', 'Size', 'Modified']
-                df_display = df[display_columns].copy()
-                self.directory_contents.value = df_display
-                # Store full data for selection handling
-                self.directory_contents._full_data = df
-            else:
-                self.directory_contents.value = pd.DataFrame(columns=['Name', 'Type', 'Size', 'Modified'])
-                self.directory_contents._full_data = pd.DataFrame()
+            # Scan names only; stat data is fetched per visible page
+            count = self.listing.load(str(path))
+            self.parent_rows = 1 if path.parent != path else 0
+            self.update_listing_table(page=1)
             
             # Update path display
             self.path_display.object = f"**Current Path:** {self.current_path}"
@@ -210,13 +168,65 @@ class FileBrowserComponent:
             # Update back button state
             self.back_button.disabled = len(self.file_history) == 0
             
-            self.status_display.object = f"**Status:** ✅ Loaded {len(contents)} items from {self.current_path}"
-            logger.info(f"Loaded directory contents: {len(contents)} items from {self.current_path}")
+            self.status_display.object = f"**Status:** ✅ Loaded {count} items from {self.current_path}"
+            logger.info(f"Loaded directory contents: {count} items from {self.current_path}")
             
         except Exception as e:
             logger.error(f"Error loading directory contents: {e}")
             self.status_display.object = f"**Status:** ❌ Error loading directory: {str(e)}"
     
+    def update_listing_table(self, page: int = 1):
+        """Push the listing (without stat data) to the table and fill in the given page"""
+        rows = self.listing.skeleton()
+        if self.parent_rows:
+            rows.insert(0, {'Name': '..', 'Type': 'Directory', 'Size': '', 'Modified': ''})
+        self.directory_contents.selection = []
+        self.directory_contents.value = pd.DataFrame(rows, columns=['Name', 'Type', 'Size', 'Modified'])
+        if self.directory_contents.page != page:
+            self.directory_contents.page = page  # fills the page via on_page_change
+        else:
+            self.fill_visible_page()
+    
+    def fill_visible_page(self):
+        """Stat the entries on the current page and patch their size and date into the table"""
+        page_size = self.directory_contents.page_size or self.PAGE_SIZE
+        start = (self.directory_contents.page - 1) * page_size
+        first = max(start - self.parent_rows, 0)
+        stop = start + page_size - self.parent_rows
+        rows = self.listing.page(first, stop, self.format_file_size)
+        offset = first + self.parent_rows
+        if rows:
+            self.directory_contents.patch({
+                'Size': [(offset + i, row['Size']) for i, row in enumerate(rows)],
+                'Modified': [(offset + i, row['Modified']) for i, row in enumerate(rows)]
+            })
+    
+    def get_listing_item(self, index: int) -> Optional[Dict[str, Any]]:
+        """Get the full row (path, stat data) for a table row index"""
+        if index < self.parent_rows:
+            return {'Name': '..', 'Type': 'Directory', 'Size': '', 'Modified': '',
+                    'Path': str(Path(self.current_path).parent), 'Is Directory': True}
+        index -= self.parent_rows
+        if index >= len(self.listing):
+            return None
+        return self.listing.entry(index, self.format_file_size)
+    
+    def on_page_change(self, event):
+        """Fetch stat data for the newly visible page"""
+        try:
+            self.fill_visible_page()
+        except Exception as e:
+            logger.error(f"Error loading directory page: {e}")
+    
+    def on_sort_change(self, event):
+        """Re-sort the listing server-side and return to the first page"""
+        try:
+            self.listing.sort(self.sort_select.value, self.sort_descending.value)
+            self.update_listing_table(page=1)
+        except Exception as e:
+            logger.error(f"Error sorting directory contents: {e}")
+            self.status_display.object = f"**Status:** ❌ Error sorting directory: {str(e)}"
+    
     def format_file_size(self, size_bytes: int) -> str:
         """Format file size in human-readable format"""
         if size_bytes == 0:
@@ -259,7 +269,7 @@ class FileBrowserComponent:
     def on_file_selection(self, event):
         """Handle file selection in the directory contents"""
         try:
-            if not event.new or not hasattr(self.directory_contents, '_full_data'):
+            if not event.new:
                 self.selected_file = None
                 self.load_button.disabled = True
                 self.add_to_data_button.disabled = True
@@ -276,14 +286,10 @@ class FileBrowserComponent:
                 return
             
             # Get the first selected item
-            selected_index = selected_indices[0]
-            full_data = self.directory_contents._full_data
-            
-            if selected_index >= len(full_data):
+            selected_item = self.get_listing_item(selected_indices[0])
+            if selected_item is None:
                 return
             
-            selected_item = full_data.iloc[selected_index]
-            
             if selected_item['Is Directory']:
                 # Navigate to directory
                 if selected_item['Name'] == '..':
@@ -344,6 +350,7 @@ class FileBrowserComponent:
             
             # Load preview based on file type
             preview_data = None
+            preview_info = {}
             
             if file_ext == '.csv':
                 preview_data = pd.read_csv(file_path, nrows=10)
@@ -351,22 +358,9 @@ class FileBrowserComponent:
                 preview_data = pd.read_json(file_path, lines=True, nrows=10)
             elif file_ext == '.xlsx' or file_ext == '.xls':
                 preview_data = pd.read_excel(file_path, nrows=10)
-            elif file_ext == '.feather':
-                preview_data = pd.read_feather(file_path)
-                preview_data = preview_data.head(10)
-            elif file_ext == '.parquet':
-                preview_data = pd.read_parquet(file_path)
-                preview_data = preview_data.head(10)
-            elif file_ext in ['.db', '.sqlite', '.duckdb']:
-                # For database files, show available tables
-                import sqlite3
-                try:
-                    conn = sqlite3.connect(file_path)
-                    tables = pd.read_sql_query("SELECT name FROM sqlite_master WHERE type='table'", conn)
-                    conn.close()
-                    preview_data = tables
-                except:
-                    preview_data = pd.DataFrame({'Note': ['Database file - use Load File to explore tables']})
+            elif file_ext in ['.feather', '.parquet', '.db', '.sqlite', '.duckdb']:
+                # Columnar and database files: footer/schema metadata plus the first rows only
+                preview_data, preview_info = self.preview_reader.preview(file_path)
             else:
                 # For unsupported files, show basic info
                 preview_data = pd.DataFrame({
@@ -377,7 +371,15 @@ class FileBrowserComponent:
                 })
             
             self.file_preview.value = preview_data
-            self.status_display.object = f"**Status:** ✅ Loaded preview of {path.name}"
+            details = []
+            if preview_info.get('rows') is not None:
+                details.append(f"{preview_info['rows']:,} rows")
+            if preview_info.get('columns') is not None:
+                details.append(f"{preview_info['columns']} columns")
+            if preview_info.get('tables'):
+                details.append(f"tables: {', '.join(preview_info['tables'])}")
+            suffix = f" ({'; '.join(details)})" if details else ""
+            self.status_display.object = f"**Status:** ✅ Loaded preview of {path.name}{suffix}"
             
         except Exception as e:
             logger.error(f"Error loading file preview: {e}")
@@ -469,7 +471,7 @@ class FileBrowserComponent:
             })
             
             # Update symbol list if the data contains symbol information
-            self.update_symbol_list_from_data(processed_data)
+            self.update_symbol_list_from_data(dataset_id)
             
             self.status_display.object = f"**Status:** ✅ Added {filename} to data manager as dataset {dataset_id}"
             logger.info(f"Added file to data manager: {filename} -> {dataset_id}")
@@ -478,36 +480,21 @@ class FileBrowserComponent:
             logger.error(f"Error adding file to data manager: {e}")
             self.status_display.object = f"**Status:** ❌ Error adding to data manager: {str(e)}"
     
-    def update_symbol_list_from_data(self, data):
-        """Update the symbol list based on loaded data"""
+    def update_symbol_list_from_data(self, dataset_id: Optional[str]):
+        """Report the symbols the symbol index recorded when a dataset was added"""
         try:
-            if data is None or data.empty:
+            symbol_index = getattr(getattr(self.data_manager, 'core', None), 'symbol_index', None)
+            if not dataset_id or symbol_index is None:
                 return
             
-            # Extract symbols using the improved extraction method
-            found_symbols = self.extract_symbols_from_data(data)
-            
-            # Update the data manager's symbol list
-            if found_symbols:
-                # Convert to list and sort
-                unique_symbols = sorted(list(found_symbols))
-                
-                # Update the data manager's symbols
-                if hasattr(self.data_manager, 'core') and hasattr(self.data_manager.core, 'symbols'):
-                    # Add new symbols to existing list
-                    existing_symbols = set(self.data_manager.core.symbols)
-                    new_symbols = [s for s in unique_symbols if s not in existing_symbols]
-                    
-                    if new_symbols:
-                        self.data_manager.core.symbols.extend(new_symbols)
-                        self.data_manager.core.symbols.sort()
-                        logger.info(f"Updated symbol list with {len(new_symbols)} new symbols: {new_symbols}")
-                        
-                        # Trigger symbol list update callback if available
-                        if hasattr(self.data_manager, 'on_symbols_updated'):
-                            self.data_manager.on_symbols_updated(new_symbols)
+            # The dataset was indexed once at ingest; this is a lookup, not a rescan
+            symbols = symbol_index.get_dataset_symbols(dataset_id)
+            if symbols:
+                self.status_display.object = f"**Status:** ✅ Indexed {len(symbols)} symbols from {dataset_id}"
                 
-                self.status_display.object = f"**Status:** ✅ Updated symbol list with {len(unique_symbols)} symbols"
+                # Trigger symbol list update callback if available
+                if hasattr(self.data_manager, 'on_symbols_updated'):
+                    self.data_manager.on_symbols_updated(symbols)
             else:
                 self.status_display.object = f"**Status:** ℹ️ No symbols detected in data"
                 
@@ -516,9 +503,10 @@ class FileBrowserComponent:
             # Don't fail the entire operation if symbol update fails
     
     def refresh_symbol_list(self, event=None):
-        """Refresh the symbol list from all loaded datasets"""
+        """Refresh the symbol list from the symbol index, indexing only datasets it has not seen"""
         try:
-            if not hasattr(self.data_manager, 'core') or not hasattr(self.data_manager.core, 'symbols'):
+            core = getattr(self.data_manager, 'core', None)
+            if core is None or not hasattr(core, 'symbol_index'):
                 self.status_display.object = "**Status:** ❌ Data manager not properly initialized"
                 return
             
@@ -528,21 +516,21 @@ class FileBrowserComponent:
                 self.status_display.object = "**Status:** ℹ️ No uploaded datasets found"
                 return
             
-            all_symbols = set()
-            
-            # Extract symbols from all datasets
-            for dataset_id, dataset_info in uploaded_datasets.items():
-                if 'data' in dataset_info and dataset_info['data'] is not None:
-                    data = dataset_info['data']
-                    symbols = self.extract_symbols_from_data(data)
-                    all_symbols.update(symbols)
+            # Drop removed datasets and index new ones; unchanged datasets cost nothing
+            dropped = core.symbol_index.sync(uploaded_datasets)
+            indexed = 0
+            for dataset_id in uploaded_datasets:
+                if not core.symbol_index.is_indexed(dataset_id):
+                    core.index_dataset_symbols(dataset_id)
+                    indexed += 1
             
             # Update the symbol list
-            if all_symbols:
-                unique_symbols = sorted(list(all_symbols))
-                self.data_manager.core.symbols = unique_symbols
-                self.status_display.object = f"**Status:** ✅ Refreshed symbol list with {len(unique_symbols)} symbols"
-                logger.info(f"Refreshed symbol list with {len(unique_symbols)} symbols: {unique_symbols}")
+            unique_symbols = core.symbol_index.get_symbols()
+            if unique_symbols:
+                core.symbols = unique_symbols
+                self.status_display.object = (f"**Status:** ✅ Refreshed symbol list with {len(unique_symbols)} symbols "
+                                              f"({indexed} datasets indexed, {dropped} dropped)")
+                logger.info(f"Refreshed symbol list with {len(unique_symbols)} symbols")
             else:
                 self.status_display.object = "**Status:** ℹ️ No symbols found in uploaded datasets"
                 
@@ -696,6 +684,8 @@ class FileBrowserComponent:
                 self.back_button,
                 self.home_button,
                 self.refresh_button,
+                self.sort_select,
+                self.sort_descending,
                 align='center'
             ),
             
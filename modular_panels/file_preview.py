@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+TradePulse File Preview
+Metadata-only previews for columnar and database files
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import sqlite3
+import duckdb
+import logging
+import os
+from typing import Dict, Any, Tuple, Optional
+
+logger = logging.getLogger(__name__)
+
+class FilePreviewReader:
+    """Read the first rows of large files without loading them
+
+    - Parquet: schema and row count come from the footer; rows from the first row group
+    - Feather/Arrow IPC: the file is memory-mapped; rows come from the first record batch
+    - SQLite/DuckDB: read-only connection, table list and a LIMIT query on the first table
+    """
+
+    PREVIEW_ROWS = int(os.getenv('TRADEPULSE_PREVIEW_ROWS', '10'))
+    SQLITE_MAGIC = b'SQLite format 3\x00'
+
+    def __init__(self, preview_rows: Optional[int] = None):
+        self.preview_rows = preview_rows or self.PREVIEW_ROWS
+
+    def preview(self, file_path: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """Get preview rows and file info (rows, columns, tables) for a supported file"""
+        file_ext = os.path.splitext(file_path)[1].lower()
+        if file_ext == '.parquet':
+            return self.preview_parquet(file_path)
+        if file_ext in ['.feather', '.arrow']:
+            return self.preview_arrow(file_path)
+        if file_ext == '.duckdb':
+            return self.preview_duckdb(file_path)
+        if file_ext in ['.db', '.sqlite']:
+            with open(file_path, 'rb') as f:
+                is_sqlite = f.read(len(self.SQLITE_MAGIC)) == self.SQLITE_MAGIC
+            return self.preview_sqlite(file_path) if is_sqlite else self.preview_duckdb(file_path)
+        raise ValueError(f"No metadata preview for {file_ext} files")
+
+    def preview_parquet(self, file_path: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """Read the footer and the first rows of the first row group"""
+        parquet_file = pq.ParquetFile(file_path)
+        metadata = parquet_file.metadata
+        preview = pd.DataFrame(columns=parquet_file.schema_arrow.names)
+        if metadata.num_row_groups:
+            batch = next(parquet_file.iter_batches(batch_size=self.preview_rows, row_groups=[0]), None)
+            if batch is not None:
+                preview = batch.to_pandas()
+        return preview, {
+            'rows': metadata.num_rows,
+            'columns': metadata.num_columns,
+            'row_groups': metadata.num_row_groups,
+            'schema': str(parquet_file.schema_arrow)
+        }
+
+    def preview_arrow(self, file_path: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """Memory-map an Arrow IPC (Feather v2) file and slice its first record batch"""
+        with pa.memory_map(file_path, 'r') as source:
+            try:
+                reader = pa.ipc.open_file(source)
+            except pa.ArrowInvalid:
+                # Feather v1 has no IPC footer; the mapped read is still zero-copy
+                import pyarrow.feather as feather
+                table = feather.read_table(source, memory_map=True)
+                return table.slice(0, self.preview_rows).to_pandas(), {
+                    'rows': table.num_rows, 'columns': table.num_columns, 'schema': str(table.schema)
+                }
+            preview = pd.DataFrame(columns=reader.schema.names)
+            if reader.num_record_batches:
+                preview = reader.get_batch(0).slice(0, self.preview_rows).to_pandas()
+            return preview, {
+                'rows': reader.count_rows(),
+                'columns': len(reader.schema),
+                'record_batches': reader.num_record_batches,
+                'schema': str(reader.schema)
+            }
+
+    def preview_sqlite(self, file_path: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """List tables and LIMIT-query the first one over a read-only connection"""
+        con = sqlite3.connect(f"file:{file_path}?mode=ro", uri=True)
+        try:
+            tables = [row[0] for row in con.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'")]
+            if not tables:
+                return pd.DataFrame({'Note': ['Database has no tables']}), {'tables': []}
+            preview = pd.read_sql_query(f'SELECT * FROM "{tables[0]}" LIMIT {self.preview_rows}', con)
+            return preview, {'tables': tables, 'table': tables[0], 'columns': len(preview.columns)}
+        finally:
+            con.close()
+
+    def preview_duckdb(self, file_path: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """List tables (with DuckDB's stored row estimates) and LIMIT-query the first one"""
+        con = duckdb.connect(file_path, read_only=True)
+        try:
+            tables = con.execute(
+                "SELECT table_name, estimated_size, column_count FROM duckdb_tables() ORDER BY table_name"
+            ).fetchall()
+            if not tables:
+                return pd.DataFrame({'Note': ['Database has no tables']}), {'tables': []}
+            table_name, estimated_rows, column_count = tables[0]
+            preview = con.execute(f'SELECT * FROM "{table_name}" LIMIT {self.preview_rows}').fetchdf()
+            return preview, {
+                'tables': [row[0] for row in tables],
+                'table': table_name,
+                'rows': estimated_rows,
+                'columns': column_count
+            }
+        finally:
+            con.close()
@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+"""
+Shared pytest setup: put the project root on the import path
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached multi-resolution OHLCV bar pyramid
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ui_components.bar_pyramid import OHLCVBarPyramid
+
+def make_minute_bars(days=2):
+    index = pd.date_range('2024-01-01', periods=days * 1440, freq='1min')
+    close = 100 + np.cumsum(np.random.default_rng(7).normal(0, 0.1, len(index)))
+    return pd.DataFrame({'Date': index, 'Open': close - 0.05, 'High': close + 0.2,
+                         'Low': close - 0.2, 'Close': close, 'Volume': 1.0})
+
+def test_build_starts_at_the_raw_resolution():
+    levels = OHLCVBarPyramid().build('AAPL', make_minute_bars())
+    assert list(levels) == ['1m', '5m', '15m', '1h', '1d']
+    assert [len(levels[tf]) for tf in levels] == [2880, 576, 192, 48, 2]
+
+    daily = OHLCVBarPyramid().build('AAPL', make_minute_bars().iloc[::1440])
+    assert list(daily) == ['1d']
+
+def test_aggregated_levels_match_pandas_resample():
+    bars = make_minute_bars()
+    hourly = OHLCVBarPyramid().build('AAPL', bars)['1h']
+    expected = bars.set_index('Date').resample('1h').agg(
+        {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'})
+    pd.testing.assert_frame_equal(hourly, expected, check_names=False, check_freq=False)
+
+@pytest.mark.parametrize('max_bars,level_length', [(5000, 2880), (2880, 2880), (1000, 576), (100, 48), (10, 2), (1, 2)])
+def test_max_bars_picks_the_finest_level_within_budget(max_bars, level_length):
+    pyramid = OHLCVBarPyramid()
+    pyramid.build('AAPL', make_minute_bars())
+    assert len(pyramid.get('AAPL', max_bars=max_bars)) == level_length
+
+def test_max_bars_is_measured_over_the_requested_range():
+    pyramid = OHLCVBarPyramid()
+    pyramid.build('AAPL', make_minute_bars())
+    window = pyramid.get('AAPL', start='2024-01-01 10:00', end='2024-01-01 11:59', max_bars=150)
+    assert len(window) == 120 and window['Date'].diff().dropna().eq(pd.Timedelta('1min')).all()
+
+    zoomed_out = pyramid.get('AAPL', start='2024-01-01', end='2024-01-02 23:59', max_bars=150)
+    assert len(zoomed_out) == 48
+
+def test_intermediate_timeframe_is_aggregated_once():
+    pyramid = OHLCVBarPyramid()
+    pyramid.build('AAPL', make_minute_bars())
+    aggregations = pyramid.stats['aggregations']
+    bars = pyramid.get('AAPL', timeframe='4h')
+    assert len(bars) == 12
+    pyramid.get('AAPL', timeframe='4h')
+    assert pyramid.stats['aggregations'] == aggregations + 1
+
+def test_get_or_build_reloads_on_new_version():
+    pyramid = OHLCVBarPyramid()
+    calls = []
+    def loader():
+        calls.append(1)
+        return make_minute_bars(days=1)
+    pyramid.get_or_build('AAPL', loader, version=1, timeframe='1h')
+    pyramid.get_or_build('AAPL', loader, version=1, timeframe='1h')
+    assert len(calls) == 1 and pyramid.stats['hits'] == 1
+    pyramid.get_or_build('AAPL', loader, version=2, timeframe='1h')
+    assert len(calls) == 2
+
+def test_least_recently_used_series_is_evicted():
+    pyramid = OHLCVBarPyramid(max_series=2)
+    bars = make_minute_bars(days=1)
+    pyramid.build('A', bars)
+    pyramid.build('B', bars)
+    pyramid.get('A', timeframe='1d')
+    pyramid.build('C', bars)
+    assert pyramid.get('B').empty and not pyramid.get('A').empty
+
+def test_duplicate_timestamps_keep_one_bar():
+    bars = make_minute_bars(days=1)
+    suffixed = bars.assign(Symbol='AAPL.US', Close=bars['Close'] + 50)
+    mixed = pd.concat([bars.assign(Symbol='AAPL'), suffixed], ignore_index=True)
+    levels = OHLCVBarPyramid().build('AAPL', mixed)
+    assert levels['1m'].index.is_unique and len(levels['1m']) == 1440
+    assert levels['1m']['Close'].tolist() == suffixed['Close'].tolist()
+    assert levels['1d']['Volume'].tolist() == [1440.0]
+
+def test_rows_of_several_symbols_are_rejected():
+    bars = make_minute_bars(days=1)
+    mixed = pd.concat([bars.assign(Symbol='AAPL'), bars.assign(Symbol='MSFT')], ignore_index=True)
+    with pytest.raises(ValueError, match='several symbols'):
+        OHLCVBarPyramid().build('AAPL', mixed)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for batch indicators against per-symbol pandas rolling/ewm
+"""
+
+import numpy as np
+import pandas as pd
+
+from ui_components.batch_indicators import BatchIndicators
+
+def make_matrix(bars=80, symbols=3, seed=0):
+    rng = np.random.default_rng(seed)
+    values = 100 + rng.standard_normal((bars, symbols)).cumsum(axis=0)
+    values[:15, -1] = np.nan   # the last symbol lists later
+    return values
+
+def wilder_rsi(close, n):
+    """Wilder RSI for one series: seeded with the mean of the first n deltas, then alpha = 1/n"""
+    delta = close.diff().iloc[1:]
+    rsi = pd.Series(np.nan, index=close.index)
+    if len(delta) < n:
+        return rsi
+    smooth = lambda s: pd.concat([pd.Series([s.iloc[:n].mean()]), s.iloc[n:]]).ewm(alpha=1 / n, adjust=False).mean()
+    gain, loss = smooth(delta.clip(lower=0.0)).to_numpy(), smooth((-delta).clip(lower=0.0)).to_numpy()
+    rsi.iloc[n:] = 100.0 - 100.0 / (1.0 + gain / loss)
+    return rsi
+
+def per_column(values, reference):
+    """Apply a pandas reference to each symbol's listed bars and reassemble the matrix"""
+    result = np.full(values.shape, np.nan)
+    for j in range(values.shape[1]):
+        column = pd.Series(values[:, j])
+        listed = column.dropna()
+        result[listed.index, j] = reference(listed.reset_index(drop=True)).to_numpy()
+    return result
+
+def test_window_indicators_match_pandas_rolling():
+    values = make_matrix()
+    np.testing.assert_allclose(BatchIndicators.rolling_mean(values, 20),
+                               per_column(values, lambda s: s.rolling(20).mean()), rtol=1e-9)
+    np.testing.assert_allclose(BatchIndicators.rolling_std(values, 20),
+                               per_column(values, lambda s: s.rolling(20).std()), rtol=1e-9)
+    zscore = lambda s: (s - s.rolling(20).mean()) / s.rolling(20).std()
+    np.testing.assert_allclose(BatchIndicators.zscore(values, 20), per_column(values, zscore), rtol=1e-9)
+
+def test_recursive_indicators_match_pandas_ewm():
+    values = make_matrix(seed=1)
+    np.testing.assert_allclose(BatchIndicators.ema(values, 12),
+                               per_column(values, lambda s: s.ewm(span=12, adjust=True).mean()), rtol=1e-9)
+    np.testing.assert_allclose(BatchIndicators.rsi(values, 14),
+                               per_column(values, lambda s: wilder_rsi(s, 14)), rtol=1e-9)
+
+def test_atr_matches_pandas_wilder():
+    close = make_matrix(seed=2)
+    high, low = close + 1.5, close - 1.0
+    def reference(j):
+        frame = pd.DataFrame({'h': high[:, j], 'l': low[:, j], 'c': close[:, j]}).dropna().reset_index(drop=True)
+        true_range = pd.concat([frame['h'] - frame['l'], (frame['h'] - frame['c'].shift()).abs(),
+                                (frame['l'] - frame['c'].shift()).abs()], axis=1).max(axis=1)
+        seeded = pd.concat([pd.Series([true_range.iloc[:14].mean()]), true_range.iloc[14:]])
+        return np.concatenate([np.full(13, np.nan), seeded.ewm(alpha=1 / 14, adjust=False).mean().to_numpy()])
+    atr = BatchIndicators.atr(high, low, close, 14)
+    for j in range(close.shape[1]):
+        listed = ~np.isnan(close[:, j])
+        np.testing.assert_allclose(atr[listed, j], reference(j), rtol=1e-9)
+
+def test_load_duckdb_applies_date_bounds_on_the_stored_type(tmp_path):
+    import duckdb
+    path = str(tmp_path / 'redline.duckdb')
+    conn = duckdb.connect(path)
+    conn.execute("CREATE TABLE data AS SELECT s AS Symbol, CAST(d AS DATE) AS date, 1.0 AS close "
+                 "FROM range(DATE '2024-01-01', DATE '2024-01-11', INTERVAL 1 DAY) t(d), (VALUES ('A'), ('B')) v(s)")
+    conn.close()
+    data = BatchIndicators.load_duckdb(path, '2024-01-03', '2024-01-04', symbols=['B'])
+    assert data['Symbol'].tolist() == ['B', 'B']
+    assert pd.to_datetime(data['Date']).dt.day.tolist() == [3, 4]
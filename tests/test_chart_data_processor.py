@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Tests for zoom-window re-sampling in the chart data processor
+"""
+
+import numpy as np
+import pandas as pd
+
+from modular_panels.charts.chart_data_processor import ChartDataProcessor
+
+def make_data(rows=100):
+    return pd.DataFrame({
+        'Date': pd.date_range('2024-01-01', periods=rows, freq='D'),
+        'Open': np.arange(rows, dtype=float), 'High': np.arange(rows, dtype=float) + 1,
+        'Low': np.arange(rows, dtype=float) - 1, 'Close': np.arange(rows, dtype=float),
+        'Volume': np.full(rows, 10)
+    })
+
+def test_line_zoom_slices_the_date_range():
+    chart = ChartDataProcessor().generate_chart_data(
+        'Line', {'d': make_data()}, 'All', x_range=('2024-01-11', '2024-01-20'))['d']
+    assert chart['Date'].min() == pd.Timestamp('2024-01-11')
+    assert chart['Date'].max() == pd.Timestamp('2024-01-20')
+
+def test_scatter_zoom_filters_on_the_plotted_x_column():
+    data = pd.DataFrame({'Date': pd.date_range('2024-01-01', periods=100, freq='D'),
+                         'Return': np.linspace(-5.0, 5.0, 100), 'Volume': np.arange(100)})
+    chart = ChartDataProcessor().generate_chart_data('Scatter', {'d': data}, 'All', x_range=(-1.0, 1.0))['d']
+    assert list(chart.columns) == ['Return', 'Volume']
+    assert not chart.empty
+    assert chart['Return'].between(-1.0, 1.0).all()
+    assert len(chart) == int(data['Return'].between(-1.0, 1.0).sum())
+
+def test_bar_zoom_keeps_every_row():
+    data = pd.DataFrame({'Symbol': list('ABCDE') * 4, 'Volume': np.arange(20)})
+    chart = ChartDataProcessor().generate_chart_data('Bar', {'d': data}, 'All', x_range=(2.5, 7.5))['d']
+    assert len(chart) == 20
+
+def test_window_without_date_column_matches_index_labels():
+    data = pd.DataFrame({'Close': np.arange(10.0)}, index=range(100, 110))
+    window = ChartDataProcessor().filter_data_by_window(data, 102.5, 105, column='Date')
+    assert window.index.tolist() == [103, 104, 105]
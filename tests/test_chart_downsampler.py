@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for LTTB and OHLC-bucket chart downsampling
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modular_panels.charts.chart_downsampler import ChartDownsampler
+
+def make_candles(rows=10_000):
+    close = 100 + np.cumsum(np.random.default_rng(3).normal(0, 1, rows))
+    return pd.DataFrame({
+        'Date': pd.date_range('2020-01-01', periods=rows, freq='h'),
+        'Open': close + 0.5, 'High': close + 2, 'Low': close - 2, 'Close': close,
+        'Volume': np.arange(rows, dtype=np.int64)
+    })
+
+@pytest.mark.parametrize('n,n_out', [(10, 3), (1000, 100), (1001, 1000), (5000, 7)])
+def test_lttb_keeps_endpoints_one_point_per_bucket(n, n_out):
+    x = np.arange(n, dtype=float)
+    y = np.sin(x / 10)
+    keep = ChartDownsampler().lttb_indices(x, y, n_out)
+    assert len(keep) == n_out
+    assert keep[0] == 0 and keep[-1] == n - 1
+    assert np.all(np.diff(keep) > 0)
+    # Every interior point comes from its own bucket of the n - 2 interior rows
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    assert np.all((keep[1:-1] >= edges[:-1]) & (keep[1:-1] < edges[1:]))
+
+def test_lttb_keeps_isolated_spikes():
+    y = np.zeros(10_000)
+    y[[1234, 7777]] = [50.0, -50.0]
+    keep = ChartDownsampler().lttb_indices(np.arange(10_000, dtype=float), y, 100)
+    assert {1234, 7777} <= set(keep)
+
+def test_lttb_returns_every_row_when_nothing_to_drop():
+    keep = ChartDownsampler().lttb_indices(np.arange(5.0), np.arange(5.0), 10)
+    assert keep.tolist() == [0, 1, 2, 3, 4]
+
+def test_lttb_tolerates_missing_values():
+    y = np.sin(np.arange(1000) / 10)
+    y[100:200] = np.nan
+    keep = ChartDownsampler().lttb_indices(np.arange(1000, dtype=float), y, 50)
+    assert len(keep) == 50 and np.all(np.diff(keep) > 0)
+
+@pytest.mark.parametrize('max_points', [1, 7, 500, 9_999])
+def test_ohlc_buckets_preserve_extremes_and_totals(max_points):
+    data = make_candles()
+    bars = ChartDownsampler().downsample_ohlc(data, max_points)
+    assert len(bars) <= max_points
+    assert bars['Open'].iloc[0] == data['Open'].iloc[0]
+    assert bars['Close'].iloc[-1] == data['Close'].iloc[-1]
+    assert bars['High'].max() == data['High'].max() and bars['Low'].min() == data['Low'].min()
+    assert bars['Volume'].sum() == data['Volume'].sum()
+    assert bars['Date'].is_monotonic_increasing and bars['Date'].iloc[0] == data['Date'].iloc[0]
+
+def test_ohlc_bucket_values_match_their_rows():
+    data = make_candles(rows=100)
+    bars = ChartDownsampler().downsample_ohlc(data, 10)
+    for start, (label, bar) in zip(range(0, 100, 10), bars.iterrows()):
+        rows = data.iloc[start:start + 10]
+        assert label == start
+        assert bar['Open'] == rows['Open'].iloc[0] and bar['Close'] == rows['Close'].iloc[-1]
+        assert bar['High'] == rows['High'].max() and bar['Low'] == rows['Low'].min()
+        assert bar['Volume'] == rows['Volume'].sum()
+
+def test_downsample_dispatches_on_chart_type():
+    data = make_candles()
+    sampler = ChartDownsampler(max_points=200)
+    assert len(sampler.downsample('Candlestick', data)) == 200
+    line = sampler.downsample('Line', data[['Date', 'Close']])
+    assert len(line) == 200 and line['Date'].is_monotonic_increasing
+    scatter = sampler.downsample('Scatter', data[['Close', 'Volume']].sample(frac=1, random_state=0))
+    assert len(scatter) == 200 and scatter['Close'].is_monotonic_increasing
+    assert len(sampler.downsample('Bar', data)) == len(data)
+    assert len(sampler.downsample('Line', data.head(50))) == 50
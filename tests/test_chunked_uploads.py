@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for resumable chunked uploads
+"""
+
+import hashlib
+import os
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.chunked_uploads import ChunkedUploadManager
+from api.endpoints import file_upload_endpoints, file_import_endpoints
+from ui_components.global_data_store import get_global_data_store
+
+CSV = b'Date,Symbol,Close\n' + b''.join(b'2024-01-%02d,AAPL,%d\n' % (day, day) for day in range(1, 29))
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(file_upload_endpoints, 'chunked_uploads', ChunkedUploadManager(str(tmp_path / 'sessions')))
+    monkeypatch.setattr(file_upload_endpoints, 'UPLOAD_DATA_DIR', tmp_path / 'upload_data')
+    monkeypatch.setattr(file_import_endpoints, 'uploaded_files', {})
+    app = FastAPI()
+    app.include_router(file_upload_endpoints.router, prefix='/api/v1/files')
+    return TestClient(app)
+
+def put_chunk(client, upload_id, offset, data, checksum=None):
+    headers = {'X-Chunk-SHA256': checksum or hashlib.sha256(data).hexdigest()}
+    return client.put(f'/api/v1/files/uploads/{upload_id}/chunks', params={'offset': offset},
+                      content=data, headers=headers)
+
+def test_resume_after_rejected_chunks_and_register(client, tmp_path):
+    session = client.post('/api/v1/files/uploads', json={
+        'filename': 'prices.csv', 'total_size': len(CSV), 'sha256': hashlib.sha256(CSV).hexdigest()}).json()
+    upload_id, half = session['upload_id'], len(CSV) // 2
+
+    assert put_chunk(client, upload_id, 0, CSV[:half]).json()['offset'] == half
+    # Out-of-order and corrupt chunks are rejected without moving the committed offset
+    assert put_chunk(client, upload_id, half + 10, CSV[half + 10:]).status_code == 409
+    assert put_chunk(client, upload_id, half, CSV[half:], checksum='0' * 64).status_code == 422
+    assert client.post(f'/api/v1/files/uploads/{upload_id}/complete').status_code == 409
+
+    offset = client.get(f'/api/v1/files/uploads/{upload_id}').json()['offset']
+    assert offset == half
+    assert put_chunk(client, upload_id, offset, CSV[offset:]).json()['offset'] == len(CSV)
+
+    result = client.post(f'/api/v1/files/uploads/{upload_id}/complete').json()
+    assert result['file_path'].endswith('.parquet') and result['ingest']['rows'] == 28
+    assert result['file_id'] in file_import_endpoints.uploaded_files
+    data = get_global_data_store().get_dataset_view(result['dataset_id'])
+    assert len(data) == 28 and data['Close'].sum() == sum(range(1, 29))
+    manifest = file_upload_endpoints._get_data_access().file_ops.manifest
+    assert any(entry['symbols'] == ['AAPL'] for entry in manifest.files.values())
+
+def test_abort_discards_the_session(client, tmp_path):
+    upload_id = client.post('/api/v1/files/uploads', json={'filename': 'a.csv', 'total_size': 10}).json()['upload_id']
+    put_chunk(client, upload_id, 0, b'12345')
+    assert client.delete(f'/api/v1/files/uploads/{upload_id}').status_code == 200
+    assert client.get(f'/api/v1/files/uploads/{upload_id}').status_code == 404
+    assert list((tmp_path / 'sessions').iterdir()) == []
+
+def test_initiate_sweeps_idle_sessions(tmp_path):
+    manager = ChunkedUploadManager(str(tmp_path))
+    idle = manager.initiate('old.csv', 10)['upload_id']
+    manager._session_lock(idle)
+    manager._session_lock('unknown')   # e.g. left by a complete() for an id that never existed
+    stale = time.time() - manager.SESSION_TTL - 60
+    for suffix in ('.json', '.part'):
+        os.utime(tmp_path / f"{idle}{suffix}", (stale, stale))
+
+    active = manager.initiate('new.csv', 10)['upload_id']
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([f"{active}.json", f"{active}.part"])
+    assert list(manager._locks) == []
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for the columnar, memory-mapped dataset store
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ui_components.global_data_store_columnar import ColumnarDatasetStore
+
+def make_data():
+    return pd.DataFrame({'Date': pd.date_range('2024-01-01', periods=4), 'Symbol': ['A', 'B', 'A', 'B'],
+                         'Close': [1.0, 2.0, np.nan, 4.0], 'Volume': [10, 20, 30, 40]})
+
+def test_round_trip_is_memory_mapped(tmp_path):
+    store = ColumnarDatasetStore(str(tmp_path))
+    store['prices'] = make_data()
+    assert store.is_mapped('prices')
+    assert store.num_rows('prices') == 4
+    loaded = store['prices']
+    pd.testing.assert_frame_equal(loaded.astype(make_data().dtypes), make_data())
+    assert store.read_table('prices').column('Close').null_count == 1
+
+def test_datasets_and_metadata_reload_from_disk(tmp_path):
+    store = ColumnarDatasetStore(str(tmp_path))
+    store['prices/2024'] = make_data()
+    store.write_metadata('prices/2024', {'source': 'upload'})
+
+    reopened = ColumnarDatasetStore(str(tmp_path))
+    assert list(reopened) == ['prices/2024']
+    assert reopened.read_metadata('prices/2024')['source'] == 'upload'
+    assert reopened.num_rows('prices/2024') == 4
+
+def test_sanitized_ids_do_not_collide(tmp_path):
+    store = ColumnarDatasetStore(str(tmp_path))
+    for dataset_id, rows in [('a/b', 4), ('a_b', 1), ('a:b', 2)]:
+        store[dataset_id] = make_data().iloc[:rows]
+        store.write_metadata(dataset_id, {})
+    assert len({store._path_for(i) for i in ('a/b', 'a_b', 'a:b')}) == 3
+    assert [store.num_rows(i) for i in ('a/b', 'a_b', 'a:b')] == [4, 1, 2]
+
+    reopened = ColumnarDatasetStore(str(tmp_path))
+    assert [reopened.num_rows(i) for i in ('a/b', 'a_b', 'a:b')] == [4, 1, 2]
+
+def test_delete_removes_data_and_metadata(tmp_path):
+    store = ColumnarDatasetStore(str(tmp_path))
+    store['a/b'] = make_data()
+    store.write_metadata('a/b', {})
+    del store['a/b']
+    assert 'a/b' not in store
+    assert list(tmp_path.iterdir()) == []
+
+def test_unconvertible_frame_stays_in_memory(tmp_path):
+    store = ColumnarDatasetStore(str(tmp_path))
+    mixed = pd.DataFrame({'Value': [1, 'x', 2.5]})
+    store['mixed'] = mixed
+    assert 'mixed' in store and not store.is_mapped('mixed')
+    assert store['mixed']['Value'].tolist() == [1, 'x', 2.5]
+    assert store.resident_bytes() > 0
+
+def test_deleting_an_in_memory_dataset_removes_its_metadata(tmp_path):
+    store = ColumnarDatasetStore(str(tmp_path))
+    store['mixed'] = make_data()
+    store.write_metadata('mixed', {'source': 'upload'})
+    store['mixed'] = pd.DataFrame({'Value': [1, 'x', 2.5]})   # replaced by a frame Arrow cannot store
+    assert not store.is_mapped('mixed')
+    del store['mixed']
+    assert 'mixed' not in store
+    assert list(tmp_path.iterdir()) == []
+    assert list(ColumnarDatasetStore(str(tmp_path))) == []
+    with pytest.raises(KeyError):
+        del store['mixed']
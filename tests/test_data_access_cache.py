@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded, single-flight DataAccessManager cache
+"""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from ui_components import data_access_cache
+from ui_components.data_access_cache import DataAccessCache
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(data_access_cache.time, 'monotonic', clock)
+    return clock
+
+def test_concurrent_misses_fetch_once():
+    cache = DataAccessCache()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return pd.DataFrame({'Close': [1.0]})
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_fetch('AAPL', fetch))) for _ in range(8)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while cache.get_stats()['coalesced'] < 7 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1 and len(results) == 8
+    assert all(result is results[0] for result in results)
+    stats = cache.get_stats()
+    assert stats['misses'] == 1 and stats['coalesced'] == 7 and stats['in_flight'] == 0
+    assert cache.get_or_fetch('AAPL', fetch) is results[0]
+    assert len(calls) == 1
+
+def test_failed_fetch_reaches_every_waiter_and_is_not_cached():
+    cache = DataAccessCache()
+    with pytest.raises(RuntimeError):
+        cache.get_or_fetch('AAPL', lambda: (_ for _ in ()).throw(RuntimeError('down')))
+    assert 'AAPL' not in cache
+    assert cache.get_or_fetch('AAPL', lambda: 'ok') == 'ok'
+
+def test_entries_expire_after_their_ttl(clock):
+    cache = DataAccessCache(ttl=60)
+    cache.put('default', 'a')
+    cache.put('short', 'b', ttl=5)
+    clock.now += 10
+    assert cache.get('short') is None and cache.get('default') == 'a'
+    clock.now += 60
+    assert cache.get('default') is None
+    assert cache.get_stats()['expirations'] == 2
+    assert cache.get_or_fetch('default', lambda: 'fresh') == 'fresh'
+
+def test_least_recently_used_entry_is_evicted_by_count():
+    cache = DataAccessCache(max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    assert cache.keys() == ['a', 'c']
+    assert cache.get_stats()['evictions'] == 1
+
+def test_byte_bound_evicts_and_skips_oversized_values():
+    frame = pd.DataFrame({'Close': range(1000)})
+    size = int(frame.memory_usage(deep=True).sum())
+    cache = DataAccessCache(max_bytes=int(size * 2.5))
+    for key in 'abc':
+        cache.put(key, frame.copy())
+    assert cache.keys() == ['b', 'c']
+    assert cache.get_stats()['total_bytes'] == 2 * size
+    cache.put('huge', pd.concat([frame] * 3))
+    assert 'huge' not in cache and cache.keys() == ['b', 'c']
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for ingest-time dtype compaction
+"""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from ui_components.dataset_compactor import DatasetCompactor
+
+ROWS = 1000
+
+def make_data():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'Symbol': rng.choice(['AAPL', 'MSFT'], ROWS).astype(object),
+        'Note': [f"note {i}" for i in range(ROWS)],
+        'Id': np.arange(ROWS, dtype=np.int64),
+        'Close': rng.normal(100, 1, ROWS).round(2),
+        'Volume': rng.integers(0, 1000, ROWS, dtype=np.int64)
+    })
+
+@pytest.mark.parametrize('column', ['Volume', 'volume', 'volume_usd', 'Total Volume', 'Quantity', 'open_interest'])
+def test_volume_columns_are_never_narrowed(column):
+    data = pd.DataFrame({column: np.arange(ROWS, dtype=np.int64)})
+    result, report = DatasetCompactor().compact(data)
+    assert result[column].dtype == np.int64
+    assert report['dtype_changes'] == {}
+
+def test_columns_are_compacted_and_the_input_is_untouched():
+    data = make_data()
+    result, report = DatasetCompactor(float32_prices=False).compact(data)
+    assert isinstance(result['Symbol'].dtype, pd.CategoricalDtype)
+    # pandas 2 builds Note as object (converted); pandas 3 as its Arrow-backed str (already compact)
+    assert DatasetCompactor._is_arrow_string(result['Note'].dtype)
+    assert ('Note' in report['dtype_changes']) != ('Note' in report['already_compact'])
+    assert result['Id'].dtype == np.int32
+    assert result['Close'].dtype == np.float64 and result['Volume'].dtype == np.int64
+    assert report['memory_after'] < report['memory_before'] and report['memory_saved_pct'] > 0
+    assert set(report['dtype_changes']) - {'Note'} == {'Symbol', 'Id'}
+    pd.testing.assert_frame_equal(data, make_data())
+    assert result['Symbol'].astype(str).tolist() == data['Symbol'].tolist()
+
+@pytest.mark.parametrize('dtype', ['object', pd.StringDtype('python'), pd.StringDtype('pyarrow'),
+                                   pd.ArrowDtype(pa.string())])
+def test_high_cardinality_strings_end_up_arrow_backed(dtype):
+    data = pd.DataFrame({'Note': pd.Series([f"note {i}" for i in range(ROWS)], dtype=dtype)})
+    result, report = DatasetCompactor().compact(data)
+    assert DatasetCompactor._is_arrow_string(result['Note'].dtype)
+    if DatasetCompactor._is_arrow_string(data['Note'].dtype):
+        assert result is data and report['already_compact'] == ['Note']
+    else:
+        assert result['Note'].dtype == pd.ArrowDtype(pa.string())
+        assert list(report['dtype_changes']) == ['Note'] and report['already_compact'] == []
+    assert result['Note'].tolist() == data['Note'].tolist()
+
+def test_integers_outside_int32_stay_wide():
+    data = pd.DataFrame({'Id': np.array([0, 2**40], dtype=np.int64)})
+    assert DatasetCompactor().compact(data)[0]['Id'].dtype == np.int64
+
+def test_float32_prices_only_when_values_survive():
+    fits = pd.DataFrame({'Close': [101.25, 99.5, 100.75]})
+    too_precise = pd.DataFrame({'Close': [12345.6789, 1.0, 2.0]})
+    compactor = DatasetCompactor(float32_prices=True, price_decimals=4)
+    assert compactor.compact(fits)[0]['Close'].dtype == np.float32
+    assert compactor.compact(too_precise)[0]['Close'].dtype == np.float64
+
+def test_mixed_object_columns_are_left_alone():
+    data = pd.DataFrame({'Value': [1, 'x', 2.5] * 10})
+    result, report = DatasetCompactor().compact(data)
+    assert result is data and report['dtype_changes'] == {}
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the paginated, lazily stat'ed directory listing
+"""
+
+import os
+
+import pytest
+
+from modular_panels import directory_listing
+from modular_panels.directory_listing import DirectoryListing
+
+@pytest.fixture
+def directory(tmp_path):
+    for i in range(25):
+        path = tmp_path / f"file{i:02d}.csv"
+        path.write_bytes(b'x' * (25 - i))
+        os.utime(path, (1_700_000_000 + i, 1_700_000_000 + i))
+    (tmp_path / 'b_dir').mkdir()
+    (tmp_path / 'A_dir').mkdir()
+    os.utime(tmp_path, (1_700_000_000, 1_700_000_000))
+    return tmp_path
+
+@pytest.fixture
+def stat_calls(monkeypatch):
+    calls = []
+    real_stat = os.stat
+
+    def counting_stat(path, *args, **kwargs):
+        calls.append(os.path.basename(path))
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(directory_listing.os, 'stat', counting_stat)
+    return calls
+
+def test_pages_stat_only_their_entries(directory, stat_calls):
+    listing = DirectoryListing(['.csv'])
+    assert listing.load(str(directory)) == 27
+    assert stat_calls == [directory.name]   # the directory itself, none of its entries
+
+    page = listing.page(0, 10)
+    assert [row['Name'] for row in page[:3]] == ['📁 A_dir', '📁 b_dir', '📊 file00.csv']
+    assert page[2]['Size'] == 25 and page[2]['Extension'] == '.csv'
+    assert len(stat_calls) == 11
+    listing.page(0, 10)
+    assert len(stat_calls) == 11
+    assert [row['Name'] for row in listing.page(20, 40)] == [f"📊 file{i:02d}.csv" for i in range(18, 25)]
+
+def test_skeleton_rows_cover_every_entry_without_stats(directory, stat_calls):
+    listing = DirectoryListing(['.csv'])
+    listing.load(str(directory))
+    rows = listing.skeleton()
+    assert len(rows) == 27 and all(row['Size'] == '' for row in rows)
+    assert len(stat_calls) == 1
+
+def test_sorting_by_size_and_date(directory):
+    listing = DirectoryListing(['.csv'])
+    listing.load(str(directory))
+    listing.sort('Size', descending=True)
+    files = [row for row in listing.page(0, 27) if not row['Is Directory']]
+    assert [row['Size'] for row in files] == list(range(25, 0, -1))
+    listing.sort('Modified')
+    assert [row['Name'] for row in listing.page(0, 27) if not row['Is Directory']][0] == '📊 file00.csv'
+    with pytest.raises(ValueError):
+        listing.sort('Owner')
+
+def test_scan_is_reused_until_the_directory_changes(directory):
+    listing = DirectoryListing(['.csv'])
+    listing.load(str(directory))
+    (directory / 'zz.csv').write_bytes(b'new')
+    os.utime(directory, (1_700_000_000, 1_700_000_000))
+    assert listing.load(str(directory)) == 27   # same mtime, cached scan
+    os.utime(directory, (1_700_000_100, 1_700_000_100))
+    assert listing.load(str(directory)) == 28
+
+def test_scan_of_a_just_modified_directory_is_not_reused(tmp_path):
+    listing = DirectoryListing(['.csv'])
+    (tmp_path / 'a.csv').write_bytes(b'a')
+    listing.load(str(tmp_path))
+    mtime = os.stat(tmp_path).st_mtime
+    (tmp_path / 'b.csv').write_bytes(b'b')
+    os.utime(tmp_path, (mtime, mtime))   # added within the same mtime tick
+    assert listing.load(str(tmp_path)) == 2
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the pooled, read-only DuckDB access layer
+"""
+
+import os
+
+import duckdb
+import pandas as pd
+import pytest
+
+from ui_components.data_access_duckdb import DuckDBConnectionManager
+
+def make_db(path, symbols=('AAPL', 'AAPL.B', 'MSFT')):
+    conn = duckdb.connect(str(path))
+    data = pd.DataFrame([{'Symbol': s, 'Date': d, 'Close': float(i)}
+                         for i, (s, d) in enumerate((s, d) for d in pd.date_range('2024-01-01', periods=5)
+                                                    for s in symbols)])
+    conn.execute('CREATE TABLE stock_data AS SELECT * FROM data')
+    conn.close()
+    return str(path)
+
+@pytest.fixture
+def databases(tmp_path):
+    return [make_db(tmp_path / f"db{i}.duckdb") for i in range(3)]
+
+def test_read_symbol_binds_symbol_and_dates(databases):
+    manager = DuckDBConnectionManager()
+    result = manager.read_symbol(databases[0], 'AAPL', '2024-01-02', '2024-01-03')
+    assert result['Symbol'].unique().tolist() == ['AAPL']
+    assert result['Date'].min() == pd.Timestamp('2024-01-02') and result['Date'].max() == pd.Timestamp('2024-01-03')
+    assert manager.read_symbol(databases[0], "AAPL' OR '1'='1").empty
+    manager.close_all()
+
+def test_read_symbol_matches_the_us_form_only(tmp_path):
+    path = make_db(tmp_path / 'redline.duckdb', symbols=('COIN.US', 'BRK.A', 'brk'))
+    manager = DuckDBConnectionManager()
+    assert manager.read_symbol(path, 'coin')['Symbol'].unique().tolist() == ['COIN.US']
+    assert manager.read_symbol(path, 'BRK')['Symbol'].unique().tolist() == ['brk']
+    manager.close_all()
+
+@pytest.mark.parametrize('column_type,condition', [
+    ('TIMESTAMP', '"Date" >= CAST(CAST(? AS TIMESTAMP) AS TIMESTAMP)'),
+    ('DATE', '"Date" >= CAST(CAST(? AS TIMESTAMP) AS DATE)'),
+    ('VARCHAR', 'CAST("Date" AS TIMESTAMP) >= CAST(? AS TIMESTAMP)')])
+def test_date_bounds_are_cast_to_the_column_type(tmp_path, column_type, condition):
+    conn = duckdb.connect(str(tmp_path / 'typed.duckdb'))
+    conn.execute(f'CREATE TABLE data AS SELECT \'AAPL\' AS Symbol, CAST(d AS {column_type}) AS "Date", 1.0 AS Close '
+                 "FROM range(DATE '2024-01-01', DATE '2024-01-11', INTERVAL 1 DAY) t(d)")
+    conn.close()
+    manager = DuckDBConnectionManager()
+    path = str(tmp_path / 'typed.duckdb')
+    assert manager.date_condition(path, 'data', 'Date', '>=') == condition
+    result = manager.read_symbol(path, 'AAPL', '2024-01-03', '2024-01-05')
+    assert pd.to_datetime(result['Date']).dt.day.tolist() == [3, 4, 5]
+    manager.close_all()
+
+def test_connections_are_reused_and_evicted_lru(databases):
+    manager = DuckDBConnectionManager(max_connections=2)
+    for path in databases[:2]:
+        manager.get_tables(path)
+    manager.get_tables(databases[0])
+    manager.get_tables(databases[2])
+    stats = manager.get_stats()
+    assert stats['connections_opened'] == 3 and stats['connections_reused'] == 1
+    assert stats['connections_evicted'] == 1 and stats['open_connections'] == 2
+    assert os.path.abspath(databases[1]) not in manager._connections
+    manager.close_all()
+
+def test_connection_in_use_is_not_evicted_until_released(databases):
+    manager = DuckDBConnectionManager(max_connections=1)
+    entry = manager._get_entry(databases[0], use=True)
+    manager.get_tables(databases[1])
+    assert os.path.abspath(databases[0]) in manager._connections
+    # The in-use connection still answers queries while the pool is over its limit
+    assert entry['conn'].cursor().execute('SELECT COUNT(*) FROM stock_data').fetchone()[0] == 15
+    manager._release(entry)
+    assert list(manager._connections) == [os.path.abspath(databases[1])]
+    manager.close_all()
+
+def test_pinned_files_are_never_evicted(databases):
+    manager = DuckDBConnectionManager(max_connections=1)
+    manager.pin(databases[0])
+    for path in databases:
+        manager.get_tables(path)
+    assert os.path.abspath(databases[0]) in manager._connections
+    manager.close_all()
+
+def test_changed_file_reopens_while_running_queries_finish(databases, tmp_path):
+    manager = DuckDBConnectionManager()
+    entry = manager._get_entry(databases[0], use=True)
+    os.utime(databases[0], (1_700_000_000, 1_700_000_000))
+    manager.get_tables(databases[0])
+    assert entry.get('retired') and manager.stats['connections_opened'] == 2
+    assert entry['conn'].execute('SELECT 1').fetchone() == (1,)
+    manager._release(entry)
+    with pytest.raises(duckdb.Error):
+        entry['conn'].execute('SELECT 1')
+    manager.close_all()
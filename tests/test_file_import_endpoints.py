@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for the whole-file upload, M3 scan/import and file registry routes
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.endpoints import file_import_endpoints
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_import_endpoints, 'UPLOAD_DIR', tmp_path / 'uploads')
+    monkeypatch.setattr(file_import_endpoints, 'UPLOAD_DATA_DIR', tmp_path / 'upload_data')
+    monkeypatch.setattr(file_import_endpoints, 'uploaded_files', {})
+    app = FastAPI()
+    app.include_router(file_import_endpoints.router, prefix='/api/v1/files')
+    return TestClient(app)
+
+def test_scan_import_list_and_delete(client, tmp_path):
+    drive = tmp_path / 'drive'
+    (drive / 'nested').mkdir(parents=True)
+    (drive / 'nested' / 'prices.csv').write_text('Date,Close\n2024-01-01,1\n')
+    (drive / 'notes.txt').write_text('skip me')
+
+    scan = client.get('/api/v1/files/m3-drive/scan', params={'path': str(drive)}).json()
+    assert scan['total_files'] == 1
+    assert scan['found_files']['csv'][0]['filename'] == 'prices.csv'
+
+    imported = client.post('/api/v1/files/m3-drive/import',
+                           json={'file_path': str(drive / 'nested' / 'prices.csv')}).json()
+    assert (tmp_path / 'upload_data' / 'prices.csv').exists()
+    assert imported['source'] == 'm3_drive'
+
+    listing = client.get('/api/v1/files/files').json()
+    assert listing['count'] == 1 and imported['file_id'] in listing['files']
+    assert client.get(f"/api/v1/files/files/{imported['file_id']}").json()['file_size'] > 0
+
+    assert client.delete(f"/api/v1/files/files/{imported['file_id']}").status_code == 200
+    assert not (tmp_path / 'upload_data' / 'prices.csv').exists()
+    assert client.get(f"/api/v1/files/files/{imported['file_id']}").status_code == 404
+
+def test_upload_rejects_unsupported_types(client, tmp_path):
+    response = client.post('/api/v1/files/upload', files={'file': ('run.exe', b'MZ')})
+    assert response.status_code == 400
+
+    response = client.post('/api/v1/files/upload', files={'file': ('a.csv', b'x,y\n1,2\n')},
+                           data={'file_type': 'upload'})
+    assert response.status_code == 200
+    assert (tmp_path / 'upload_data' / 'a.csv').read_bytes() == b'x,y\n1,2\n'
+
+def test_missing_scan_path_is_404(client, tmp_path):
+    assert client.get('/api/v1/files/m3-drive/scan', params={'path': str(tmp_path / 'none')}).status_code == 404
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent upload-data file manifest
+"""
+
+import os
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from ui_components.data_access_file_manifest import DataAccessFileManifest
+
+PATTERNS = {'csv': ['*.csv'], 'parquet': ['*.parquet']}
+
+@pytest.fixture
+def data_dir(tmp_path):
+    directory = tmp_path / 'upload_data'
+    directory.mkdir()
+    return directory
+
+def make_manifest(data_dir, tmp_path):
+    scanning = SimpleNamespace(get_scan_directories=lambda: [str(data_dir)], get_file_patterns=lambda: PATTERNS)
+    return DataAccessFileManifest(SimpleNamespace(scanning=scanning), str(tmp_path / 'manifest.json'))
+
+def write_prices(path, symbols, start='2024-01-01', periods=3, mtime=None):
+    data = pd.DataFrame([{'Symbol': s, 'Date': d, 'Close': 1.0}
+                         for s in symbols for d in pd.date_range(start, periods=periods)])
+    if path.suffix == '.parquet':
+        data.to_parquet(path)
+    else:
+        data.to_csv(path, index=False)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+def test_files_are_indexed_with_symbols_and_date_ranges(data_dir, tmp_path):
+    write_prices(data_dir / 'a.csv', ['AAPL', 'MSFT'])
+    write_prices(data_dir / 'b.parquet', ['SPY'], start='2023-06-01')
+    manifest = make_manifest(data_dir, tmp_path)
+    assert manifest.refresh(force=True) == {'indexed': 2, 'unchanged': 0, 'removed': 0}
+
+    entry = manifest.files[str(data_dir / 'a.csv')]
+    assert entry['symbols'] == ['AAPL', 'MSFT']
+    assert entry['min_date'].startswith('2024-01-01') and entry['max_date'].startswith('2024-01-03')
+    assert [e['path'] for e in manifest.get_files('spy')] == [str(data_dir / 'b.parquet')]
+    assert manifest.get_files('AAPL', '2023-01-01', '2023-12-31') == []
+    assert len(manifest.get_files('AAPL', '2024-01-02', '2024-02-01')) == 1
+
+def test_symbol_matching_follows_the_reader_rule(data_dir, tmp_path):
+    write_prices(data_dir / 'brk.csv', ['BRK.A', 'BRK.B'])
+    write_prices(data_dir / 'coin.csv', ['COIN.US'])
+    manifest = make_manifest(data_dir, tmp_path)
+    manifest.refresh(force=True)
+    assert manifest.get_files('BRK') == []
+    assert [e['path'] for e in manifest.get_files('brk.b')] == [str(data_dir / 'brk.csv')]
+    assert [e['path'] for e in manifest.get_files('coin')] == [str(data_dir / 'coin.csv')]
+
+def test_unchanged_files_are_not_reindexed_across_restarts(data_dir, tmp_path):
+    write_prices(data_dir / 'a.csv', ['AAPL'])
+    make_manifest(data_dir, tmp_path).refresh(force=True)
+    reopened = make_manifest(data_dir, tmp_path)
+    assert reopened.refresh(force=True) == {'indexed': 0, 'unchanged': 1, 'removed': 0}
+
+def test_mtime_change_reindexes_the_file_and_its_version(data_dir, tmp_path):
+    path = data_dir / 'a.csv'
+    write_prices(path, ['AAPL'], mtime=1_700_000_000)
+    manifest = make_manifest(data_dir, tmp_path)
+    manifest.refresh(force=True)
+    version = manifest.get_version('AAPL')
+
+    write_prices(path, ['AAPL', 'TSLA'], mtime=1_700_000_100)
+    assert manifest.refresh(force=True)['indexed'] == 1
+    assert manifest.files[str(path)]['symbols'] == ['AAPL', 'TSLA']
+    assert manifest.get_version('AAPL') != version
+    assert len(manifest.get_files('TSLA')) == 1
+
+def test_added_and_removed_files_are_picked_up(data_dir, tmp_path):
+    write_prices(data_dir / 'a.csv', ['AAPL'])
+    manifest = make_manifest(data_dir, tmp_path)
+    manifest.refresh(force=True)
+    # Added within the same directory mtime tick as the first listing
+    listed_mtime = os.stat(data_dir).st_mtime
+    write_prices(data_dir / 'b.csv', ['MSFT'])
+    os.utime(data_dir, (listed_mtime, listed_mtime))
+    assert manifest.refresh(force=True)['indexed'] == 1
+    os.remove(data_dir / 'a.csv')
+    assert manifest.refresh(force=True)['removed'] == 1
+    assert manifest.get_files('AAPL') == []
+
+def test_refreshes_are_rate_limited(data_dir, tmp_path, monkeypatch):
+    monkeypatch.setattr(DataAccessFileManifest, 'REFRESH_INTERVAL', 3600)
+    manifest = make_manifest(data_dir, tmp_path)
+    manifest.refresh()
+    write_prices(data_dir / 'a.csv', ['AAPL'])
+    assert manifest.refresh()['indexed'] == 0
+    assert manifest.refresh(force=True)['indexed'] == 1
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for metadata-only previews of columnar and database files
+"""
+
+import sqlite3
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+import pytest
+
+from modular_panels.file_preview import FilePreviewReader
+
+ROWS = 1000
+
+def make_data():
+    return pd.DataFrame({'Symbol': ['AAPL'] * ROWS, 'Close': [float(i) for i in range(ROWS)]})
+
+def test_parquet_preview_reads_footer_and_first_rows(tmp_path):
+    path = tmp_path / 'prices.parquet'
+    pq.write_table(pa.Table.from_pandas(make_data()), path, row_group_size=100)
+    preview, info = FilePreviewReader(preview_rows=5).preview(str(path))
+    assert preview['Close'].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert info['rows'] == ROWS and info['columns'] == 2 and info['row_groups'] == 10
+
+def test_empty_parquet_preview_keeps_columns(tmp_path):
+    path = tmp_path / 'empty.parquet'
+    pq.write_table(pa.Table.from_pandas(make_data().iloc[:0]), path)
+    preview, info = FilePreviewReader().preview(str(path))
+    assert preview.empty and list(preview.columns)[:2] == ['Symbol', 'Close'] and info['rows'] == 0
+
+@pytest.mark.parametrize('version', [1, 2])
+def test_feather_preview(tmp_path, version):
+    path = tmp_path / 'prices.feather'
+    feather.write_feather(make_data(), str(path), version=version, chunksize=100 if version == 2 else None)
+    preview, info = FilePreviewReader(preview_rows=3).preview(str(path))
+    assert preview['Close'].tolist() == [0.0, 1.0, 2.0]
+    assert info['rows'] == ROWS and info['columns'] == 2
+
+def write_sqlite(path):
+    con = sqlite3.connect(path)
+    make_data().to_sql('prices', con, index=False)
+    con.close()
+
+def write_duckdb(path):
+    con = duckdb.connect(str(path))
+    data = make_data()
+    con.execute('CREATE TABLE prices AS SELECT * FROM data')
+    con.execute('CREATE TABLE symbols AS SELECT DISTINCT Symbol FROM data')
+    con.close()
+
+@pytest.mark.parametrize('filename,writer', [('prices.sqlite', write_sqlite), ('prices.db', write_sqlite),
+                                             ('prices.duckdb', write_duckdb), ('duck.db', write_duckdb)])
+def test_database_preview_limits_the_first_table(tmp_path, filename, writer):
+    path = tmp_path / filename
+    writer(path)
+    preview, info = FilePreviewReader(preview_rows=4).preview(str(path))
+    assert len(preview) == 4 and preview['Close'].tolist() == [0.0, 1.0, 2.0, 3.0]
+    assert info['table'] == 'prices' and info['tables'][0] == 'prices'
+    if writer is write_duckdb:
+        assert info['tables'] == ['prices', 'symbols'] and info['rows'] == ROWS
+
+def test_database_without_tables(tmp_path):
+    path = tmp_path / 'empty.duckdb'
+    duckdb.connect(str(path)).close()
+    preview, info = FilePreviewReader().preview(str(path))
+    assert info['tables'] == [] and preview['Note'].tolist() == ['Database has no tables']
+
+def test_unsupported_extension(tmp_path):
+    with pytest.raises(ValueError):
+        FilePreviewReader().preview(str(tmp_path / 'notes.txt'))
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for GlobalDataStore read views
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ui_components.global_data_store import GlobalDataStore
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """A fresh store instance (the singleton is reset around each test)"""
+    monkeypatch.setattr(GlobalDataStore, '_instance', None)
+    monkeypatch.setattr(GlobalDataStore, 'STORAGE_MODE', 'memory')
+    monkeypatch.setattr(GlobalDataStore, 'SPILL_DIR', str(tmp_path / 'spill'))
+    monkeypatch.setattr(GlobalDataStore, 'MEMORY_BUDGET_BYTES', 0)
+    return GlobalDataStore()
+
+def make_data():
+    return pd.DataFrame({'Close': [1.0, np.nan, 3.0], 'Volume': [10, 20, 30], 'Symbol': ['A', 'B', 'C']})
+
+def test_mutated_view_leaves_stored_data_unchanged(store):
+    store.add_uploaded_data('d', make_data(), {})
+    view = store.get_dataset_view('d')
+    view.loc[0, 'Close'] = 99.0
+    view.fillna(0.0, inplace=True)
+    view['Volume'] *= 2
+    assert view['Close'].tolist() == [99.0, 0.0, 3.0] and view['Volume'].tolist() == [20, 40, 60]
+    pd.testing.assert_frame_equal(store.get_dataset_view('d'), make_data())
+
+def test_view_shares_the_stored_buffers(store):
+    store.add_uploaded_data('d', make_data(), {})
+    first, second = store.get_dataset_view('d'), store.get_dataset_view('d')
+    assert np.shares_memory(first['Close'].to_numpy(), second['Close'].to_numpy())
+
+def test_caller_edits_after_insert_do_not_leak_into_store(store):
+    data = make_data()
+    store.add_uploaded_data('d', data, {})
+    data.loc[0, 'Close'] = 99.0
+    data['Volume'] *= 2
+    pd.testing.assert_frame_equal(store.get_dataset_view('d'), make_data())
+
+def test_copy_returns_a_writable_frame(store):
+    store.add_uploaded_data('d', make_data(), {})
+    data = store.get_uploaded_data('d', copy=True)['d']
+    data.loc[0, 'Close'] = 99.0
+    assert store.get_dataset_view('d').loc[0, 'Close'] == 1.0
+    assert store.get_copy_stats()['deep_copies'] == 1
+
+def test_object_column_writes_stay_in_the_view(store):
+    store.add_uploaded_data('d', make_data(), {})
+    view = store.get_dataset_view('d')
+    view.loc[0, 'Symbol'] = 'Z'
+    assert view.memory_usage(deep=True).sum() > 0
+    assert store.get_dataset_view('d').loc[0, 'Symbol'] == 'A'
+
+def test_spilled_dataset_is_served_intact(store):
+    store.set_memory_budget(1)
+    store.add_uploaded_data('a', make_data(), {})
+    store.add_uploaded_data('b', make_data().assign(Volume=[1, 2, 3]), {})
+    assert store.get_spill_stats()['spilled_datasets'] == 1
+    pd.testing.assert_frame_equal(store.get_dataset_view('a'), make_data())
+    assert store.get_spill_stats()['reloads'] == 1
+
+@pytest.mark.parametrize('mode', ['memory', 'columnar'])
+def test_stats_count_rows_and_bytes_in_either_storage(store, tmp_path, mode):
+    store.set_storage_mode(mode, str(tmp_path / 'datasets'))
+    store.add_uploaded_data('a', make_data(), {})
+    store.add_uploaded_data('b', make_data(), {})
+    stats = store.get_stats()
+    assert stats['storage_mode'] == mode and stats['total_datasets'] == 2 and stats['total_records'] == 6
+    assert (stats['total_disk_bytes'] > 0) == (mode == 'columnar')
+    assert (stats['total_memory_bytes'] > 0) == (mode == 'memory')
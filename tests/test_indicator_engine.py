@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming indicator engine against full pandas recomputes
+"""
+
+import numpy as np
+import pandas as pd
+
+from ui_components.indicator_engine import StreamingIndicatorEngine
+
+def make_bars(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({'Date': pd.date_range('2024-01-01', periods=count, freq='D'),
+                         'Close': 100 + rng.standard_normal(count).cumsum()})
+
+def reference(close):
+    """Indicators recomputed from scratch with pandas"""
+    n = StreamingIndicatorEngine.RSI_PERIOD
+    delta = close.diff()
+    gains, losses = delta.clip(lower=0.0), (-delta).clip(lower=0.0)
+    avg_gain, avg_loss = np.full(len(close), np.nan), np.full(len(close), np.nan)
+    avg_gain[n], avg_loss[n] = gains.iloc[1:n + 1].mean(), losses.iloc[1:n + 1].mean()
+    for i in range(n + 1, len(close)):
+        # Wilder smoothing
+        avg_gain[i] = (avg_gain[i - 1] * (n - 1) + gains.iloc[i]) / n
+        avg_loss[i] = (avg_loss[i - 1] * (n - 1) + losses.iloc[i]) / n
+    fast = close.ewm(span=12, adjust=True).mean()
+    slow = close.ewm(span=26, adjust=True).mean()
+    sma, std = close.rolling(20).mean(), close.rolling(20).std()
+    return pd.DataFrame({
+        'RSI': 100.0 - 100.0 / (1.0 + avg_gain / avg_loss), 'SMA_20': sma, 'EMA_12': fast, 'EMA_26': slow,
+        'MACD': fast - slow, 'MACD_Signal': (fast - slow).ewm(span=9, adjust=True).mean(),
+        'BB_Upper': sma + 2 * std, 'BB_Lower': sma - 2 * std
+    }, index=close.index)
+
+def assert_matches(result, close):
+    expected = reference(close)
+    np.testing.assert_allclose(result.to_numpy(), expected[StreamingIndicatorEngine.COLUMNS].to_numpy(),
+                               rtol=1e-9, atol=1e-9)
+
+def test_backfill_matches_pandas():
+    bars = make_bars(120)
+    assert_matches(StreamingIndicatorEngine().update('AAPL', bars), bars['Close'])
+
+def test_incremental_bars_and_ticks_match_full_recompute():
+    bars = make_bars(150, seed=1)
+    engine = StreamingIndicatorEngine()
+    engine.update('AAPL', bars.iloc[:60])
+    for end in range(61, 151):
+        ticking = bars.iloc[:end].copy()
+        ticking.loc[ticking.index[-1], 'Close'] += 0.5   # an open candle ticking before it settles
+        engine.update('AAPL', ticking)
+        result = engine.update('AAPL', bars.iloc[:end])
+    assert engine.stats['backfills'] == 1
+    assert_matches(result, bars['Close'])
+
+def test_result_is_read_only_view():
+    bars = make_bars(40)
+    result = StreamingIndicatorEngine().update('AAPL', bars)
+    assert not result.to_numpy().flags.writeable
+
+def test_missing_close_after_committed_bars_is_forward_filled():
+    bars = make_bars(60, seed=2)
+    engine = StreamingIndicatorEngine()
+    engine.update('AAPL', bars.iloc[:50])
+    gapped = bars.copy()
+    gapped.loc[50, 'Close'] = np.nan
+    result = engine.update('AAPL', gapped)
+    assert engine.stats['backfills'] == 1
+    assert_matches(result, gapped['Close'].ffill())
+
+def test_timeframes_keep_separate_state():
+    daily, hourly = make_bars(80, seed=2), make_bars(80, seed=3)
+    engine = StreamingIndicatorEngine()
+    engine.update('AAPL', daily.iloc[:60], '1d')
+    engine.update('AAPL', hourly.iloc[:60], '1h')
+    daily_result = engine.update('AAPL', daily, '1d')
+    hourly_result = engine.update('AAPL', hourly, '1h')
+    assert engine.stats['backfills'] == 2
+    assert engine.get_stats()['series'] == 2 and engine.get_stats()['symbols'] == 1
+    assert_matches(daily_result, daily['Close'])
+    assert_matches(hourly_result, hourly['Close'])
+
+def test_new_source_version_forces_backfill():
+    bars = make_bars(80, seed=4)
+    engine = StreamingIndicatorEngine()
+    engine.update('AAPL', bars.iloc[:60], version='v1')
+    # Older history was revised but the last committed bar still matches, so only the
+    # version shows that the committed state is stale
+    revised = bars.copy()
+    revised.loc[20:30, 'Close'] += 5.0
+    result = engine.update('AAPL', revised, version='v2')
+    assert engine.stats['backfills'] == 2
+    assert_matches(result, revised['Close'])
+    engine.update('AAPL', revised, version='v2')
+    assert engine.stats['backfills'] == 2
+
+def test_reset_drops_every_timeframe_of_a_symbol():
+    bars = make_bars(40)
+    engine = StreamingIndicatorEngine()
+    for timeframe in ('1d', '1h'):
+        engine.update('AAPL', bars, timeframe)
+    engine.update('MSFT', bars, '1d')
+    engine.reset('AAPL', '1h')
+    assert engine.get_stats()['series'] == 2
+    engine.reset('AAPL')
+    assert engine.get_stats()['series'] == 1 and engine.get_stats()['symbols'] == 1
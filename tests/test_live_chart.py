@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for live chart stream/patch updates against a full rebuild of the same bars
+"""
+
+import numpy as np
+import pandas as pd
+
+from ui_components.live_chart import LiveChartFeed
+
+def _bars(count, start='2024-01-01 09:30'):
+    dates = pd.date_range(start, periods=count, freq='min')
+    close = 100 + np.arange(count, dtype=float)
+    return pd.DataFrame({'Date': dates, 'Close': close, 'Volume': np.arange(count) * 10})
+
+def _source_frame(feed):
+    return pd.DataFrame({c: np.asarray(feed.source.data[c]) for c in feed.columns})
+
+def _rebuilt(data, max_bars):
+    feed = LiveChartFeed(['Close', 'Volume'], max_bars)
+    assert feed.update('key', data) == 'reset'
+    return _source_frame(feed)
+
+def test_new_bars_are_streamed_and_match_a_rebuild():
+    feed = LiveChartFeed(['Close', 'Volume'], max_bars=100)
+    assert feed.update(('AAPL', '1m'), _bars(50)) == 'reset'
+    assert feed.update(('AAPL', '1m'), _bars(53)) == 'stream'
+    assert feed.stats == {'resets': 1, 'streams': 1, 'patches': 0, 'unchanged': 0}
+    pd.testing.assert_frame_equal(_source_frame(feed), _rebuilt(_bars(53), 100))
+
+def test_revised_last_bar_is_patched():
+    feed = LiveChartFeed(['Close', 'Volume'], max_bars=100)
+    feed.update('key', _bars(20))
+    revised = _bars(20)
+    revised.loc[19, 'Close'] = 250.0
+    assert feed.update('key', revised) == 'patch'
+    assert feed.update('key', revised) == 'unchanged'
+    assert feed.stats['resets'] == 1
+    pd.testing.assert_frame_equal(_source_frame(feed), _rebuilt(revised, 100))
+
+def test_revised_and_new_bars_patch_then_stream():
+    feed = LiveChartFeed(['Close', 'Volume'], max_bars=100)
+    feed.update('key', _bars(20))
+    data = _bars(22)
+    data.loc[19, 'Volume'] = 5
+    assert feed.update('key', data) == 'stream'
+    assert feed.stats['patches'] == 1 and feed.stats['streams'] == 1
+    pd.testing.assert_frame_equal(_source_frame(feed), _rebuilt(data, 100))
+
+def test_stream_rolls_over_at_max_bars():
+    feed = LiveChartFeed(['Close', 'Volume'], max_bars=30)
+    feed.update('key', _bars(25))
+    assert feed.update('key', _bars(40)) == 'stream'
+    assert len(feed.source.data['Date']) == 30
+    pd.testing.assert_frame_equal(_source_frame(feed), _rebuilt(_bars(40), 30))
+    # Still incremental once the window has rolled
+    assert feed.update('key', _bars(41)) == 'stream'
+    pd.testing.assert_frame_equal(_source_frame(feed), _rebuilt(_bars(41), 30))
+
+def test_new_key_or_reloaded_history_rebuilds():
+    feed = LiveChartFeed(['Close', 'Volume'], max_bars=100)
+    feed.update(('AAPL', '1m'), _bars(20))
+    assert feed.update(('MSFT', '1m'), _bars(20)) == 'reset'
+    reloaded = _bars(21)
+    reloaded.loc[0, 'Close'] = -1.0
+    assert feed.update(('MSFT', '1m'), reloaded) == 'reset'
+    assert feed.update(('MSFT', '1m'), _bars(10, start='2024-02-01')) == 'reset'
+    pd.testing.assert_frame_equal(_source_frame(feed), _rebuilt(_bars(10, start='2024-02-01'), 100))
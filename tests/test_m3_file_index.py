@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the incrementally refreshed M3 file index
+"""
+
+import os
+
+from m3_file_index import M3FileIndex
+from m3_file_manager import M3FileManager
+
+def write(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b'x' * size)
+
+def test_refresh_picks_up_in_place_rewrites(tmp_path):
+    write(tmp_path / 'a.csv', 10)
+    index = M3FileIndex(['.csv'])
+    index.add_root(str(tmp_path))
+    assert index.get_node(str(tmp_path))['size'] == 10
+
+    directory_mtime = os.stat(tmp_path).st_mtime
+    write(tmp_path / 'a.csv', 25)
+    os.utime(tmp_path, (directory_mtime, directory_mtime))
+    index.refresh()
+    node = index.get_node(str(tmp_path))
+    assert node['size'] == 25
+    assert node['files']['a.csv'][0] == 25
+
+def test_subdirectory_refresh_updates_ancestor_aggregates(tmp_path):
+    write(tmp_path / 'sub' / 'deep' / 'a.csv', 10)
+    write(tmp_path / 'b.txt', 99)   # unsupported extension
+    index = M3FileIndex(['.csv'])
+    index.add_root(str(tmp_path))
+    assert index.get_node(str(tmp_path))['file_count'] == 1
+
+    write(tmp_path / 'sub' / 'deep' / 'c.csv', 5)
+    deep = index.get_node(str(tmp_path / 'sub' / 'deep'))
+    assert deep['file_count'] == 2
+    root = index.get_node(str(tmp_path))
+    assert root['file_count'] == 2 and root['size'] == 15
+    assert index.get_node(str(tmp_path / 'sub'))['extensions'] == {'.csv': 2}
+
+def test_removed_subdirectory_is_forgotten(tmp_path):
+    write(tmp_path / 'sub' / 'a.csv', 10)
+    index = M3FileIndex(['.csv'])
+    index.add_root(str(tmp_path))
+    (tmp_path / 'sub' / 'a.csv').unlink()
+    (tmp_path / 'sub').rmdir()
+    index.refresh()
+    assert index.get_node(str(tmp_path))['file_count'] == 0
+    assert list(index.iter_files(str(tmp_path))) == []
+
+def test_directories_outside_roots_are_not_indexed(tmp_path):
+    write(tmp_path / 'root' / 'a.csv', 1)
+    write(tmp_path / 'other' / 'b.csv', 2)
+    write(tmp_path / 'other' / 'nested' / 'c.csv', 3)
+    index = M3FileIndex(['.csv'])
+    index.add_root(str(tmp_path / 'root'))
+
+    node = index.get_node(str(tmp_path / 'other'))
+    assert node['file_count'] == 2 and node['size'] == 5 and node['subdirs'] == ['nested']
+    assert list(node['files']) == ['b.csv']
+    assert index._roots == {str(tmp_path / 'root')}
+    names = sorted(f['name'] for f in index.search(str(tmp_path / 'other'), ''))
+    assert names == ['b.csv', 'c.csv']
+    assert index._roots == {str(tmp_path / 'root')}
+
+def test_browse_outside_roots_reports_subtree_totals(tmp_path):
+    write(tmp_path / 'data' / 'sub' / 'a.csv', 4)
+    write(tmp_path / 'data' / 'sub' / 'deeper' / 'b.parquet', 6)
+    manager = M3FileManager()
+    manager.scan_directories = [str(tmp_path / 'missing')]
+    listing = manager.browse_directory(str(tmp_path / 'data'))
+    assert listing['subdirectories'][0]['file_count'] == 2
+    assert listing['subdirectories'][0]['size'] == 10
+    manager.file_index.stop()
+
+def test_status_waits_for_the_first_build(tmp_path):
+    write(tmp_path / 'root' / 'nested' / 'a.csv', 7)
+    manager = M3FileManager()
+    assert manager.file_index._thread is None   # nothing starts at construction/import
+    manager.scan_directories = [str(tmp_path / 'root')]
+    status = manager.get_m3_status()
+    assert 'indexing' not in status
+    assert status['total_files_found'] == 1 and status['total_size'] == 7
+    manager.file_index.stop()
+
+def test_status_reports_a_running_build(tmp_path, monkeypatch):
+    write(tmp_path / 'root' / 'a.csv', 7)
+    manager = M3FileManager()
+    manager.scan_directories = [str(tmp_path / 'root')]
+    monkeypatch.setattr(manager.file_index, 'wait_ready', lambda timeout=None: False)
+    status = manager.get_m3_status()
+    assert status['indexing'] is True and status['total_files_found'] == 0
+    assert status['accessible_paths'] == [str(tmp_path / 'root')]
+    manager.file_index.stop()
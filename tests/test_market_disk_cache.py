@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental Parquet market-data cache
+"""
+
+import pandas as pd
+
+from ui_components.data_access_disk_cache import MarketDataDiskCache
+
+def make_fetch(last_bar, calls):
+    """Provider stub serving daily bars up to last_bar (end bound exclusive)"""
+    def fetch(start, end):
+        calls.append((start, end))
+        dates = pd.date_range(start, min(pd.Timestamp(end) - pd.Timedelta(days=1), pd.Timestamp(last_bar)), freq='D')
+        return pd.DataFrame({'Date': dates, 'Close': [float(d.day) for d in dates]})
+    return fetch
+
+def make_cache(tmp_path, now):
+    cache = MarketDataDiskCache(str(tmp_path))
+    cache._now = lambda: pd.Timestamp(now)
+    return cache
+
+def test_settled_range_is_held_past_the_last_bar(tmp_path):
+    # A symbol delisted on 2024-01-05 (or a range ending on a weekend) is a full hit afterwards
+    cache, calls = make_cache(tmp_path, '2024-06-03 12:00'), []
+    data = cache.get('yahoo', 'AAPL', '1d', '2024-01-01', '2024-01-10', make_fetch('2024-01-05', calls))
+    assert len(data) == 5
+    assert cache.manifest['yahoo/1d/AAPL']['end'] == pd.Timestamp('2024-01-10').isoformat()
+
+    data = cache.get('yahoo', 'AAPL', '1d', '2024-01-01', '2024-01-10', make_fetch('2024-01-08', calls))
+    assert len(calls) == 1
+    assert len(data) == 5 and cache.get_stats()['full_hits'] == 1
+
+def test_empty_tail_is_not_held_and_rechecked_after_the_ttl(tmp_path):
+    cache, calls = make_cache(tmp_path, '2024-06-03 12:00'), []
+    fetch = make_fetch('2024-01-05', calls)
+    cache.get('yahoo', 'AAPL', '1d', '2024-01-01', '2024-01-10', fetch)
+    cache.get('yahoo', 'AAPL', '1d', '2024-01-01', '2024-01-20', fetch)
+    entry = cache.manifest['yahoo/1d/AAPL']
+    assert entry['end'] == pd.Timestamp('2024-01-10').isoformat()
+    assert entry['empty'][0][:2] == [pd.Timestamp('2024-01-10').isoformat(), pd.Timestamp('2024-01-20').isoformat()]
+
+    # Within the TTL the empty check is trusted; a wider request asks again
+    cache.get('yahoo', 'AAPL', '1d', '2024-01-01', '2024-01-20', fetch)
+    assert len(calls) == 2
+    cache.get('yahoo', 'AAPL', '1d', '2024-01-01', '2024-01-15', fetch)
+    assert len(calls) == 2
+
+    # A transient outage is recovered once the TTL has passed
+    cache._now = lambda: pd.Timestamp('2024-06-03 12:00') + cache.EMPTY_TTL
+    data = cache.get('yahoo', 'AAPL', '1d', '2024-01-01', '2024-01-20', make_fetch('2024-01-20', calls))
+    assert len(calls) == 3 and calls[-1][0] == '2024-01-10'
+    assert data['Date'].max() == pd.Timestamp('2024-01-20') and len(data) == 16
+    entry = cache.manifest['yahoo/1d/AAPL']
+    assert entry['end'] == pd.Timestamp('2024-01-20').isoformat() and entry['empty'] == []
+
+def test_empty_first_fetch_holds_nothing(tmp_path):
+    cache, calls = make_cache(tmp_path, '2024-06-03 12:00'), []
+    fetch = make_fetch('2023-01-01', calls)
+    assert cache.get('yahoo', 'NOPE', '1d', '2024-01-01', '2024-01-10', fetch).empty
+    cache.get('yahoo', 'NOPE', '1d', '2024-01-01', '2024-01-10', fetch)
+    assert len(calls) == 2 and 'yahoo/1d/NOPE' not in cache.manifest
+
+def test_default_end_after_the_close_becomes_a_full_hit(tmp_path):
+    # Wednesday after the close: today's bar is final and nothing new arrives before Thursday
+    cache, calls = make_cache(tmp_path, '2024-01-10 17:00'), []
+    fetch = make_fetch('2024-01-10', calls)
+    cache.get('yahoo', 'MSFT', '1d', '2024-01-01', None, fetch)
+    cache._now = lambda: pd.Timestamp('2024-01-10 23:00')
+    data = cache.get('yahoo', 'MSFT', '1d', '2024-01-01', None, fetch)
+    assert len(calls) == 1
+    assert data['Date'].max() == pd.Timestamp('2024-01-10')
+
+    # Thursday's session is live, so the tail is fetched again
+    cache._now = lambda: pd.Timestamp('2024-01-11 10:00')
+    cache.get('yahoo', 'MSFT', '1d', '2024-01-01', None, make_fetch('2024-01-11', calls))
+    assert len(calls) == 2 and calls[-1][0] == '2024-01-10'
+
+def test_live_session_stays_open(tmp_path):
+    cache, calls = make_cache(tmp_path, '2024-01-10 11:00'), []
+    cache.get('yahoo', 'MSFT', '1d', '2024-01-01', '2024-01-10', make_fetch('2024-01-10', calls))
+    data = cache.get('yahoo', 'MSFT', '1d', '2024-01-01', '2024-01-10', make_fetch('2024-01-10', calls))
+    # Held up to the start of the live session, so the request resumes from the day before
+    assert len(calls) == 2 and calls[-1][0] == '2024-01-09'
+    assert data['Date'].is_unique and len(data) == 10
+
+def test_extensions_append_part_files_and_compact(tmp_path):
+    cache, calls = make_cache(tmp_path, '2024-06-03 12:00'), []
+    cache.MAX_PARTS = 3
+    fetch = make_fetch('2024-12-31', calls)
+    cache.get('yahoo', 'MSFT', '1d', '2024-01-10', '2024-01-20', fetch)
+    cache.get('yahoo', 'MSFT', '1d', '2024-01-10', '2024-01-25', fetch)
+    cache.get('yahoo', 'MSFT', '1d', '2024-01-05', '2024-01-25', fetch)
+    assert len(cache.manifest['yahoo/1d/MSFT']['parts']) == 3
+    assert calls[1][0] == '2024-01-20' and calls[2][0] == '2024-01-05'
+
+    data = cache.get('yahoo', 'MSFT', '1d', '2024-01-05', '2024-01-30', fetch)
+    parts = cache.manifest['yahoo/1d/MSFT']['parts']
+    assert len(parts) == 1
+    assert sorted(p.name for p in (tmp_path / 'yahoo' / '1d' / 'MSFT').iterdir()) == parts
+    assert data['Date'].tolist() == list(pd.date_range('2024-01-05', '2024-01-30', freq='D'))
+
+    calls.clear()
+    assert len(cache.get('yahoo', 'MSFT', '1d', '2024-01-06', '2024-01-07', fetch)) == 2
+    assert calls == []
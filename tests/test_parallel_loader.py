@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the thread-pool file loader
+"""
+
+import threading
+import time
+
+import pytest
+
+from ui_components.data_access_parallel_loader import DataAccessParallelLoader
+
+@pytest.fixture
+def loader():
+    loader = DataAccessParallelLoader(max_workers=4, file_timeout=5)
+    yield loader
+    loader.shutdown()
+
+def test_results_come_back_in_task_order(loader):
+    delays = [0.08, 0.01, 0.05, 0.0, 0.03]
+    tasks = [(f"f{i}", lambda i=i, d=d: time.sleep(d) or i) for i, d in enumerate(delays)]
+    assert loader.load(tasks) == [(f"f{i}", i) for i in range(len(delays))]
+    assert loader.stats['files_loaded'] == len(delays)
+
+def test_files_load_concurrently(loader):
+    running, peak, lock = [0], [0], threading.Lock()
+
+    def task():
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return True
+
+    loader.load([(f"f{i}", task) for i in range(8)])
+    assert peak[0] > 1
+
+def test_failed_files_are_skipped(loader):
+    def fail():
+        raise OSError('unreadable')
+    assert loader.load([('good', lambda: 1), ('bad', fail), ('also good', lambda: 2)]) == [('good', 1), ('also good', 2)]
+    assert loader.stats['files_failed'] == 1
+
+def test_timeout_counts_from_when_a_file_starts():
+    loader = DataAccessParallelLoader(max_workers=2, file_timeout=0.3)
+    try:
+        # Queued tasks wait longer than the timeout in total, but each runs for less
+        tasks = [(f"f{i}", lambda i=i: time.sleep(0.15) or i) for i in range(6)]
+        assert [result for _, result in loader.load(tasks)] == list(range(6))
+        results = loader.load([('slow', lambda: time.sleep(1) or 'slow'), ('fast', lambda: 'fast')])
+        assert results == [('fast', 'fast')]
+        assert loader.stats['files_timed_out'] == 1
+    finally:
+        loader.shutdown()
+
+def test_single_worker_runs_inline():
+    loader = DataAccessParallelLoader(max_workers=1)
+    thread_names = []
+    loader.load([('f', lambda: thread_names.append(threading.current_thread().name))])
+    assert thread_names == [threading.current_thread().name]
+    assert loader._executors == set()
+
+def test_timed_out_read_does_not_hold_a_worker_of_later_loads():
+    loader = DataAccessParallelLoader(max_workers=2, file_timeout=0.2)
+    release = threading.Event()
+    try:
+        assert loader.load([('stuck', lambda: release.wait(5)), ('ok', lambda: 'ok')]) == [('ok', 'ok')]
+        # Both tasks must run at once to pass the barrier; a worker still held by 'stuck' would deadlock them
+        barrier = threading.Barrier(2, timeout=0.15)
+        results = loader.load([(f"f{i}", lambda i=i: barrier.wait() is not None and i) for i in range(2)])
+        assert [name for name, _ in results] == ['f0', 'f1']
+        assert loader.stats == {'files_loaded': 3, 'files_failed': 0, 'files_timed_out': 1}
+    finally:
+        release.set()
+        loader.shutdown()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for symbol and date predicate pushdown in uploaded-file scans
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from ui_components.data_access_file_readers import DataAccessFileReaders
+
+SYMBOLS = ['AAPL', 'AAPL.US', 'AAPLX', 'MSFT']
+
+def make_data():
+    return pd.DataFrame({'Symbol': SYMBOLS * 3, 'Date': pd.date_range('2024-01-01', periods=12),
+                         'Close': [float(i) for i in range(12)], 'Volume': range(12)})
+
+def write(data, tmp_path, format_name):
+    path = tmp_path / f"prices.{format_name}"
+    if format_name == 'parquet':
+        pq.write_table(pa.Table.from_pandas(data, preserve_index=False), path, row_group_size=4)
+    elif format_name == 'feather':
+        data.reset_index(drop=True).to_feather(path)
+    else:
+        data.to_csv(path, index=False)
+    return str(path)
+
+def scan(path, format_name, **kwargs):
+    args = {'symbol': 'AAPL', 'symbol_column': 'Symbol', 'start_date': '2024-01-03',
+            'end_date': '2024-01-09', 'date_column': 'Date', **kwargs}
+    return DataAccessFileReaders(None)._scan_file(path, format_name, **args)
+
+@pytest.mark.parametrize('format_name', ['parquet', 'feather', 'csv'])
+@pytest.mark.parametrize('variant', ['string', 'categorical', 'date', 'tz'])
+def test_symbol_and_date_predicates(tmp_path, format_name, variant):
+    data = make_data()
+    if variant == 'categorical':
+        data['Symbol'] = data['Symbol'].astype('category')
+    elif variant == 'date':
+        data['Date'] = data['Date'].dt.date
+    elif variant == 'tz':
+        data['Date'] = data['Date'].dt.tz_localize('UTC')
+    result = scan(write(data, tmp_path, format_name), format_name)
+    assert result['Symbol'].astype(str).tolist() == ['AAPL', 'AAPL.US', 'AAPL']
+    assert result['Close'].tolist() == [4.0, 5.0, 8.0]
+
+def test_string_dates_are_left_for_the_caller(tmp_path):
+    data = make_data().assign(Date=lambda d: d['Date'].dt.strftime('%Y-%m-%d'))
+    result = scan(write(data, tmp_path, 'parquet'), 'parquet')
+    assert result['Close'].tolist() == [0.0, 1.0, 4.0, 5.0, 8.0, 9.0]
+
+def test_non_string_symbol_column_is_filtered_after_the_scan(tmp_path):
+    data = make_data().assign(Symbol=[1, 2, 3, 4] * 3)
+    result = scan(write(data, tmp_path, 'parquet'), 'parquet', symbol='2')
+    assert result['Close'].tolist() == [5.0]
+
+def test_column_projection_keeps_filter_columns(tmp_path):
+    result = scan(write(make_data(), tmp_path, 'parquet'), 'parquet', columns=['Close'])
+    assert list(result.columns) == ['Symbol', 'Date', 'Close']
+
+SHARE_CLASSES = ['BRK', 'BRK.A', 'BRK.B', 'brk.us']
+
+@pytest.mark.parametrize('format_name', ['parquet', 'feather', 'csv'])
+@pytest.mark.parametrize('symbol', ['BRK', 'brk', 'BRK.US'])
+def test_only_the_exact_ticker_and_its_us_form_match(tmp_path, format_name, symbol):
+    data = pd.DataFrame({'Symbol': SHARE_CLASSES, 'Date': pd.date_range('2024-01-01', periods=4),
+                         'Close': [1.0, 2.0, 3.0, 4.0]})
+    path = write(data, tmp_path, format_name)
+    result = scan(path, format_name, symbol=symbol, start_date=None, end_date=None)
+    assert result['Symbol'].tolist() == ['BRK', 'brk.us']
+    # The full-read fallback (e.g. Feather v1) applies the same rule
+    fallback = DataAccessFileReaders(None)._filter_symbol(data, symbol, 'Symbol')
+    assert fallback['Symbol'].tolist() == ['BRK', 'brk.us']
+    assert scan(path, format_name, symbol='BRK.A', start_date=None, end_date=None)['Close'].tolist() == [2.0]
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for LRU spill-to-disk under a memory budget
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ui_components.global_data_store_spill import SpillableDatasetStore
+
+ROWS = 1000
+
+def make_data(seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({'Date': pd.date_range('2024-01-01', periods=ROWS, freq='min'),
+                         'Close': rng.normal(100, 1, ROWS), 'Volume': rng.integers(0, 10**6, ROWS)})
+
+@pytest.fixture
+def store(tmp_path):
+    size = int(make_data(0).memory_usage(deep=True).sum())
+    store = SpillableDatasetStore(str(tmp_path), budget_bytes=int(size * 1.5))
+    yield store
+    store.cleanup()
+
+def test_least_recently_used_datasets_spill_and_reload_intact(store):
+    for i in range(3):
+        store[f'd{i}'] = make_data(i)
+    assert [store.is_spilled(f'd{i}') for i in range(3)] == [True, True, False]
+    assert store.resident_bytes() <= store.budget_bytes
+    assert len(store) == 3 and store.num_rows('d0') == ROWS
+
+    pd.testing.assert_frame_equal(store['d0'], make_data(0))
+    assert not store.is_spilled('d0') and store.is_spilled('d2')
+    stats = store.get_stats()
+    assert stats['spills'] == 3 and stats['reloads'] == 1
+    assert stats['resident_datasets'] == 1 and stats['spilled_datasets'] == 2
+    assert stats['spilled_disk_bytes'] > 0
+
+def test_recent_access_protects_a_dataset_from_spilling(store):
+    store['d0'] = make_data(0)
+    store['d1'] = make_data(1)   # d0 spills
+    store['d0']                  # reload: d1 spills
+    store['d2'] = make_data(2)   # d0 is the least recent resident, so it spills again
+    assert store.is_spilled('d0') and store.is_spilled('d1') and not store.is_spilled('d2')
+
+def test_overwrite_and_delete_of_spilled_dataset(store):
+    store['d0'] = make_data(0)
+    store['d1'] = make_data(1)
+    store['d0'] = make_data(5)
+    pd.testing.assert_frame_equal(store['d0'], make_data(5))
+    del store['d1']
+    assert 'd1' not in store and len(store) == 1
+    with pytest.raises(KeyError):
+        store['d1']
+
+def test_raising_the_budget_stops_spilling(store):
+    store.set_budget(0)
+    for i in range(3):
+        store[f'd{i}'] = make_data(i)
+    assert not any(store.is_spilled(f'd{i}') for i in range(3))
+    store.set_budget(store._sizes['d0'])
+    assert [store.is_spilled(f'd{i}') for i in range(3)] == [True, True, False]
+
+def test_cleanup_removes_the_process_spill_directory(store, tmp_path):
+    store['d0'] = make_data(0)
+    store['d1'] = make_data(1)
+    spill_dir = store._spill_store.data_dir
+    assert spill_dir.exists()
+    store.cleanup()
+    assert not spill_dir.exists()
+    assert list(store) == ['d1']
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for chunked CSV ingest against a single read_csv of the same file
+"""
+
+import io
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from modular_panels.data_upload.streaming_ingest import StreamingCSVIngest
+from modular_panels.data_upload.data_manager_integration import DataManagerIntegration
+
+def _csv_bytes(rows=2000):
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'Date': pd.date_range('2020-01-01', periods=rows, freq='D').strftime('%Y-%m-%d'),
+        'Symbol': rng.choice(['AAPL', 'MSFT', 'SPY'], rows),
+        'Close': rng.normal(100, 5, rows).round(4),
+        'Volume': rng.integers(0, 10**9, rows)
+    })
+    return data.to_csv(index=False).encode()
+
+def _read_arrow(path):
+    with pa.memory_map(str(path), 'r') as source:
+        return pa.ipc.open_file(source).read_all().to_pandas()
+
+@pytest.mark.parametrize('from_bytes', [True, False])
+def test_chunked_ingest_matches_full_read_csv(tmp_path, from_bytes):
+    content = _csv_bytes()
+    source = content
+    if not from_bytes:
+        source = tmp_path / 'prices.csv'
+        source.write_bytes(content)
+    output = tmp_path / 'prices.arrow'
+
+    result = StreamingCSVIngest(block_size=4096).ingest(source, str(output), 'arrow')
+
+    assert result['batches'] > 1
+    expected = pd.read_csv(io.BytesIO(content), parse_dates=['Date'])
+    ingested = _read_arrow(output)
+    assert result['rows'] == len(expected)
+    pd.testing.assert_frame_equal(ingested, expected, check_dtype=False)
+    assert ingested['Volume'].dtype == np.int64
+
+def test_late_mismatch_falls_back_to_string(tmp_path):
+    content = _csv_bytes(500) + b'2021-06-01,AAPL,halted,1\n'
+    output = tmp_path / 'prices.arrow'
+
+    result = StreamingCSVIngest(block_size=4096).ingest(content, str(output), 'arrow')
+
+    assert result['string_fallback_columns'] == ['Close']
+    assert _read_arrow(output)['Close'].iloc[-1] == 'halted'
+
+class _RecordingManager:
+    def __init__(self):
+        self.files = {}
+
+    def add_uploaded_file(self, key, file_path, metadata=None):
+        self.files[key] = (_read_arrow(file_path), metadata)
+        return f"uploaded_{key}"
+
+def test_large_byte_upload_is_streamed_and_registered(tmp_path, monkeypatch):
+    monkeypatch.setattr(DataManagerIntegration, 'STREAMING_THRESHOLD', 1024)
+    monkeypatch.setattr(DataManagerIntegration, 'INGEST_DIR', str(tmp_path / 'ingested'))
+    manager = _RecordingManager()
+    integration = DataManagerIntegration(manager)
+    integration.streaming_ingest = StreamingCSVIngest(block_size=4096)
+    content = _csv_bytes()
+
+    assert integration.should_stream(content, 'prices.csv')
+    assert not integration.should_stream(content, 'prices.json')
+    assert not integration.should_stream(content[:512], 'prices.csv')
+
+    dataset_id, metadata = integration.ingest_csv_bytes(content, 'prices.csv')
+    assert dataset_id == 'uploaded_prices'
+    data, registered = manager.files['prices']
+    assert registered['original_filename'] == 'prices.csv'
+    pd.testing.assert_frame_equal(data, pd.read_csv(io.BytesIO(content), parse_dates=['Date']), check_dtype=False)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the ingest-time symbol universe index
+"""
+
+import pandas as pd
+import pyarrow as pa
+
+from ui_components.symbol_index import SymbolIndex
+
+def make_prices(symbols, start='2024-01-01', periods=3):
+    dates = pd.date_range(start, periods=periods, freq='D')
+    return pd.DataFrame({'Date': [d for _ in symbols for d in dates],
+                         'Ticker': [s for s in symbols for _ in dates],
+                         'Close': 1.0})
+
+def test_add_dataset_records_ids_and_coverage():
+    index = SymbolIndex()
+    assert index.add_dataset('a', make_prices(['MSFT', 'AAPL'])) == ['MSFT', 'AAPL']
+    assert index.get_symbols() == ['AAPL', 'MSFT']
+    assert index.get_id('aapl ') == 1 and index.get_symbol(1) == 'AAPL'
+    coverage = index.get_coverage('AAPL')['a']
+    assert coverage['rows'] == 3
+    assert coverage['start'] == pd.Timestamp('2024-01-01') and coverage['end'] == pd.Timestamp('2024-01-03')
+
+def test_second_dataset_only_adds_new_symbols():
+    index = SymbolIndex()
+    index.add_dataset('a', make_prices(['AAPL']))
+    assert index.add_dataset('b', make_prices(['AAPL', 'IBM'], start='2024-02-01')) == ['IBM']
+    assert index.get_datasets('AAPL') == ['a', 'b']
+    assert index.get_dataset_symbols('b') == ['AAPL', 'IBM']
+
+def test_case_variants_merge_into_one_symbol():
+    index = SymbolIndex()
+    data = pd.concat([make_prices(['AAPL']), make_prices(['aapl'], start='2024-03-01')])
+    index.add_dataset('a', data)
+    coverage = index.get_coverage('AAPL')['a']
+    assert coverage['rows'] == 6 and coverage['end'] == pd.Timestamp('2024-03-03')
+    assert index.get_stats()['symbols'] == 1
+
+def test_remove_and_readd_restores_coverage_and_keeps_ids():
+    index = SymbolIndex()
+    index.add_dataset('a', make_prices(['AAPL', 'MSFT']))
+    index.add_dataset('b', make_prices(['MSFT']))
+    aapl_id = index.get_id('AAPL')
+
+    index.remove_dataset('a')
+    assert index.get_symbols() == ['MSFT']
+    assert index.get_symbols(with_data_only=False) == ['AAPL', 'MSFT']
+    assert index.get_datasets('MSFT') == ['b'] and not index.is_indexed('a')
+
+    assert index.add_dataset('a', make_prices(['AAPL'])) == []
+    assert index.get_id('AAPL') == aapl_id
+    assert index.get_symbols() == ['AAPL', 'MSFT']
+    assert index.get_coverage('AAPL')['a']['rows'] == 3
+    assert index.get_datasets('MSFT') == ['b']
+
+def test_reindexing_a_dataset_replaces_its_coverage():
+    index = SymbolIndex()
+    index.add_dataset('a', make_prices(['AAPL', 'MSFT']))
+    index.add_dataset('a', make_prices(['AAPL'], periods=5))
+    assert index.get_coverage('AAPL')['a']['rows'] == 5
+    assert index.get_datasets('MSFT') == []
+
+def test_sync_drops_missing_datasets():
+    index = SymbolIndex()
+    index.add_dataset('a', make_prices(['AAPL']))
+    index.add_dataset('b', make_prices(['IBM']))
+    assert index.sync({'b'}) == 1
+    assert index.get_symbols() == ['IBM']
+
+def test_dataset_without_symbols_is_marked_indexed():
+    index = SymbolIndex()
+    assert index.add_dataset('x', pd.DataFrame({'Value': [1.5, 2.5]})) == []
+    assert index.is_indexed('x') and index.get_dataset_symbols('x') == []
+
+def test_add_table_reads_symbol_and_date_columns():
+    index = SymbolIndex()
+    table = pa.Table.from_pandas(make_prices(['AAPL', 'MSFT']), preserve_index=False)
+    assert index.add_table('t', table) == ['AAPL', 'MSFT']
+    assert index.get_coverage('MSFT')['t']['end'] == pd.Timestamp('2024-01-03')
+
+def test_encode_and_decode_round_trip():
+    index = SymbolIndex()
+    index.add_dataset('a', make_prices(['AAPL', 'MSFT']))
+    codes = index.encode(['msft', 'AAPL', 'ZZZZ'])
+    assert codes.dtype == 'int32' and codes.tolist() == [1, 0, -1]
+    assert index.decode(codes) == ['MSFT', 'AAPL', None]
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized synthetic OHLCV generator
+"""
+
+import numpy as np
+import pandas as pd
+
+from ui_components.synthetic_ohlcv import SyntheticOHLCVGenerator
+
+SYMBOLS = ['AAPL', 'MSFT', 'SPY']
+
+def test_frame_shape_order_and_bar_invariants():
+    data = SyntheticOHLCVGenerator(seed=1).generate_frame(SYMBOLS, '2024-01-01', '2024-03-31')
+    days = len(pd.date_range('2024-01-01', '2024-03-31'))
+    assert len(data) == days * len(SYMBOLS)
+    assert data['Symbol'].tolist() == [s for s in SYMBOLS for _ in range(days)]
+    for _, bars in data.groupby('Symbol'):
+        assert bars['Date'].is_monotonic_increasing
+        np.testing.assert_array_equal(bars['Open'].to_numpy()[1:], bars['Close'].to_numpy()[:-1])
+    assert (data['High'] >= data[['Open', 'Close']].max(axis=1)).all()
+    assert (data['Low'] <= data[['Open', 'Close']].min(axis=1)).all()
+    assert (data['Low'] > 0).all()
+    assert data['Volume'].dtype == np.int64 and (data['Volume'] >= 0).all()
+
+def test_same_inputs_give_the_same_bars():
+    first = SyntheticOHLCVGenerator(seed=7).generate_frame(SYMBOLS, '2024-01-01', '2024-02-01')
+    second = SyntheticOHLCVGenerator(seed=7).generate_frame(SYMBOLS, '2024-01-01', '2024-02-01')
+    other = SyntheticOHLCVGenerator(seed=8).generate_frame(SYMBOLS, '2024-01-01', '2024-02-01')
+    pd.testing.assert_frame_equal(first, second)
+    assert not np.allclose(first['Close'], other['Close'])
+
+def test_walk_starts_from_the_symbol_base_price():
+    generator = SyntheticOHLCVGenerator(seed=0)
+    data = generator.generate_frame('AAPL', '2024-01-01', '2024-01-05')
+    assert data['Open'].iloc[0] == generator.base_price('AAPL')
+    assert 100 <= generator.base_price('AAPL') < 1000
+
+def test_chunks_continue_the_walk():
+    generator = SyntheticOHLCVGenerator(seed=3)
+    chunks = list(generator.iter_chunks(SYMBOLS, '2024-01-01', '2024-01-02', timeframe='1h', chunk_bars=10))
+    assert [len(chunk) for chunk in chunks] == [30, 30, 15]
+    for previous, chunk in zip(chunks, chunks[1:]):
+        for symbol in SYMBOLS:
+            last_close = previous.loc[previous['Symbol'] == symbol, 'Close'].iloc[-1]
+            assert chunk.loc[chunk['Symbol'] == symbol, 'Open'].iloc[0] == last_close
+    dates = pd.concat(chunks).query("Symbol == 'AAPL'")['Date']
+    assert dates.is_monotonic_increasing and dates.is_unique
+
+def test_volatility_scales_with_bar_length():
+    generator = SyntheticOHLCVGenerator(annual_volatility=0.4, seed=5)
+    symbols = [f"S{i}" for i in range(200)]
+    arrays = generator.generate(symbols, generator.make_dates('2020-01-01', '2023-12-31'))
+    returns = np.diff(np.log(arrays['close']), axis=0)
+    np.testing.assert_allclose(returns.std(), 0.4 * np.sqrt(1 / 365), rtol=0.02)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for TimeIndex build/slice round trips
+"""
+
+import pandas as pd
+
+from ui_components.time_index import TimeIndex
+
+def test_build_sorts_parsed_strings_and_slices():
+    data = pd.DataFrame({'Date': ['2024-01-03', '2024-01-01', '2024-01-02'], 'Close': [3.0, 1.0, 2.0]})
+    built = TimeIndex.build(data)
+    assert built.attrs[TimeIndex.ATTR_COLUMN] == 'Date'
+    assert TimeIndex.is_sorted(built, 'Date')
+    assert built['Close'].tolist() == [1.0, 2.0, 3.0]
+    assert data['Date'].tolist() == ['2024-01-03', '2024-01-01', '2024-01-02']   # input untouched
+    assert TimeIndex.slice(built, '2024-01-02', '2024-01-03')['Close'].tolist() == [2.0, 3.0]
+
+def test_build_parses_integer_dates_as_yyyymmdd():
+    data = pd.DataFrame({'date': [20240103, 20240101, 20240102], 'Close': [3.0, 1.0, 2.0]})
+    built = TimeIndex.build(data)
+    assert built['date'].tolist() == [pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-02'),
+                                      pd.Timestamp('2024-01-03')]
+    assert TimeIndex.slice(built, '2024-01-02', None)['Close'].tolist() == [2.0, 3.0]
+
+def test_build_leaves_non_date_time_column_unchanged():
+    data = pd.DataFrame({'Time': ['open', 'close', 'open'], 'Close': [1.0, 2.0, 3.0]})
+    built = TimeIndex.build(data)
+    assert built is data
+    assert TimeIndex.ATTR_COLUMN not in built.attrs
+    assert len(built) == 3
+
+def test_build_leaves_partially_parseable_strings_unchanged():
+    # The second value does not match the format inferred from the first
+    data = pd.DataFrame({'Date': ['13/01/2024', '01/14/2024', 'n/a'], 'Close': [1.0, 2.0, 3.0]})
+    built = TimeIndex.build(data)
+    assert built is data
+    assert built['Date'].tolist() == ['13/01/2024', '01/14/2024', 'n/a']
+
+def test_build_keeps_rows_with_missing_times():
+    data = pd.DataFrame({'Date': ['2024-01-02', None, '2024-01-01'], 'Close': [2.0, 0.0, 1.0]})
+    built = TimeIndex.build(data)
+    assert len(built) == 3
+    assert built['Close'].tolist() == [2.0, 0.0, 1.0]
+    assert built.attrs[TimeIndex.ATTR_COLUMN] == 'Date'
+    # Only the query result leaves out the row without a time
+    assert TimeIndex.slice(built, '2024-01-01', '2024-01-31')['Close'].tolist() == [2.0, 1.0]
+
+def test_slice_fallback_on_unbuilt_frame():
+    data = pd.DataFrame({'Date': [20240103, 20240101, 20240102], 'Close': [3.0, 1.0, 2.0]})
+    assert TimeIndex.slice(data, '2024-01-02', '2024-01-03')['Close'].tolist() == [3.0, 2.0]
+
+def test_slice_timezone_aware_column():
+    dates = pd.date_range('2024-01-01', periods=5, freq='D', tz='UTC')
+    built = TimeIndex.build(pd.DataFrame({'timestamp': dates, 'Close': range(5)}))
+    assert TimeIndex.slice(built, '2024-01-02', '2024-01-03')['Close'].tolist() == [1, 2]
+
+def test_sorted_check_is_cached_after_build(monkeypatch):
+    data = pd.DataFrame({'Date': pd.date_range('2024-01-01', periods=1000, freq='h')[::-1], 'Close': range(1000)})
+    built = TimeIndex.build(data)
+    checks = []
+    original = pd.Series.is_monotonic_increasing
+    monkeypatch.setattr(pd.Series, 'is_monotonic_increasing',
+                        property(lambda series: checks.append(1) or original.fget(series)))
+    for _ in range(5):
+        assert len(TimeIndex.slice(built, '2024-01-02', '2024-01-03')) == 25
+    assert checks == []
+
+def test_reordered_frame_is_not_trusted_from_attrs():
+    built = TimeIndex.build(pd.DataFrame({'Date': pd.date_range('2024-01-01', periods=5), 'Close': range(5)}))
+    shuffled = built.iloc[[3, 0, 4, 1, 2]]
+    assert shuffled.attrs.get(TimeIndex.ATTR_SORTED) == built.attrs[TimeIndex.ATTR_SORTED]
+    assert not TimeIndex.is_sorted(shuffled, 'Date')
+    assert TimeIndex.slice(shuffled, '2024-01-02', '2024-01-03')['Close'].tolist() == [1, 2]
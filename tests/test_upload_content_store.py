@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for content-addressed upload deduplication
+"""
+
+import os
+
+from ui_components.upload_content_store import UploadContentStore
+
+def test_identical_files_are_stored_once(tmp_path):
+    store = UploadContentStore(str(tmp_path / 'uploads'))
+    first, second = tmp_path / 'a.csv', tmp_path / 'b.csv'
+    first.write_bytes(b'Date,Close\n2024-01-01,1\n')
+    second.write_bytes(first.read_bytes())
+
+    stored = store.store_file(str(first))
+    repeat = store.store_file(str(second))
+    assert not stored['duplicate'] and repeat['duplicate']
+    assert repeat['path'] == stored['path'] and repeat['digest'] == stored['digest']
+    assert repeat['filenames'] == ['a.csv', 'b.csv']
+    stats = store.get_stats()
+    assert stats['unique_blobs'] == 1 and stats['duplicates'] == 1 and stats['bytes_saved'] == first.stat().st_size
+    assert sorted(p.name for p in (tmp_path / 'uploads').iterdir() if not p.name.startswith('.')) == \
+        [os.path.basename(stored['path'])]
+
+def test_bytes_and_files_share_digests(tmp_path):
+    store = UploadContentStore(str(tmp_path / 'uploads'))
+    source = tmp_path / 'a.csv'
+    source.write_bytes(b'x,y\n1,2\n')
+    from_bytes = store.store_bytes(source.read_bytes(), 'upload.csv')
+    from_file = store.store_file(str(source))
+    assert from_file['duplicate'] and from_file['digest'] == from_bytes['digest']
+    assert store.store_bytes(b'x,y\n1,3\n', 'upload.csv')['duplicate'] is False
+
+def test_dataset_links_survive_a_restart(tmp_path):
+    upload_dir = str(tmp_path / 'uploads')
+    store = UploadContentStore(upload_dir)
+    stored = store.store_bytes(b'content', 'a.csv')
+    store.link_dataset(stored['digest'], 'uploaded_a', 'a.csv')
+
+    reopened = UploadContentStore(upload_dir)
+    assert reopened.get_dataset_id(stored['digest']) == 'uploaded_a'
+    assert reopened.store_bytes(b'content', 'again.csv')['duplicate']
+
+def test_deleted_blob_is_stored_again(tmp_path):
+    store = UploadContentStore(str(tmp_path / 'uploads'))
+    stored = store.store_bytes(b'content', 'a.csv')
+    store.link_dataset(stored['digest'], 'uploaded_a')
+    os.remove(stored['path'])
+    assert store.get_dataset_id(stored['digest']) is None
+    again = store.store_bytes(b'content', 'a.csv')
+    assert not again['duplicate'] and os.path.exists(again['path'])
+
+def test_unchanged_source_is_not_rehashed(tmp_path, monkeypatch):
+    store = UploadContentStore(str(tmp_path / 'uploads'))
+    source = tmp_path / 'a.csv'
+    source.write_bytes(b'x\n1\n')
+    os.utime(source, (1_700_000_000, 1_700_000_000))
+    digest = store.digest_file(str(source))
+    monkeypatch.setattr('builtins.open', lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError('rehashed')))
+    assert store.digest_file(str(source)) == digest
+    monkeypatch.undo()
+    source.write_bytes(b'x\n2\n')
+    os.utime(source, (1_700_000_100, 1_700_000_100))
+    assert store.digest_file(str(source)) != digest
+
+def test_recently_modified_source_is_always_rehashed(tmp_path):
+    store = UploadContentStore(str(tmp_path / 'uploads'))
+    source = tmp_path / 'a.csv'
+    source.write_bytes(b'x\n1\n')
+    digest = store.digest_file(str(source))
+    # Rewritten with the same size and mtime, as within one filesystem timestamp tick
+    mtime = source.stat().st_mtime
+    source.write_bytes(b'x\n2\n')
+    os.utime(source, (mtime, mtime))
+    assert store.digest_file(str(source)) != digest
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for loading uploads straight from their bytes
+"""
+
+import io
+import sqlite3
+
+import duckdb
+import pandas as pd
+import pytest
+
+from modular_panels.data_upload.database_loaders import DatabaseLoaders
+from modular_panels.data_upload.database_processors import DatabaseProcessors
+from modular_panels.data_upload.file_loaders import FileLoaders
+from modular_panels.data_upload.file_processors import FileProcessors
+
+def make_data():
+    return pd.DataFrame({'Date': pd.date_range('2024-01-01', periods=3), 'Symbol': ['A', 'B', 'C'],
+                         'Close': [1.5, 2.5, 3.5]})
+
+def to_bytes(writer):
+    buffer = io.BytesIO()
+    writer(buffer)
+    return buffer.getvalue()
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(DatabaseLoaders, 'UPLOAD_DIR', str(tmp_path))
+    return tmp_path
+
+@pytest.mark.parametrize('format_name', ['feather', 'parquet', 'excel'])
+def test_columnar_and_excel_uploads_load_from_bytes(format_name):
+    writers = {'feather': make_data().to_feather, 'parquet': lambda b: make_data().to_parquet(b),
+               'excel': lambda b: make_data().to_excel(b, index=False)}
+    content = to_bytes(writers[format_name])
+    loaded = getattr(FileLoaders, f"load_{format_name}_file")(content)
+    processed, metadata = getattr(FileProcessors, f"process_{format_name}")(content, f"prices.{format_name}")
+    pd.testing.assert_frame_equal(loaded, make_data(), check_dtype=False)
+    pd.testing.assert_frame_equal(processed, loaded)
+    assert metadata['shape'] == (3, 3) and metadata['format'] == format_name
+
+def test_csv_upload_loads_from_bytes():
+    loaded = FileLoaders.load_csv_file(make_data().to_csv(index=False).encode())
+    assert loaded['Close'].tolist() == [1.5, 2.5, 3.5]
+
+def duckdb_bytes(tmp_path):
+    path = tmp_path / 'source.duckdb'
+    con = duckdb.connect(str(path))
+    data = make_data()
+    con.execute('CREATE TABLE prices AS SELECT * FROM data')
+    con.close()
+    return path.read_bytes()
+
+def sqlite_bytes(tmp_path):
+    path = tmp_path / 'source.db'
+    con = sqlite3.connect(path)
+    make_data().assign(Date=lambda d: d['Date'].astype(str)).to_sql('prices', con, index=False)
+    con.close()
+    return path.read_bytes()
+
+@pytest.mark.parametrize('kind', ['duckdb', 'sqlite'])
+def test_database_uploads_are_stored_once_and_read(kind, upload_dir, tmp_path_factory):
+    content = (duckdb_bytes if kind == 'duckdb' else sqlite_bytes)(tmp_path_factory.mktemp('source'))
+    loader = getattr(DatabaseLoaders, f"load_{kind}_file")
+    data = loader(content, f"prices.{kind}")
+    assert data['Close'].tolist() == [1.5, 2.5, 3.5]
+
+    processed, metadata = getattr(DatabaseProcessors, f"process_{kind}")(content, f"copy.{kind}")
+    assert metadata['table_name'] == 'prices' and metadata['shape'] == (3, 3)
+    stored = [p for p in upload_dir.iterdir() if not p.name.startswith('.')]
+    assert [str(p) for p in stored] == [metadata['file_path']]
+    assert not list(upload_dir.glob('*.tmp'))
+
+@pytest.mark.parametrize('kind', ['duckdb', 'sqlite'])
+def test_unreadable_database_upload_is_not_kept(kind, upload_dir):
+    with pytest.raises(Exception):
+        getattr(DatabaseLoaders, f"load_{kind}_file")(b'not a database' * 100, f"broken.{kind}")
+    assert [p.name for p in upload_dir.iterdir() if not p.name.startswith('.')] == []
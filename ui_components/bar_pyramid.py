@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+TradePulse OHLCV Bar Pyramid
+Cached multi-resolution OHLCV levels (1m → 5m → 15m → 1h → 1d) per symbol
+"""
+
+import pandas as pd
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, Optional, Any, Callable, Hashable
+import logging
+import threading
+import os
+
+from .synthetic_ohlcv import SyntheticOHLCVGenerator
+from .symbol_index import symbol_variants
+
+logger = logging.getLogger(__name__)
+
+class OHLCVBarPyramid:
+    """Pre-aggregated OHLCV levels per series, each level built from the one below it
+
+    Building a pyramid aggregates the raw bars once; every later request for a timeframe,
+    range or bar budget is answered by slicing the coarsest cached level that satisfies it.
+    Timeframes between levels (30m, 4h) are aggregated from the nearest finer level and cached.
+    """
+
+    LEVELS = ['1m', '5m', '15m', '1h', '1d']
+    SYMBOL_COLUMNS = ['symbol', 'ticker', 'code']
+    COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+    MAX_SERIES = int(os.getenv('TRADEPULSE_PYRAMID_MAX_SERIES', '64'))
+
+    def __init__(self, max_series: Optional[int] = None):
+        self.max_series = max_series or self.MAX_SERIES
+        self._series = OrderedDict()   # key -> {'version', 'base', 'levels': {timeframe: bars}}
+        self._lock = threading.RLock()
+        self.stats = {'builds': 0, 'hits': 0, 'aggregations': 0}
+
+    @staticmethod
+    def to_delta(timeframe: str) -> pd.Timedelta:
+        """Get the bar length of a timeframe ('5m', '1h', '1d' or a pandas frequency)"""
+        freq = SyntheticOHLCVGenerator.FREQ_MAPPING.get(timeframe, timeframe)
+        return pd.Timedelta(freq if freq[:1].isdigit() else f"1{freq}")
+
+    def normalize(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Get OHLCV bars indexed by a sorted, unique DatetimeIndex from a raw upload/provider frame
+
+        Levels are aggregated over contiguous runs, so the input must be one series: rows of several
+        symbols are rejected, and duplicate timestamps (e.g. AAPL and AAPL.US rows from two files)
+        keep the last row read.
+        """
+        lowered = {str(col).lower(): col for col in data.columns}
+        symbol_col = next((lowered[name] for name in self.SYMBOL_COLUMNS if name in lowered), None)
+        if symbol_col is not None:
+            symbols = {symbol_variants(str(s))[0] for s in data[symbol_col].dropna().unique()}
+            if len(symbols) > 1:
+                raise ValueError(f"OHLCV data mixes several symbols ({', '.join(sorted(symbols)[:5])}); "
+                                 f"build one pyramid per symbol")
+        columns = {lowered[name.lower()]: name for name in self.COLUMNS if name.lower() in lowered}
+        if 'Close' not in columns.values():
+            raise ValueError("OHLCV data needs at least a Close column")
+        bars = data[list(columns)].rename(columns=columns)
+        if not isinstance(bars.index, pd.DatetimeIndex):
+            date_col = next((lowered[c] for c in ['date', 'timestamp', 'datetime', 'time'] if c in lowered), None)
+            if date_col is None:
+                raise ValueError("OHLCV data needs a DatetimeIndex or a Date column")
+            bars.index = pd.DatetimeIndex(pd.to_datetime(data[date_col]), name='Date')
+        bars = bars[~bars.index.isna()]
+        if not bars.index.is_monotonic_increasing:
+            bars = bars.sort_index(kind='mergesort')
+        duplicated = bars.index.duplicated(keep='last')
+        if duplicated.any():
+            logger.warning(f"⚠️ Bar pyramid: dropping {int(duplicated.sum())} bars with duplicate timestamps")
+            bars = bars[~duplicated]
+        for name in self.COLUMNS:
+            if name not in bars.columns:
+                bars[name] = bars['Close'] if name != 'Volume' else 0.0
+        return bars[self.COLUMNS].astype(np.float64)
+
+    def aggregate(self, bars: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+        """Aggregate sorted bars into timeframe buckets (empty buckets are skipped)"""
+        self.stats['aggregations'] += 1
+        if bars.empty:
+            return bars
+        bucket_index = bars.index.floor(self.to_delta(timeframe))
+        buckets = bucket_index.asi8
+        # Sorted input: each bucket is a contiguous run, so ufunc.reduceat aggregates all runs at once
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(buckets)] - 1
+        values = {name: bars[name].to_numpy() for name in self.COLUMNS}
+        result = pd.DataFrame({
+            'Open': values['Open'][starts],
+            'High': np.maximum.reduceat(values['High'], starts),
+            'Low': np.minimum.reduceat(values['Low'], starts),
+            'Close': values['Close'][ends],
+            'Volume': np.add.reduceat(values['Volume'], starts)
+        }, index=bucket_index[starts].rename('Date'))
+        return result
+
+    def build(self, key: Hashable, data: pd.DataFrame, version: Any = None) -> Dict[str, pd.DataFrame]:
+        """Build (or rebuild) the pyramid for a series from raw bars"""
+        bars = self.normalize(data)
+        spacing = bars.index.to_series().diff().median() if len(bars) > 1 else pd.Timedelta(days=1)
+        # The raw bars become the finest level they are at least as fine as
+        base = next((tf for tf in reversed(self.LEVELS) if self.to_delta(tf) <= spacing), self.LEVELS[0])
+        levels = {base: bars}
+        previous = bars
+        for timeframe in self.LEVELS[self.LEVELS.index(base) + 1:]:
+            previous = levels[timeframe] = self.aggregate(previous, timeframe)
+
+        with self._lock:
+            self._series[key] = {'version': version, 'base': base, 'levels': levels}
+            self._series.move_to_end(key)
+            while len(self._series) > self.max_series:
+                self._series.popitem(last=False)
+            self.stats['builds'] += 1
+        logger.info(f"🔺 Bar pyramid: {key} built from {len(bars)} {base} bars "
+                    f"({', '.join(f'{tf}={len(b)}' for tf, b in levels.items())})")
+        return levels
+
+    def get_or_build(self, key: Hashable, loader: Callable[[], pd.DataFrame], version: Any = None,
+                     **query) -> pd.DataFrame:
+        """Serve a query from the cached pyramid, loading and building it when missing or stale"""
+        with self._lock:
+            series = self._series.get(key)
+            current = series is not None and series['version'] == version
+        if not current:
+            data = loader()
+            if data is None or data.empty:
+                return pd.DataFrame()
+            self.build(key, data, version)
+        else:
+            self.stats['hits'] += 1
+        return self.get(key, **query)
+
+    def get(self, key: Hashable, timeframe: Optional[str] = None, start=None, end=None,
+            max_bars: Optional[int] = None) -> pd.DataFrame:
+        """Get bars for a range at a timeframe, or at the finest level within max_bars bars"""
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                return pd.DataFrame()
+            self._series.move_to_end(key)
+            levels = series['levels']
+            start = pd.Timestamp(start) if start is not None else None
+            end = pd.Timestamp(end) if end is not None else None
+
+            if timeframe:
+                bars = self._level_for(series, timeframe)
+            elif max_bars:
+                # Finest level that fits the bar budget for this range (zoomed out → coarse levels)
+                ordered = [tf for tf in self.LEVELS if tf in levels]
+                bars = levels[ordered[-1]]
+                for tf in ordered:
+                    if len(self._slice(levels[tf], start, end)) <= max_bars:
+                        bars = levels[tf]
+                        break
+            else:
+                bars = levels[series['base']]
+        return self._slice(bars, start, end).reset_index()
+
+    def _level_for(self, series: Dict[str, Any], timeframe: str) -> pd.DataFrame:
+        """Get a cached level for a timeframe, aggregating it from the nearest finer level once"""
+        levels = series['levels']
+        if timeframe in levels:
+            return levels[timeframe]
+        wanted = self.to_delta(timeframe)
+        finer = [tf for tf in levels if self.to_delta(tf) <= wanted and wanted % self.to_delta(tf) == pd.Timedelta(0)]
+        if not finer:
+            return levels[series['base']]  # finer than the raw data
+        source = max(finer, key=self.to_delta)
+        if self.to_delta(source) == wanted:
+            return levels[source]
+        levels[timeframe] = self.aggregate(levels[source], timeframe)
+        return levels[timeframe]
+
+    @staticmethod
+    def _slice(bars: pd.DataFrame, start, end) -> pd.DataFrame:
+        """Slice a sorted level by time with binary search"""
+        index = bars.index
+        i = index.searchsorted(start, side='left') if start is not None else 0
+        j = index.searchsorted(end, side='right') if end is not None else len(index)
+        return bars.iloc[i:j]
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop one cached series, or all of them"""
+        with self._lock:
+            if key is None:
+                self._series.clear()
+            else:
+                self._series.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            return {**self.stats, 'series': len(self._series)}
+
+# Global instance
+_bar_pyramid = None
+
+def get_bar_pyramid() -> OHLCVBarPyramid:
+    """Get the global bar pyramid instance"""
+    global _bar_pyramid
+    if _bar_pyramid is None:
+        _bar_pyramid = OHLCVBarPyramid()
+    return _bar_pyramid
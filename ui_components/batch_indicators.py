@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+TradePulse Batch Indicators
+Vectorized indicators over aligned time × symbol price matrices
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+class BatchIndicators:
+    """Compute indicators for every symbol at once on (time, symbol) float64 matrices
+
+    Rows are bars in time order and columns are symbols; NaN marks a missing bar (a symbol not
+    yet listed, or a gap). Window indicators use cumulative sums along the time axis; recursive
+    ones (EMA, Wilder RSI/ATR) loop over rows with one vector operation per row, so the Python
+    loop runs once per bar, not once per bar per symbol. Results match pandas rolling()/ewm() on
+    each column.
+    """
+
+    DATE_COLUMNS = ['Date', 'date', 'timestamp', 'datetime']
+    SYMBOL_COLUMNS = ['Symbol', 'symbol', 'Ticker', 'ticker', 'code']
+
+    @staticmethod
+    def to_matrix(data: pd.DataFrame, value: str = 'Close', date_col: Optional[str] = None,
+                  symbol_col: Optional[str] = None) -> Dict[str, Any]:
+        """Pivot long (date, symbol, value) rows to {'values', 'dates', 'symbols'} (last duplicate wins)"""
+        date_col = date_col or next(c for c in BatchIndicators.DATE_COLUMNS if c in data.columns)
+        symbol_col = symbol_col or next(c for c in BatchIndicators.SYMBOL_COLUMNS if c in data.columns)
+        date_codes, dates = pd.factorize(pd.to_datetime(data[date_col]), sort=True)
+        symbol_codes, symbols = pd.factorize(data[symbol_col], sort=True)
+        values = np.full((len(dates), len(symbols)), np.nan)
+        valid = (date_codes >= 0) & (symbol_codes >= 0)
+        values[date_codes[valid], symbol_codes[valid]] = pd.to_numeric(data[value], errors='coerce').to_numpy(
+            dtype=np.float64, na_value=np.nan)[valid]
+        return {'values': values, 'dates': pd.DatetimeIndex(dates), 'symbols': pd.Index(symbols)}
+
+    @staticmethod
+    def _moving_sum(values: np.ndarray, window: int) -> np.ndarray:
+        """Sum of each full window along the time axis from one cumulative sum (NaN before the first window)"""
+        cumulative = np.zeros((len(values) + 1,) + values.shape[1:])
+        np.cumsum(values, axis=0, out=cumulative[1:])
+        result = np.full(values.shape, np.nan)
+        result[window - 1:] = cumulative[window:] - cumulative[:-window]
+        return result
+
+    @staticmethod
+    def _rolling_moments(values: np.ndarray, window: int, ddof: int = 1):
+        """Get the rolling mean and standard deviation over full windows (NaN if a bar is missing)"""
+        valid = ~np.isnan(values)
+        # Centering each column first keeps the sum-of-squares formula numerically stable
+        center = np.where(valid, values, 0.0).sum(axis=0) / np.maximum(valid.sum(axis=0), 1)
+        centered = np.where(valid, values - center, 0.0)
+        full = BatchIndicators._moving_sum(valid, window) == window
+        sums = BatchIndicators._moving_sum(centered, window)
+        squares = BatchIndicators._moving_sum(centered * centered, window)
+        mean = np.where(full, sums / window + center, np.nan)
+        variance = (squares - sums * sums / window) / (window - ddof)
+        return mean, np.where(full, np.sqrt(np.maximum(variance, 0.0)), np.nan)
+
+    @staticmethod
+    def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+        """Rolling mean over full windows (NaN when any bar in the window is missing)"""
+        full = BatchIndicators._moving_sum(~np.isnan(values), window) == window
+        sums = BatchIndicators._moving_sum(np.nan_to_num(values), window)
+        return np.where(full, sums / window, np.nan)
+
+    @staticmethod
+    def rolling_std(values: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+        """Rolling standard deviation over full windows"""
+        return BatchIndicators._rolling_moments(values, window, ddof)[1]
+
+    @staticmethod
+    def zscore(values: np.ndarray, window: int = 20) -> np.ndarray:
+        """Distance of each bar from its rolling mean, in rolling standard deviations"""
+        mean, std = BatchIndicators._rolling_moments(values, window)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (values - mean) / std
+
+    @staticmethod
+    def ema(values: np.ndarray, span: int) -> np.ndarray:
+        """Adjusted EMA per column (pandas ewm(span, adjust=True)); missing bars carry the last value"""
+        decay = 1.0 - 2.0 / (span + 1)
+        num, den = np.zeros(values.shape[1:]), np.zeros(values.shape[1:])
+        result = np.empty_like(values)
+        for t, row in enumerate(values):
+            valid = ~np.isnan(row)
+            num = decay * num + np.where(valid, row, 0.0)
+            den = decay * den + valid
+            with np.errstate(divide='ignore', invalid='ignore'):
+                result[t] = num / den
+        return result
+
+    @staticmethod
+    def wilder(values: np.ndarray, period: int) -> np.ndarray:
+        """Wilder smoothing per column: mean of the first period values, then alpha = 1/period"""
+        average, seen = np.zeros(values.shape[1:]), np.zeros(values.shape[1:], dtype=np.int64)
+        result, warmed = np.full_like(values, np.nan), False
+        for t, row in enumerate(values):
+            valid = ~np.isnan(row)
+            if warmed and valid.all():
+                # Every column is past its seed: plain Wilder update
+                average += (row - average) / period
+                result[t] = average
+                continue
+            seen += valid
+            warmed = warmed or bool((seen > period).all())
+            # Warm-up accumulates a sum that becomes the seed mean at the period-th value
+            average = np.where(valid & (seen < period), average + row, average)
+            average = np.where(valid & (seen == period), (average + row) / period, average)
+            average = np.where(valid & (seen > period), average + (row - average) / period, average)
+            result[t] = np.where(valid & (seen >= period), average, np.nan)
+        return result
+
+    @staticmethod
+    def rsi(values: np.ndarray, period: int = 14) -> np.ndarray:
+        """Wilder RSI per column"""
+        delta = np.vstack([np.full((1,) + values.shape[1:], np.nan), np.diff(values, axis=0)])
+        gains = BatchIndicators.wilder(np.where(delta > 0, delta, np.where(np.isnan(delta), np.nan, 0.0)), period)
+        losses = BatchIndicators.wilder(np.where(delta < 0, -delta, np.where(np.isnan(delta), np.nan, 0.0)), period)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(losses == 0, 100.0, 100.0 - 100.0 / (1.0 + gains / losses))
+
+    @staticmethod
+    def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+        """Wilder average true range per column"""
+        previous = np.vstack([np.full((1,) + close.shape[1:], np.nan), close[:-1]])
+        # fmax skips the missing previous close on the first bar, leaving high - low
+        true_range = np.fmax(high - low, np.fmax(np.abs(high - previous), np.abs(low - previous)))
+        return BatchIndicators.wilder(true_range, period)
+
+    @staticmethod
+    def compute(close: np.ndarray, high: Optional[np.ndarray] = None, low: Optional[np.ndarray] = None,
+                windows: Optional[Dict[str, int]] = None) -> Dict[str, np.ndarray]:
+        """Compute the standard indicator set; each result has the shape of close"""
+        windows = {'sma': 20, 'ema_fast': 12, 'ema_slow': 26, 'rsi': 14, 'zscore': 20, 'atr': 14, **(windows or {})}
+        results = {
+            f"SMA_{windows['sma']}": BatchIndicators.rolling_mean(close, windows['sma']),
+            f"EMA_{windows['ema_fast']}": BatchIndicators.ema(close, windows['ema_fast']),
+            f"EMA_{windows['ema_slow']}": BatchIndicators.ema(close, windows['ema_slow']),
+            f"RSI_{windows['rsi']}": BatchIndicators.rsi(close, windows['rsi']),
+            f"ZSCORE_{windows['zscore']}": BatchIndicators.zscore(close, windows['zscore'])
+        }
+        if high is not None and low is not None:
+            results[f"ATR_{windows['atr']}"] = BatchIndicators.atr(high, low, close, windows['atr'])
+        logger.info(f"🧮 Batch indicators: {len(results)} indicators for {close.shape[1]} symbols × {close.shape[0]} bars")
+        return results
+
+    @staticmethod
+    def compute_frame(data: pd.DataFrame, windows: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """Pivot long OHLC rows to matrices and compute the standard set ({'dates', 'symbols', 'results'})"""
+        close = BatchIndicators.to_matrix(data, 'Close')
+        has_range = {'High', 'Low'} <= set(data.columns)
+        high = BatchIndicators.to_matrix(data, 'High')['values'] if has_range else None
+        low = BatchIndicators.to_matrix(data, 'Low')['values'] if has_range else None
+        return {'dates': close['dates'], 'symbols': close['symbols'],
+                'results': BatchIndicators.compute(close['values'], high, low, windows)}
+
+    @staticmethod
+    def latest(results: Dict[str, np.ndarray], symbols) -> pd.DataFrame:
+        """Get each symbol's last valid value of every indicator (a screening table)"""
+        table = {}
+        for name, matrix in results.items():
+            valid = ~np.isnan(matrix)
+            last = matrix.shape[0] - 1 - np.argmax(valid[::-1], axis=0)
+            table[name] = np.where(valid.any(axis=0), matrix[last, np.arange(matrix.shape[1])], np.nan)
+        return pd.DataFrame(table, index=pd.Index(symbols, name='Symbol'))
+
+    @staticmethod
+    def load_duckdb(file_path: str, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                    symbols: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read only the date, symbol and OHLC columns of a DuckDB price table (e.g. redline_data.duckdb)"""
+        from .data_access_duckdb import get_duckdb_manager
+
+        manager = get_duckdb_manager()
+        located = manager.find_symbol_table(file_path)
+        if located is None:
+            return pd.DataFrame()
+        table, symbol_column = located['table'], located['symbol_column']
+        columns = manager.get_tables(file_path)[table]
+        date_column = next((c for c in BatchIndicators.DATE_COLUMNS if c in columns), None)
+        lowered = {c.lower(): c for c in columns}
+        prices = [lowered[c] for c in ('high', 'low', 'close') if c in lowered]
+        if date_column is None or 'close' not in lowered:
+            return pd.DataFrame()
+        select = ', '.join(f'"{c}" AS "{c.capitalize()}"' for c in prices)
+        sql = f'SELECT "{date_column}" AS "Date", "{symbol_column}" AS "Symbol", {select} FROM "{table}" WHERE TRUE'
+        params = []
+        if start_date:
+            sql += ' AND ' + manager.date_condition(file_path, table, date_column, '>=')
+            params.append(str(start_date))
+        if end_date:
+            sql += ' AND ' + manager.date_condition(file_path, table, date_column, '<=')
+            params.append(str(end_date))
+        if symbols:
+            sql += f' AND "{symbol_column}" IN ({", ".join("?" for _ in symbols)})'
+            params += list(symbols)
+        return manager.query(file_path, sql, params)
@@ -8,19 +8,44 @@ import panel as pn
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
+import os
+from typing import Optional
 from .base_component import BaseComponent
 from .data_manager import DataManager
+from .indicator_engine import get_indicator_engine
+from .live_chart import LiveCandlestickChart, LiveLineChart
 
 class ChartComponent(BaseComponent):
     """Component for creating and managing charts"""
     
-    def __init__(self, data_manager: DataManager):
+    # Opt-in live mode streams new bars into Bokeh charts; full figures are only sent on a symbol/timeframe change
+    LIVE_CHARTS = os.getenv('TRADEPULSE_LIVE_CHARTS', 'false').lower() == 'true'
+    
+    def __init__(self, data_manager: DataManager, live: Optional[bool] = None):
         super().__init__("ChartComponent")
         self.data_manager = data_manager
+        self.live = self.LIVE_CHARTS if live is None else live
+        self.indicator_engine = get_indicator_engine()
         self.create_components()
     
     def create_components(self):
         """Create chart components"""
+        if self.live:
+            self.live_chart = LiveCandlestickChart()
+            self.live_indicators = LiveLineChart(
+                [('RSI', 'RSI', 'orange'), ('MACD', 'MACD', 'blue'), ('SMA_20', 'SMA 20', 'green')],
+                title='Technical Indicators'
+            )
+            self.components['candlestick'] = self.live_chart.price_pane
+            self.components['volume'] = self.live_chart.volume_pane
+            self.components['indicators'] = self.live_indicators.pane
+            self.components['ml_predictions'] = pn.pane.Plotly(
+                self.create_ml_predictions_chart(),
+                height=300
+            )
+            self.update_live_charts("AAPL")
+            return
+        
         self.components['candlestick'] = pn.pane.Plotly(
             self.create_candlestick_chart(),
             height=400
@@ -106,19 +131,11 @@ class ChartComponent(BaseComponent):
         if df.empty:
             return go.Figure()
         
-        close_prices = df['Close']
-        
-        # Calculate indicators
-        delta = close_prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        sma_20 = close_prices.rolling(window=20).mean()
-        ema_12 = close_prices.ewm(span=12).mean()
-        ema_26 = close_prices.ewm(span=26).mean()
-        macd = ema_12 - ema_26
+        # Only bars added or revised since the last refresh are computed
+        indicators = self.indicator_engine.update(symbol, df, version=self.data_manager.get_price_data_version(symbol))
+        rsi = indicators['RSI']
+        sma_20 = indicators['SMA_20']
+        macd = indicators['MACD']
         
         fig = go.Figure()
         
@@ -199,8 +216,21 @@ class ChartComponent(BaseComponent):
         
         return fig
     
-    def update_charts(self, symbol: str):
+    def update_live_charts(self, symbol: str, timeframe: Optional[str] = None):
+        """Stream new and revised bars (and their indicators) into the live charts"""
+        df = self.data_manager.get_price_data_for_symbol(symbol)
+        if df.empty:
+            return
+        self.live_chart.update(symbol, df, timeframe)
+        indicators = self.indicator_engine.update(symbol, df, timeframe, self.data_manager.get_price_data_version(symbol))
+        self.live_indicators.update((symbol, timeframe), indicators.assign(Date=df['Date'].to_numpy()))
+    
+    def update_charts(self, symbol: str, timeframe: Optional[str] = None):
         """Update all charts for a symbol"""
+        if self.live:
+            self.update_live_charts(symbol, timeframe)
+            self.components['ml_predictions'].object = self.create_ml_predictions_chart(symbol)
+            return
         self.components['candlestick'].object = self.create_candlestick_chart(symbol)
         self.components['volume'].object = self.create_volume_chart(symbol)
         self.components['indicators'].object = self.create_indicators_chart(symbol)
@@ -52,6 +52,12 @@ class DataAccessManager:
         """Get data from specified source"""
         return self.core.get_data(source, symbol, timeframe, start_date, end_date)
     
+    def get_bars(self, source: str, symbol: str, timeframe: Optional[str] = None,
+                 start_date: Optional[str] = None, end_date: Optional[str] = None,
+                 max_bars: Optional[int] = None, base_timeframe: Optional[str] = None) -> pd.DataFrame:
+        """Get OHLCV bars served from the cached multi-resolution bar pyramid"""
+        return self.core.get_bars(source, symbol, timeframe, start_date, end_date, max_bars, base_timeframe)
+    
     def get_uploaded_data(self, dataset_id: Optional[str] = None, 
                          module: Optional[str] = None) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
         """Get uploaded data for specific module or dataset"""
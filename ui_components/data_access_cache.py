@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+TradePulse Data Access - Cache
+Bounded, thread-safe LRU cache with per-key TTL and single-flight fetches
+"""
+
+import pandas as pd
+from typing import Dict, Any, Optional, Callable
+from collections import OrderedDict
+import logging
+import threading
+import time
+import sys
+
+logger = logging.getLogger(__name__)
+
+class _InFlight:
+    """A fetch in progress that concurrent misses for the same key wait on"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+class DataAccessCache:
+    """LRU cache bounded by entry count and bytes, with TTL expiry and request coalescing"""
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 512 * 1024 * 1024, ttl: float = 300):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()   # key -> (value, expires_at, size)
+        self._in_flight = {}            # key -> _InFlight
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'coalesced': 0,
+            'evictions': 0,
+            'expirations': 0
+        }
+
+    def _size_of(self, value: Any) -> int:
+        """Estimate the memory footprint of a cached value"""
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            return int(value.memory_usage(deep=True).sum())
+        return sys.getsizeof(value)
+
+    def _lookup(self, key: str):
+        """Return (found, value) for a live entry, dropping it if expired; caller holds the lock"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        value, expires_at, size = entry
+        if time.monotonic() >= expires_at:
+            self._remove(key)
+            self.stats['expirations'] += 1
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _remove(self, key: str):
+        """Drop an entry; caller holds the lock"""
+        _, _, size = self._entries.pop(key)
+        self._total_bytes -= size
+
+    def _evict(self):
+        """Evict least-recently-used entries until within bounds; caller holds the lock"""
+        now = time.monotonic()
+        for key in [k for k, (_, expires_at, _) in self._entries.items() if now >= expires_at]:
+            self._remove(key)
+            self.stats['expirations'] += 1
+        while self._entries and (len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes):
+            self._remove(next(iter(self._entries)))
+            self.stats['evictions'] += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None on a miss"""
+        with self._lock:
+            found, value = self._lookup(key)
+            self.stats['hits' if found else 'misses'] += 1
+            return value
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store a value with an optional per-key TTL in seconds"""
+        size = self._size_of(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                logger.debug(f"📋 Not caching {key}: {size} bytes exceeds the cache limit")
+                return
+            self._entries[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl), size)
+            self._total_bytes += size
+            self._evict()
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """Get a cached value, or fetch it once even when several threads miss at the same time"""
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                self.stats['hits'] += 1
+                return value
+
+            in_flight = self._in_flight.get(key)
+            leader = in_flight is None
+            if leader:
+                self.stats['misses'] += 1
+                in_flight = self._in_flight[key] = _InFlight()
+            else:
+                self.stats['coalesced'] += 1
+
+        if not leader:
+            in_flight.event.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.value
+
+        try:
+            in_flight.value = fetch()
+            self.put(key, in_flight.value, ttl)
+            return in_flight.value
+        except Exception as e:
+            in_flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            in_flight.event.set()
+
+    def invalidate(self, key: str) -> bool:
+        """Drop a single key from the cache"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+                return True
+            return False
+
+    def clear(self):
+        """Drop every cached entry"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def keys(self):
+        """Get the cached keys, least recently used first"""
+        with self._lock:
+            return list(self._entries.keys())
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return self._lookup(key)[0]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get size and hit/miss/eviction metrics"""
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses'] + self.stats['coalesced']
+            return {
+                **self.stats,
+                'hit_rate': (self.stats['hits'] + self.stats['coalesced']) / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'total_bytes': self._total_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'in_flight': len(self._in_flight)
+            }
@@ -14,11 +14,18 @@ import requests
 import json
 import os
 
+from .data_access_cache import DataAccessCache
+from .data_access_disk_cache import MarketDataDiskCache
+from .bar_pyramid import get_bar_pyramid
+
 logger = logging.getLogger(__name__)
 
 class DataAccessManager:
     """Unified data access manager for all modules"""
     
+    # Longest range get_bars fetches at 1m (providers serve 1m history for about a week to a month)
+    INTRADAY_BASE_DAYS = int(os.getenv('TRADEPULSE_INTRADAY_BASE_DAYS', '7'))
+    
     def __init__(self, data_manager):
         self.data_manager = data_manager
         self.api_sources = {
@@ -28,8 +35,17 @@ class DataAccessManager:
             'mock': self._generate_mock_data,
             'upload': self._fetch_upload_data
         }
-        self.cache = {}
         self.cache_ttl = 300  # 5 minutes
+        self.cache_max_entries = 256
+        self.cache_max_bytes = 512 * 1024 * 1024  # 512 MB
+        self.cache = DataAccessCache(self.cache_max_entries, self.cache_max_bytes, self.cache_ttl)
+        
+        # Provider sources backed by the persistent Parquet tier (local sources are not cached on disk)
+        self.disk_cache_sources = {'yahoo', 'alpha_vantage', 'iex'}
+        self.disk_cache = MarketDataDiskCache(os.getenv('TRADEPULSE_MARKET_CACHE_DIR', 'data/market_cache'))
+        
+        # Multi-resolution OHLCV levels shared by charts, alerts and models
+        self.bar_pyramid = get_bar_pyramid()
         
         # Initialize file operations for mock data and upload data
         from .data_access_file_ops import DataAccessFileOps
@@ -39,31 +55,82 @@ class DataAccessManager:
                  start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
         """Get data from specified source"""
         try:
+            if source not in self.api_sources:
+                raise ValueError(f"Unknown data source: {source}")
+            
             cache_key = f"{source}_{symbol}_{timeframe}_{start_date}_{end_date}"
             
-            # Check cache first
-            if cache_key in self.cache:
-                cached_data, timestamp = self.cache[cache_key]
-                if (datetime.now() - timestamp).seconds < self.cache_ttl:
-                    logger.info(f"📋 Using cached data for {symbol}")
-                    return cached_data.copy()
+            def fetch():
+                if source in self.disk_cache_sources:
+                    data = self.disk_cache.get(
+                        source, symbol, timeframe, start_date, end_date,
+                        lambda seg_start, seg_end: self.api_sources[source](symbol, timeframe, seg_start, seg_end)
+                    )
+                else:
+                    data = self.api_sources[source](symbol, timeframe, start_date, end_date)
+                logger.info(f"✅ Fetched {len(data)} records for {symbol} from {source}")
+                return data
             
-            # Fetch fresh data
-            if source in self.api_sources:
-                data = self.api_sources[source](symbol, timeframe, start_date, end_date)
-            else:
+            # Concurrent misses for the same key share a single fetch
+            data = self.cache.get_or_fetch(cache_key, fetch, self.cache_ttl)
+            return data.copy()
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to fetch data for {symbol} from {source}: {e}")
+            return pd.DataFrame()
+    
+    def get_bars(self, source: str, symbol: str, timeframe: Optional[str] = None,
+                 start_date: Optional[str] = None, end_date: Optional[str] = None,
+                 max_bars: Optional[int] = None, base_timeframe: Optional[str] = None) -> pd.DataFrame:
+        """Get OHLCV bars from the bar pyramid
+        
+        The series is fetched once at a base timeframe and aggregated into the coarser levels; a
+        request is served from the cached level for timeframe, or from the finest level that fits
+        max_bars bars in the range (zooming out), without re-aggregating the raw rows. Without an
+        explicit base_timeframe, 1m bars are fetched for intraday timeframes or short ranges (at most
+        INTRADAY_BASE_DAYS, which is also all a provider serves at 1m) and 1d bars otherwise.
+        """
+        try:
+            if source not in self.api_sources:
                 raise ValueError(f"Unknown data source: {source}")
             
-            # Cache the result
-            self.cache[cache_key] = (data, datetime.now())
+            base_timeframe, fetch_start, fetch_end = self._base_request(source, timeframe, start_date,
+                                                                        end_date, base_timeframe)
+            if source == 'upload':
+                # Rebuilt only when a matching upload file is added, removed or rewritten
+                version = self.file_ops.manifest.get_version(symbol)
+            else:
+                version = int(datetime.now().timestamp() // self.cache_ttl)
             
-            logger.info(f"✅ Fetched {len(data)} records for {symbol} from {source}")
-            return data
+            return self.bar_pyramid.get_or_build(
+                (source, symbol, base_timeframe, fetch_start, fetch_end),
+                lambda: self.get_data(source, symbol, base_timeframe, fetch_start, fetch_end),
+                version, timeframe=timeframe, start=start_date, end=end_date, max_bars=max_bars
+            )
             
         except Exception as e:
-            logger.error(f"❌ Failed to fetch data for {symbol} from {source}: {e}")
+            logger.error(f"❌ Failed to get bars for {symbol} from {source}: {e}")
             return pd.DataFrame()
     
+    def _base_request(self, source: str, timeframe: Optional[str], start_date: Optional[str],
+                      end_date: Optional[str], base_timeframe: Optional[str]):
+        """Pick the base timeframe and the fetch window (None bounds = the source's default history)"""
+        day = pd.Timedelta(days=1)
+        intraday_span = pd.Timedelta(days=self.INTRADAY_BASE_DAYS)
+        end = pd.Timestamp(end_date) if end_date else pd.Timestamp(datetime.now()).normalize() + day
+        start = pd.Timestamp(start_date) if start_date else None
+        if base_timeframe is None:
+            wants_intraday = timeframe is not None and self.bar_pyramid.to_delta(timeframe) < day
+            short_range = start is not None and end - start <= intraday_span
+            base_timeframe = '1m' if wants_intraday or short_range else '1d'
+        if source == 'upload':
+            return base_timeframe, None, None
+        if self.bar_pyramid.to_delta(base_timeframe) >= day:
+            return base_timeframe, start_date, end_date
+        # Intraday bases cover at most the last INTRADAY_BASE_DAYS of the requested range
+        window_start = max(start, end - intraday_span) if start is not None else end - intraday_span
+        return base_timeframe, window_start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+    
     def get_uploaded_data(self, dataset_id: Optional[str] = None, 
                          module: Optional[str] = None) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
         """Get uploaded data for specific module or dataset"""
@@ -121,7 +188,10 @@ class DataAccessManager:
         return {
             'cache_size': len(self.cache),
             'cache_ttl': self.cache_ttl,
-            'cached_keys': list(self.cache.keys())
+            'cached_keys': self.cache.keys(),
+            **self.cache.get_stats(),
+            'disk_cache': self.disk_cache.get_stats(),
+            'bar_pyramid': self.bar_pyramid.get_stats()
         }
     
     def _fetch_yahoo_data(self, symbol: str, timeframe: str = '1d', 
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+TradePulse Data Access - Disk Cache
+Persistent Parquet market-data cache that extends held date ranges incrementally
+"""
+
+import pandas as pd
+from typing import Dict, Any, Optional, Callable, List, Tuple
+import logging
+import threading
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+class MarketDataDiskCache:
+    """Parquet cache keyed by source, symbol and timeframe that remembers which date range it holds
+
+    A request for a wider range fetches only the missing head and tail segments from the
+    provider and appends each as a part file, so an extension writes only the new rows. Parts are
+    merged on read (later parts win on equal timestamps) and compacted once there are too many.
+    Segments that end before the live session are held through their requested end, even when
+    the last bar is earlier (weekends, holidays, delisted symbols); a segment reaching the live
+    session is held only up to its start, so that session is fetched again until it closes.
+    An empty segment does not widen the held range, since providers also answer an outage with
+    an empty frame; it is recorded as checked and asked for again once EMPTY_TTL has passed.
+    """
+
+    DATE_COLUMNS = ['Date', 'Datetime', 'date', 'timestamp']
+    MAX_PARTS = int(os.getenv('TRADEPULSE_MARKET_CACHE_MAX_PARTS', '8'))
+    # Exchange clock used to tell settled bars from the live session (timestamps are wall-clock)
+    MARKET_TZ = os.getenv('TRADEPULSE_MARKET_TZ', 'America/New_York')
+    MARKET_CLOSE = pd.Timedelta(os.getenv('TRADEPULSE_MARKET_CLOSE', '16:00') + ':00')
+    # How long a segment the provider returned no rows for is trusted to stay empty
+    EMPTY_TTL = pd.Timedelta(os.getenv('TRADEPULSE_MARKET_CACHE_EMPTY_TTL', '6h'))
+
+    def __init__(self, cache_dir: str = 'data/market_cache'):
+        self.cache_dir = Path(cache_dir)
+        self.manifest_path = self.cache_dir / 'manifest.json'
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.manifest = self._load_manifest()
+        self.stats = {
+            'full_hits': 0,
+            'partial_hits': 0,
+            'misses': 0,
+            'segments_fetched': 0
+        }
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Load the held-range manifest from disk"""
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ Market cache: Could not read manifest, starting empty: {e}")
+            return {}
+
+    def _save_manifest(self):
+        """Write the manifest atomically; caller holds the lock"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        """Get the lock serializing updates to one cache key"""
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _path_for(self, source: str, symbol: str, timeframe: str) -> Path:
+        """Get the part-file directory for a cache key"""
+        safe_symbol = "".join(c if c.isalnum() or c in '-_.' else '_' for c in symbol)
+        return self.cache_dir / source / timeframe / safe_symbol
+
+    def _parts(self, entry: Dict[str, Any], path: Path) -> List[Path]:
+        """Get a key's part files in write order (single-file entries from older caches count as one part)"""
+        if 'parts' in entry:
+            return [path / name for name in entry['parts']]
+        return [path.with_name(path.name + '.parquet')]
+
+    def _date_column(self, data: pd.DataFrame) -> Optional[str]:
+        """Find the timestamp column of a provider frame"""
+        for column in self.DATE_COLUMNS:
+            if column in data.columns:
+                return column
+        return None
+
+    def _naive_dates(self, data: pd.DataFrame, column: str) -> pd.Series:
+        """Get the date column as tz-naive wall-clock timestamps for range comparisons"""
+        dates = pd.to_datetime(data[column])
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
+        return dates
+
+    def _now(self) -> pd.Timestamp:
+        """Get the current tz-naive wall-clock time on the exchange"""
+        return pd.Timestamp.now(tz=self.MARKET_TZ).tz_localize(None)
+
+    def _live_session_start(self, now: pd.Timestamp) -> pd.Timestamp:
+        """Get the start of the session whose bars may still change (the next weekday once today's has closed)"""
+        day = now.normalize()
+        if day.weekday() < 5 and now < day + self.MARKET_CLOSE:
+            return day
+        day += pd.Timedelta(days=1)
+        while day.weekday() >= 5:
+            day += pd.Timedelta(days=1)
+        return day
+
+    def _covered_end(self, seg_end: pd.Timestamp, now: pd.Timestamp, live_start: pd.Timestamp) -> pd.Timestamp:
+        """Get how far a fetched segment can be held without asking the provider again"""
+        # Nothing before the live session changes any more, and no bar can appear before it starts;
+        # bars of the live session itself are never held, so they are fetched again until it closes
+        settled_end = live_start - pd.Timedelta(microseconds=1)
+        return seg_end if seg_end < now and seg_end < live_start else settled_end
+
+    def _resolve_range(self, start_date: Optional[str], end_date: Optional[str]) -> Tuple[pd.Timestamp, pd.Timestamp]:
+        """Turn optional request bounds into an explicit range (defaults to the last year)"""
+        end = pd.Timestamp(end_date) if end_date else self._now()
+        start = pd.Timestamp(start_date) if start_date else end - pd.Timedelta(days=365)
+        return start, end
+
+    def _empty_ranges(self, entry: Optional[Dict[str, Any]], now: pd.Timestamp) -> List[Tuple[pd.Timestamp, pd.Timestamp, pd.Timestamp]]:
+        """Get the recently checked empty segments of an entry as (start, end, checked) bounds"""
+        ranges = [tuple(pd.Timestamp(bound) for bound in r) for r in (entry or {}).get('empty', [])]
+        return [r for r in ranges if now - r[2] < self.EMPTY_TTL]
+
+    def _missing_segments(self, entry: Optional[Dict[str, Any]], start: pd.Timestamp, end: pd.Timestamp,
+                          now: pd.Timestamp) -> List[Tuple[str, pd.Timestamp, pd.Timestamp]]:
+        """Get the head and tail segments of [start, end] not covered by the held range or a recent empty check"""
+        if not entry:
+            return [('full', start, end)]
+        held_start, held_end = pd.Timestamp(entry['start']), pd.Timestamp(entry['end'])
+        segments = []
+        if start < held_start:
+            segments.append(('head', start, held_start))
+        if end > held_end:
+            segments.append(('tail', held_end, end))
+        empty = self._empty_ranges(entry, now)
+        return [(segment, seg_start, seg_end) for segment, seg_start, seg_end in segments
+                if not any(e_start <= seg_start and seg_end <= e_end for e_start, e_end, _ in empty)]
+
+    def get(self, source: str, symbol: str, timeframe: str, start_date: Optional[str],
+            end_date: Optional[str], fetch: Callable[[str, str], pd.DataFrame]) -> pd.DataFrame:
+        """Get [start_date, end_date] for a key, calling fetch(start, end) only for uncovered segments"""
+        start, end = self._resolve_range(start_date, end_date)
+        key = f"{source}/{timeframe}/{symbol}"
+        path = self._path_for(source, symbol, timeframe)
+
+        with self._key_lock(key):
+            entry = self.manifest.get(key)
+            parts = self._parts(entry, path) if entry else []
+            if not all(part.exists() for part in parts):
+                entry, parts = None, []
+            now = self._now()
+            segments = self._missing_segments(entry, start, end, now)
+            cached = self._merge([pd.read_parquet(part) for part in parts]) if parts else pd.DataFrame()
+
+            if not segments:
+                self.stats['full_hits'] += 1
+                return self._slice(cached, start, end)
+            self.stats['partial_hits' if entry else 'misses'] += 1
+
+            new_start = pd.Timestamp(entry['start']) if entry else None
+            new_end = pd.Timestamp(entry['end']) if entry else None
+            live_start = self._live_session_start(now)
+            fetched_frames, empty_segments = [], []
+            for segment, seg_start, seg_end in segments:
+                # Provider end bounds are exclusive (yfinance), so ask for one extra day
+                fetched = fetch(seg_start.strftime('%Y-%m-%d'), (seg_end + pd.Timedelta(days=1)).strftime('%Y-%m-%d'))
+                self.stats['segments_fetched'] += 1
+                covered_end = self._covered_end(seg_end, now, live_start)
+                if fetched is None or fetched.empty:
+                    # No data or a provider outage look the same, so nothing is held; a known key
+                    # remembers the check for EMPTY_TTL instead of asking again on every request
+                    logger.debug(f"📦 Market cache: No {segment} data for {key} ({seg_start} → {seg_end})")
+                    if entry and seg_start < covered_end:
+                        empty_segments.append((seg_start, covered_end, now))
+                    continue
+                fetched_frames.append(self._merge([fetched]))
+                new_start = seg_start if new_start is None else min(new_start, seg_start)
+                new_end = covered_end if new_end is None else max(new_end, covered_end)
+
+            if not fetched_frames and not empty_segments:
+                return self._slice(cached, start, end)
+            merged = self._merge(([cached] if not cached.empty else []) + fetched_frames) if fetched_frames else cached
+            # Checks still fresh and outside the new held range are kept, unless a new check covers them
+            empty = [r for r in self._empty_ranges(entry, now)
+                     if not (new_start <= r[0] and r[1] <= new_end)
+                     and not any(s <= r[0] and r[1] <= e for s, e, _ in empty_segments)] + empty_segments
+            self._write(key, path, parts, fetched_frames, merged, new_start, new_end, empty)
+            return self._slice(merged, start, end)
+
+    def _merge(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """Concatenate cached and fetched frames, keeping the newest row per timestamp"""
+        merged = pd.concat(frames, ignore_index=True)
+        date_column = self._date_column(merged)
+        if date_column is None:
+            return merged.drop_duplicates()
+        merged[date_column] = pd.to_datetime(merged[date_column])
+        merged = merged.drop_duplicates(subset=[date_column], keep='last')
+        return merged.sort_values(date_column).reset_index(drop=True)
+
+    def _slice(self, data: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        """Restrict a frame to [start, end]"""
+        date_column = self._date_column(data) if not data.empty else None
+        if date_column is None:
+            return data
+        dates = self._naive_dates(data, date_column)
+        return data[(dates >= start) & (dates <= end)].reset_index(drop=True)
+
+    def _write(self, key: str, path: Path, parts: List[Path], fetched_frames: List[pd.DataFrame],
+               merged: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp,
+               empty: List[Tuple[pd.Timestamp, pd.Timestamp, pd.Timestamp]] = ()):
+        """Append fetched segments as part files (or compact all parts into one) and record the held range"""
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            compact = len(parts) + len(fetched_frames) > self.MAX_PARTS or any(p.parent != path for p in parts)
+            names = [] if compact else [part.name for part in parts]
+            for frame in ([merged] if compact else fetched_frames):
+                name = f"part-{uuid.uuid4().hex[:12]}.parquet"
+                tmp_path = path / (name + '.tmp')
+                frame.to_parquet(tmp_path, index=False)
+                os.replace(tmp_path, path / name)
+                names.append(name)
+            with self._lock:
+                self.manifest[key] = {
+                    'start': start.isoformat(),
+                    'end': end.isoformat(),
+                    'rows': len(merged),
+                    'parts': names,
+                    'empty': [[bound.isoformat() for bound in r] for r in empty],
+                    'updated': datetime.now().isoformat()
+                }
+                self._save_manifest()
+            if compact:
+                for part in parts:
+                    part.unlink(missing_ok=True)
+            logger.info(f"📦 Market cache: {key} now holds {start.date()} → {end.date()} "
+                        f"({len(merged)} rows, {len(names)} parts)")
+        except Exception as e:
+            logger.warning(f"⚠️ Market cache: Could not persist {key}: {e}")
+
+    def invalidate(self, source: str, symbol: str, timeframe: str) -> bool:
+        """Forget the held range for a key and delete its file"""
+        key = f"{source}/{timeframe}/{symbol}"
+        path = self._path_for(source, symbol, timeframe)
+        with self._key_lock(key):
+            shutil.rmtree(path, ignore_errors=True)
+            path.with_name(path.name + '.parquet').unlink(missing_ok=True)
+            with self._lock:
+                removed = self.manifest.pop(key, None) is not None
+                self._save_manifest()
+            return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit statistics and the held ranges"""
+        with self._lock:
+            return {
+                **self.stats,
+                'cached_keys': len(self.manifest),
+                'held_ranges': {key: (entry['start'], entry['end']) for key, entry in self.manifest.items()}
+            }
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+TradePulse Data Access - DuckDB Connections
+Shared, read-only DuckDB connection pool with cached table discovery and parameterized queries
+"""
+
+import pandas as pd
+from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict
+import logging
+import threading
+import os
+
+from .symbol_index import symbol_variants
+
+logger = logging.getLogger(__name__)
+
+class DuckDBConnectionManager:
+    """Cache one read-only connection per database file and run parameterized queries on cursors
+
+    Table and column discovery runs once per opened file. Pinned files (e.g. redline_data.duckdb)
+    are never evicted; other files are closed least-recently-used beyond MAX_CONNECTIONS, except
+    while a query is running on them.
+    """
+
+    MAX_CONNECTIONS = int(os.getenv('TRADEPULSE_DUCKDB_MAX_CONNECTIONS', '8'))
+    PINNED_FILES = [f for f in os.getenv('TRADEPULSE_DUCKDB_PINNED', '').split(',') if f]
+    SYMBOL_COLUMNS = ['Symbol', 'symbol', 'SYMBOL', 'ticker', 'Ticker', 'TICKER', 'code', 'Code', 'CODE']
+    PREFERRED_TABLES = ['data', 'stock_data', 'tickers_data']
+
+    def __init__(self, max_connections: Optional[int] = None):
+        self.max_connections = max_connections or self.MAX_CONNECTIONS
+        self._connections = OrderedDict()   # abs path -> {'conn', 'mtime', 'tables', 'types', 'users'}
+        self._pinned = {os.path.abspath(path) for path in self.PINNED_FILES}
+        self._lock = threading.Lock()
+        self.stats = {
+            'connections_opened': 0,
+            'connections_reused': 0,
+            'connections_evicted': 0,
+            'queries': 0
+        }
+
+    def pin(self, file_path: str):
+        """Keep a database file's connection open for the life of the process"""
+        with self._lock:
+            self._pinned.add(os.path.abspath(file_path))
+
+    def unpin(self, file_path: str):
+        """Allow a database file's connection to be evicted again"""
+        with self._lock:
+            self._pinned.discard(os.path.abspath(file_path))
+
+    def _get_entry(self, file_path: str, use: bool = False) -> Dict[str, Any]:
+        """Get the cached connection for a file, (re)opening it if missing or the file changed
+
+        With use=True the entry is marked in use (release it with _release) before anything is evicted.
+        """
+        import duckdb
+
+        path = os.path.abspath(file_path)
+        mtime = os.stat(path).st_mtime
+        with self._lock:
+            entry = self._connections.get(path)
+            if entry and entry['mtime'] == mtime:
+                self._connections.move_to_end(path)
+                self.stats['connections_reused'] += 1
+                entry['users'] += use
+                return entry
+            if entry:
+                self._retire(self._connections.pop(path))
+
+            conn = duckdb.connect(path, read_only=True)
+            tables, types = self._discover_tables(conn)
+            entry = {'conn': conn, 'mtime': mtime, 'tables': tables, 'types': types, 'users': 0}
+            self._connections[path] = entry
+            self.stats['connections_opened'] += 1
+            entry['users'] += use
+            self._evict(keep=path)
+            logger.info(f"🦆 Opened read-only DuckDB connection to {path} ({len(entry['tables'])} tables)")
+            return entry
+
+    def _evict(self, keep: Optional[str] = None):
+        """Close least-recently-used idle, unpinned connections beyond the limit; caller holds the lock"""
+        idle = [path for path, entry in self._connections.items()
+                if path not in self._pinned and path != keep and not entry['users']]
+        while len(self._connections) > self.max_connections and idle:
+            self._connections.pop(idle.pop(0))['conn'].close()
+            self.stats['connections_evicted'] += 1
+
+    def _release(self, entry: Dict[str, Any]):
+        """Mark a query on an entry finished, closing it if it was dropped from the pool meanwhile"""
+        with self._lock:
+            entry['users'] -= 1
+            if entry.get('retired'):
+                if not entry['users']:
+                    entry['conn'].close()
+            else:
+                self._evict()
+
+    def _retire(self, entry: Dict[str, Any]):
+        """Close a connection dropped from the pool, or let its last query close it; caller holds the lock"""
+        if entry['users']:
+            entry['retired'] = True
+        else:
+            entry['conn'].close()
+
+    def _discover_tables(self, conn) -> Tuple[Dict[str, List[str]], Dict[str, Dict[str, str]]]:
+        """Map every table in the database to its column names, and to each column's SQL type"""
+        rows = conn.execute(
+            "SELECT table_name, column_name, data_type FROM information_schema.columns "
+            "ORDER BY table_name, ordinal_position"
+        ).fetchall()
+        tables, types = {}, {}
+        for table_name, column_name, data_type in rows:
+            tables.setdefault(table_name, []).append(column_name)
+            types.setdefault(table_name, {})[column_name] = data_type
+        return tables, types
+
+    def get_tables(self, file_path: str) -> Dict[str, List[str]]:
+        """Get the cached table → columns map for a database file"""
+        return dict(self._get_entry(file_path)['tables'])
+
+    def find_symbol_table(self, file_path: str) -> Optional[Dict[str, str]]:
+        """Find the table holding per-symbol rows and its symbol column"""
+        tables = self._get_entry(file_path)['tables']
+        ordered = [t for t in self.PREFERRED_TABLES if t in tables] + [t for t in tables if t not in self.PREFERRED_TABLES]
+        for table in ordered:
+            symbol_column = next((c for c in self.SYMBOL_COLUMNS if c in tables[table]), None)
+            if symbol_column:
+                return {'table': table, 'symbol_column': symbol_column}
+        return None
+
+    def date_condition(self, file_path: str, table: str, column: str, op: str) -> str:
+        """Get a SQL comparison of a date column with one bound parameter
+
+        The bound is cast to the column's own type, so the column is compared as stored and DuckDB
+        can skip row groups by their min/max; text date columns are parsed as timestamps instead.
+        """
+        column_type = self._get_entry(file_path)['types'].get(table, {}).get(column, '')
+        if column_type.startswith(('TIMESTAMP', 'DATE')):
+            return f'"{column}" {op} CAST(CAST(? AS TIMESTAMP) AS {column_type})'
+        return f'CAST("{column}" AS TIMESTAMP) {op} CAST(? AS TIMESTAMP)'
+
+    def query(self, file_path: str, sql: str, params: Optional[List[Any]] = None) -> pd.DataFrame:
+        """Run a parameterized query on a pooled connection"""
+        entry = self._get_entry(file_path, use=True)
+        self.stats['queries'] += 1
+        try:
+            # Cursors are independent connections to the same database and are safe to use per thread
+            cursor = entry['conn'].cursor()
+            try:
+                return cursor.execute(sql, params or []).df()
+            finally:
+                cursor.close()
+        finally:
+            self._release(entry)
+
+    def read_symbol(self, file_path: str, symbol: str, start_date: Optional[str] = None,
+                    end_date: Optional[str] = None) -> pd.DataFrame:
+        """Read rows for one symbol (the ticker itself or its .US form) with bound parameters"""
+        located = self.find_symbol_table(file_path)
+        if located is None:
+            logger.warning(f"⚠️ No table with a symbol column in {file_path}")
+            return pd.DataFrame()
+
+        table, symbol_column = located['table'], located['symbol_column']
+        sql = f'SELECT * FROM "{table}" WHERE upper(CAST("{symbol_column}" AS VARCHAR)) IN (?, ?)'
+        params = symbol_variants(symbol)
+
+        columns = self._get_entry(file_path)['tables'][table]
+        date_column = next((c for c in ('Date', 'date', 'timestamp') if c in columns), None)
+        # Each bound is filtered in SQL so only the requested dates are read
+        if date_column and start_date:
+            sql += ' AND ' + self.date_condition(file_path, table, date_column, '>=')
+            params.append(str(start_date))
+        if date_column and end_date:
+            sql += ' AND ' + self.date_condition(file_path, table, date_column, '<=')
+            params.append(str(end_date))
+        return self.query(file_path, sql, params)
+
+    def close_all(self):
+        """Close every pooled connection"""
+        with self._lock:
+            for entry in self._connections.values():
+                self._retire(entry)
+            self._connections.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics"""
+        with self._lock:
+            return {
+                **self.stats,
+                'open_connections': len(self._connections),
+                'pinned_files': sorted(self._pinned)
+            }
+
+# Global instance
+_duckdb_manager = None
+_duckdb_manager_lock = threading.Lock()
+
+def get_duckdb_manager() -> DuckDBConnectionManager:
+    """Get the shared DuckDB connection manager"""
+    global _duckdb_manager
+    with _duckdb_manager_lock:
+        if _duckdb_manager is None:
+            _duckdb_manager = DuckDBConnectionManager()
+        return _duckdb_manager
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+TradePulse Data Access - File Manifest
+Persistent, incrementally refreshed index of uploaded data files
+"""
+
+import pandas as pd
+from typing import Dict, List, Optional, Any
+import logging
+import threading
+import time
+import json
+import glob
+import os
+from datetime import datetime
+from pathlib import Path
+
+from .symbol_index import symbol_variants
+
+logger = logging.getLogger(__name__)
+
+class DataAccessFileManifest:
+    """Manifest of scanned data files: path, size, mtime, format, schema, symbols and date range
+
+    Files are re-indexed only when their size or mtime changes, and directories are re-globbed
+    only when their mtime changes, so a lookup for one symbol touches only the files holding it.
+    Refreshes (which stat every file) run at most once per REFRESH_INTERVAL seconds.
+    """
+
+    REFRESH_INTERVAL = float(os.getenv('TRADEPULSE_UPLOAD_MANIFEST_INTERVAL', '2'))
+    # A directory modified this recently may change again without its coarse-grained mtime moving
+    RACY_SECONDS = 2.0
+
+    SYMBOL_COLUMNS = ['Symbol', 'symbol', 'SYMBOL', 'ticker', 'Ticker', 'TICKER', 'code', 'Code', 'CODE']
+    DATE_COLUMNS = ['Date', 'date', 'Datetime', 'timestamp']
+
+    def __init__(self, file_ops, manifest_path: Optional[str] = None):
+        self.file_ops = file_ops
+        self.manifest_path = Path(manifest_path or os.getenv('TRADEPULSE_UPLOAD_MANIFEST', 'data/upload_manifest.json'))
+        self._lock = threading.Lock()
+        manifest = self._load()
+        self.files = manifest.get('files', {})              # path -> entry
+        self.directories = manifest.get('directories', {})  # directory -> {'mtime', 'files'}
+        self._refreshed_at = None
+        self._versions = {}   # symbol -> file version, valid until the next change
+
+    def _load(self) -> Dict[str, Any]:
+        """Load the manifest from disk"""
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ File manifest: Could not read {self.manifest_path}, rebuilding: {e}")
+            return {}
+
+    def _save(self):
+        """Write the manifest atomically"""
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_name(self.manifest_path.name + '.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({'files': self.files, 'directories': self.directories}, f, default=str)
+            os.replace(tmp_path, self.manifest_path)
+        except Exception as e:
+            logger.warning(f"⚠️ File manifest: Could not save {self.manifest_path}: {e}")
+
+    def _list_directory(self, directory: str, file_patterns: Dict[str, List[str]]) -> Dict[str, str]:
+        """Glob a directory once per pattern, mapping each file to the first format that matches it"""
+        files = {}
+        own_path = os.path.abspath(self.manifest_path)
+        for format_name, patterns in file_patterns.items():
+            for pattern in patterns:
+                for file_path in glob.glob(os.path.join(directory, pattern)):
+                    if os.path.abspath(file_path) != own_path:
+                        files.setdefault(file_path, format_name)
+        return files
+
+    def refresh(self, force: bool = False) -> Dict[str, int]:
+        """Bring the manifest up to date, re-indexing only new or changed files"""
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._refreshed_at is not None and now - self._refreshed_at < self.REFRESH_INTERVAL:
+                return {'indexed': 0, 'unchanged': len(self.files), 'removed': 0}
+            self._refreshed_at = now
+            file_patterns = self.file_ops.scanning.get_file_patterns()
+            seen = set()
+            counts = {'indexed': 0, 'unchanged': 0, 'removed': 0}
+
+            for directory in self.file_ops.scanning.get_scan_directories():
+                if not os.path.isdir(directory):
+                    self.directories.pop(directory, None)
+                    continue
+
+                dir_mtime = os.stat(directory).st_mtime
+                cached_dir = self.directories.get(directory)
+                if cached_dir and cached_dir['mtime'] == dir_mtime:
+                    listing = cached_dir['files']
+                else:
+                    listing = self._list_directory(directory, file_patterns)
+                    # A listing taken in the same mtime tick as a change is re-globbed next time
+                    racy = time.time() - dir_mtime < self.RACY_SECONDS
+                    self.directories[directory] = {'mtime': None if racy else dir_mtime, 'files': listing}
+
+                for file_path, format_name in listing.items():
+                    try:
+                        stat = os.stat(file_path)
+                    except OSError:
+                        continue
+                    seen.add(file_path)
+                    entry = self.files.get(file_path)
+                    if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime:
+                        counts['unchanged'] += 1
+                        continue
+                    self.files[file_path] = self._index_file(file_path, format_name, stat)
+                    counts['indexed'] += 1
+
+            for file_path in [path for path in self.files if path not in seen]:
+                del self.files[file_path]
+                counts['removed'] += 1
+
+            if counts['indexed'] or counts['removed']:
+                self._versions.clear()
+                self._save()
+                logger.info(f"📇 File manifest: {counts['indexed']} indexed, {counts['removed']} removed, "
+                            f"{counts['unchanged']} unchanged")
+            return counts
+
+    def _index_file(self, file_path: str, format_name: str, stat: os.stat_result) -> Dict[str, Any]:
+        """Build the manifest entry for one file"""
+        entry = {
+            'path': file_path,
+            'format': format_name,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'schema': {},
+            'symbol_column': None,
+            'symbols': None,
+            'date_column': None,
+            'min_date': None,
+            'max_date': None,
+            'indexed_at': datetime.now().isoformat()
+        }
+        try:
+            sample = self._read_index_columns(file_path, format_name, entry)
+            if sample is not None:
+                self._describe(sample, entry)
+        except Exception as e:
+            logger.warning(f"⚠️ File manifest: Could not index {file_path}: {e}")
+        return entry
+
+    def _pick_columns(self, columns: List[str], entry: Dict[str, Any]) -> List[str]:
+        """Record the symbol and date columns present in a schema"""
+        entry['symbol_column'] = next((c for c in self.SYMBOL_COLUMNS if c in columns), None)
+        entry['date_column'] = next((c for c in self.DATE_COLUMNS if c in columns), None)
+        return [c for c in (entry['symbol_column'], entry['date_column']) if c]
+
+    def _read_index_columns(self, file_path: str, format_name: str, entry: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """Read the schema plus only the symbol and date columns of a file"""
+        if format_name in ('parquet', 'feather'):
+            import pyarrow.parquet as pq
+            import pyarrow.feather as feather
+            if format_name == 'parquet':
+                schema = pq.read_schema(file_path)
+            else:
+                import pyarrow as pa
+                with pa.memory_map(file_path, 'r') as source:
+                    schema = pa.ipc.open_file(source).schema
+            entry['schema'] = {field.name: str(field.type) for field in schema}
+            columns = self._pick_columns(schema.names, entry)
+            if not columns:
+                return None
+            if format_name == 'parquet':
+                return pq.read_table(file_path, columns=columns).to_pandas()
+            return feather.read_table(file_path, columns=columns, memory_map=True).to_pandas()
+
+        if format_name == 'csv':
+            header = pd.read_csv(file_path, nrows=0)
+            entry['schema'] = {column: 'unknown' for column in header.columns}
+            columns = self._pick_columns(list(header.columns), entry)
+            return pd.read_csv(file_path, usecols=columns) if columns else None
+
+        if format_name == 'json':
+            data = self.file_ops.readers._read_json_file(file_path)
+            entry['schema'] = {column: str(dtype) for column, dtype in data.dtypes.items()}
+            columns = self._pick_columns(list(data.columns), entry)
+            return data[columns] if columns else None
+
+        if format_name == 'duckdb':
+            from .data_access_duckdb import get_duckdb_manager
+            manager = get_duckdb_manager()
+            located = manager.find_symbol_table(file_path)
+            if located is None:
+                return None
+            table = located['table']
+            entry['schema'] = {column: 'unknown' for column in manager.get_tables(file_path)[table]}
+            columns = self._pick_columns(list(entry['schema']), entry)
+            date_column = entry['date_column']
+            select = ", ".join(f'MIN("{c}") AS "{c}", MAX("{c}") AS "{c}_max"' if c == date_column
+                               else f'"{c}"' for c in columns)
+            return manager.query(file_path, f'SELECT {select} FROM "{table}" GROUP BY "{entry["symbol_column"]}"')
+
+        # Model files (keras) carry no symbol or date information
+        return None
+
+    def _describe(self, data: pd.DataFrame, entry: Dict[str, Any]):
+        """Fill the symbol list and date range of an entry from its index columns"""
+        if entry['symbol_column']:
+            entry['symbols'] = sorted(str(s) for s in data[entry['symbol_column']].dropna().unique())
+        date_column = entry['date_column']
+        if date_column:
+            dates = pd.to_datetime(data[date_column], errors='coerce')
+            max_dates = pd.to_datetime(data[f"{date_column}_max"], errors='coerce') if f"{date_column}_max" in data else dates
+            if dates.notna().any():
+                entry['min_date'] = dates.min().isoformat()
+                entry['max_date'] = max_dates.max().isoformat()
+
+    def _matches_symbol(self, entry: Dict[str, Any], symbol: str) -> bool:
+        """Check whether a file can hold rows for a symbol (files without a symbol column always can)"""
+        if entry['symbols'] is None:
+            return True
+        wanted = symbol_variants(symbol)
+        return any(s.upper() in wanted for s in entry['symbols'])
+
+    def _overlaps(self, entry: Dict[str, Any], start_date: Optional[str], end_date: Optional[str]) -> bool:
+        """Check whether a file's date range overlaps the requested range"""
+        if not entry['min_date'] or not (start_date and end_date):
+            return True
+        min_date, max_date = pd.Timestamp(entry['min_date']), pd.Timestamp(entry['max_date'])
+        if min_date.tz is not None:
+            min_date, max_date = min_date.tz_localize(None), max_date.tz_localize(None)
+        return min_date <= pd.Timestamp(end_date) and max_date >= pd.Timestamp(start_date)
+
+    def get_files(self, symbol: str, start_date: Optional[str] = None,
+                  end_date: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get manifest entries for files that may hold the symbol in the requested range"""
+        self.refresh()
+        with self._lock:
+            return [dict(entry) for entry in self.files.values()
+                    if self._matches_symbol(entry, symbol) and self._overlaps(entry, start_date, end_date)]
+
+    def get_version(self, symbol: str) -> tuple:
+        """Get (path, size, mtime) of the files that may hold a symbol, memoized until a file changes"""
+        self.refresh()
+        with self._lock:
+            version = self._versions.get(symbol)
+            if version is None:
+                version = self._versions[symbol] = tuple(sorted(
+                    (entry['path'], entry['size'], entry['mtime'])
+                    for entry in self.files.values() if self._matches_symbol(entry, symbol)))
+            return version
+
+    def has_files(self) -> bool:
+        """Check whether any data file is indexed"""
+        return bool(self.files)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get a summary of the manifest"""
+        with self._lock:
+            formats = {}
+            for entry in self.files.values():
+                formats[entry['format']] = formats.get(entry['format'], 0) + 1
+            return {
+                'total_files': len(self.files),
+                'total_bytes': sum(entry['size'] for entry in self.files.values()),
+                'files_by_format': formats,
+                'directories': list(self.directories)
+            }
@@ -14,9 +14,12 @@ import glob
 from pathlib import Path
 import json
 
-from .data_access_file_readers import DataAccessFileReaders
+from .data_access_file_readers import DataAccessFileReaders, SCAN_FORMATS
 from .data_access_file_scanning import DataAccessFileScanning
 from .data_access_mock_data import DataAccessMockData
+from .data_access_file_manifest import DataAccessFileManifest
+from .data_access_parallel_loader import DataAccessParallelLoader
+from .time_index import TimeIndex
 
 logger = logging.getLogger(__name__)
 
@@ -28,88 +31,37 @@ class DataAccessFileOps:
         self.readers = DataAccessFileReaders(self)
         self.scanning = DataAccessFileScanning(self)
         self.mock_data = DataAccessMockData(self)
+        self.manifest = DataAccessFileManifest(self)
+        self.loader = DataAccessParallelLoader()
     
     def _fetch_upload_data(self, symbol: str, timeframe: str = '1d', 
-                          start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
-        """Fetch uploaded data from hard drive"""
+                          start_date: Optional[str] = None, end_date: Optional[str] = None,
+                          columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Fetch uploaded data from hard drive
+        
+        Parquet, Feather and CSV files are scanned with the symbol, date range and optional
+        column projection pushed down, so only matching rows and columns are decoded.
+        """
         try:
-            # Define scan directories and file patterns
-            scan_directories = self.scanning.get_scan_directories()
-            file_patterns_config = self.scanning.get_file_patterns()
-            
-            # Define file patterns and readers
-            file_patterns = {
-                'csv': {
-                    'patterns': file_patterns_config['csv'],
-                    'reader': self.readers._read_csv_file
-                },
-                'json': {
-                    'patterns': file_patterns_config['json'],
-                    'reader': self.readers._read_json_file
-                },
-                'feather': {
-                    'patterns': file_patterns_config['feather'],
-                    'reader': self.readers._read_feather_file
-                },
-                'parquet': {
-                    'patterns': file_patterns_config['parquet'],
-                    'reader': self.readers._read_parquet_file
-                },
-                'duckdb': {
-                    'patterns': file_patterns_config['duckdb'],
-                    'reader': self.readers._read_duckdb_file
-                },
-                'keras': {
-                    'patterns': file_patterns_config['keras'],
-                    'reader': self.readers._read_keras_file
-                }
-            }
-            
             all_data = []
-            files_found = False
             
-            # Scan all directories for data files
-            for directory in scan_directories:
-                if not os.path.exists(directory):
-                    logger.debug(f"📁 Directory not found: {directory}")
-                    continue
-                    
-                logger.info(f"🔍 Scanning directory: {directory}")
-                
-                # Try each file format in this directory
-                for format_name, config in file_patterns.items():
-                    try:
-                        for pattern in config['patterns']:
-                            search_pattern = os.path.join(directory, pattern)
-                            files = glob.glob(search_pattern)
-                            
-                            if files:
-                                files_found = True
-                                logger.info(f"📁 Found {len(files)} {format_name} files in {directory}")
-                                
-                                for file_path in files:
-                                    try:
-                                        if format_name == 'duckdb':
-                                            df = config['reader'](file_path, symbol)
-                                        elif format_name == 'keras':
-                                            df = config['reader'](file_path, symbol)
-                                        else:
-                                            df = config['reader'](file_path)
-                                        
-                                        if not df.empty:
-                                            # Add symbol column if not present
-                                            if 'Symbol' not in df.columns:
-                                                df['Symbol'] = symbol
-                                            all_data.append(df)
-                                            logger.info(f"✅ Loaded {format_name} data from {file_path}")
-                                            
-                                    except Exception as e:
-                                        logger.warning(f"⚠️ Failed to read {file_path} ({format_name}): {e}")
-                                        continue
-                                        
-                    except Exception as e:
-                        logger.warning(f"⚠️ Failed to process {format_name} files in {directory}: {e}")
-                        continue
+            # Only files whose manifest entry may hold this symbol and date range are read
+            matching_files = self.manifest.get_files(symbol, start_date, end_date)
+            files_found = self.manifest.has_files()
+            logger.info(f"📇 {len(matching_files)} of {len(self.manifest.files)} indexed files match {symbol}")
+            
+            # Read matching files concurrently; results come back in manifest order
+            tasks = [
+                (entry['path'], lambda entry=entry: self._read_entry(entry, symbol, start_date, end_date, columns))
+                for entry in matching_files
+            ]
+            for file_path, df in self.loader.load(tasks):
+                if not df.empty:
+                    # Add symbol column if not present
+                    if 'Symbol' not in df.columns:
+                        df['Symbol'] = symbol
+                    all_data.append(df)
+                    logger.info(f"✅ Loaded data from {file_path}")
             
             if not files_found:
                 logger.warning(f"⚠️ No uploaded data files found in any supported format")
@@ -142,21 +94,11 @@ class DataAccessFileOps:
             # Combine all data
             combined_data = pd.concat(all_data, ignore_index=True)
             
-            # Convert Date column to datetime if it exists
+            # Parse and sort by Date only when needed (pre-sorted uploads skip both), then binary-search the range
             if 'Date' in combined_data.columns:
-                combined_data['Date'] = pd.to_datetime(combined_data['Date'])
-                
-                # Sort by date
-                combined_data = combined_data.sort_values('Date')
-                
-                # Filter by date range if specified
+                combined_data = TimeIndex.build(combined_data, 'Date')
                 if start_date and end_date:
-                    start_dt = pd.to_datetime(start_date)
-                    end_dt = pd.to_datetime(end_date)
-                    combined_data = combined_data[
-                        (combined_data['Date'] >= start_dt) & 
-                        (combined_data['Date'] <= end_dt)
-                    ]
+                    combined_data = TimeIndex.slice(combined_data, start_date, end_date, 'Date')
             
             # Remove duplicates
             combined_data = combined_data.drop_duplicates()
@@ -170,6 +112,28 @@ class DataAccessFileOps:
     
 
     
+    def _read_entry(self, entry: Dict[str, Any], symbol: str, start_date: Optional[str] = None,
+                    end_date: Optional[str] = None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read one manifest entry, pushing filters down where the format allows it"""
+        file_path, format_name = entry['path'], entry['format']
+        reader = self.readers.get_file_reader(format_name)
+        
+        if format_name in SCAN_FORMATS:
+            try:
+                return self.readers._scan_file(
+                    file_path, format_name, symbol, entry['symbol_column'],
+                    start_date, end_date, entry['date_column'], columns
+                )
+            except Exception as e:
+                # e.g. Feather v1 files, which Arrow datasets cannot open
+                logger.debug(f"⚠️ Pushdown scan failed for {file_path}, reading in full: {e}")
+                return self.readers._filter_symbol(reader(file_path), symbol, entry['symbol_column'])
+        if format_name == 'duckdb':
+            return reader(file_path, symbol, start_date, end_date)
+        if format_name == 'keras':
+            return reader(file_path, symbol)
+        return reader(file_path)
+    
     def get_available_data_files(self) -> Dict[str, List[str]]:
         """Get list of available data files by type"""
         return self.scanning.get_available_data_files()
@@ -10,8 +10,13 @@ from typing import Dict, List, Optional, Any
 import logging
 import json
 
+from .symbol_index import symbol_variants
+
 logger = logging.getLogger(__name__)
 
+# Arrow dataset formats used for pushdown scans
+SCAN_FORMATS = {'parquet': 'parquet', 'feather': 'ipc', 'csv': 'csv'}
+
 class DataAccessFileReaders:
     """File reading functionality for data access"""
     
@@ -52,13 +57,82 @@ class DataAccessFileReaders:
             logger.error(f"❌ Failed to read Parquet file {file_path}: {e}")
             return pd.DataFrame()
     
-    def _read_duckdb_file(self, file_path: str, symbol: str) -> pd.DataFrame:
-        """Read DuckDB file"""
+    def _scan_file(self, file_path: str, format_name: str, symbol: Optional[str] = None,
+                   symbol_column: Optional[str] = None, start_date: Optional[str] = None,
+                   end_date: Optional[str] = None, date_column: Optional[str] = None,
+                   columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Scan a Parquet, Feather or CSV file with symbol/date predicates and column projection pushed down
+
+        Only matching row groups and the requested columns are decoded; Parquet row groups whose
+        statistics exclude the predicates are skipped entirely.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.compute as pc
+        
+        dataset = ds.dataset(file_path, format=SCAN_FORMATS[format_name])
+        schema = dataset.schema
+        
+        predicate = None
+        symbol_filter = symbol and symbol_column and symbol_column in schema.names
+        if symbol_filter:
+            field, symbol_type = ds.field(symbol_column), schema.field(symbol_column).type
+            if pa.types.is_dictionary(symbol_type):
+                # Categorical columns; the string kernels only take plain strings
+                field, symbol_type = field.cast(symbol_type.value_type), symbol_type.value_type
+            if pa.types.is_string(symbol_type) or pa.types.is_large_string(symbol_type):
+                # Same rule as the manifest: the ticker itself or its .US form, in any case
+                predicate = pc.utf8_upper(field).isin(symbol_variants(symbol))
+                symbol_filter = False
+        
+        if date_column and date_column in schema.names:
+            date_type = schema.field(date_column).type
+            for bound, op in ((start_date, 'ge'), (end_date, 'le')):
+                value = self._date_bound(bound, date_type) if bound else None
+                if value is None:
+                    continue
+                condition = ds.field(date_column) >= value if op == 'ge' else ds.field(date_column) <= value
+                predicate = condition if predicate is None else predicate & condition
+        
+        if columns:
+            columns = [c for c in schema.names if c in columns or c in (symbol_column, date_column)]
+        
+        table = dataset.to_table(columns=columns, filter=predicate)
+        data = table.to_pandas()
+        if symbol_filter:
+            # Symbol columns Arrow cannot match as strings (e.g. integer codes)
+            data = self._filter_symbol(data, symbol, symbol_column)
+        return data
+    
+    def _filter_symbol(self, data: pd.DataFrame, symbol: str, symbol_column: Optional[str]) -> pd.DataFrame:
+        """Keep the rows of a symbol (the ticker itself or its .US form) from a fully read file"""
+        if not symbol_column or symbol_column not in data.columns:
+            return data
+        return data[data[symbol_column].astype(str).str.upper().isin(symbol_variants(symbol))]
+    
+    def _date_bound(self, value: str, field_type):
+        """Convert a date bound to an Arrow scalar comparable with the column, or None if not comparable"""
+        import pyarrow as pa
+        
+        timestamp = pd.Timestamp(value)
+        if pa.types.is_timestamp(field_type):
+            if field_type.tz:
+                timestamp = (timestamp.tz_localize(field_type.tz) if timestamp.tz is None
+                             else timestamp.tz_convert(field_type.tz))
+            elif timestamp.tz is not None:
+                timestamp = timestamp.tz_localize(None)
+            return pa.scalar(timestamp.to_pydatetime(), type=field_type)
+        if pa.types.is_date(field_type):
+            return pa.scalar(timestamp.date(), type=field_type)
+        # String dates cannot be compared reliably; they are filtered after loading
+        return None
+    
+    def _read_duckdb_file(self, file_path: str, symbol: str, start_date: Optional[str] = None,
+                          end_date: Optional[str] = None) -> pd.DataFrame:
+        """Read DuckDB file through the shared read-only connection pool, date bounds applied in SQL"""
         try:
-            import duckdb
-            conn = duckdb.connect(file_path)
-            query = f"SELECT * FROM data WHERE Symbol = '{symbol}'"
-            return conn.execute(query).df()
+            from .data_access_duckdb import get_duckdb_manager
+            return get_duckdb_manager().read_symbol(file_path, symbol, start_date, end_date)
         except Exception as e:
             logger.error(f"❌ Failed to read DuckDB file {file_path}: {e}")
             return pd.DataFrame()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+TradePulse Data Access - Parallel Loader
+Thread-pool file loading with per-file timeouts and ordered results
+"""
+
+from typing import List, Callable, Any, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+import logging
+import threading
+import time
+import os
+
+logger = logging.getLogger(__name__)
+
+class DataAccessParallelLoader:
+    """Load many files concurrently and return the results in submission order
+
+    Arrow, Parquet and most pandas readers release the GIL while decoding, so a thread pool
+    keeps the disk busy instead of reading one file at a time. Each load gets its own pool:
+    a running read cannot be cancelled, so a file that times out keeps its thread until the
+    read returns, but it never holds a worker later loads need.
+    """
+
+    MAX_WORKERS = int(os.getenv('TRADEPULSE_LOADER_WORKERS', str(min(8, (os.cpu_count() or 1) * 2))))
+    FILE_TIMEOUT = float(os.getenv('TRADEPULSE_LOADER_FILE_TIMEOUT', '120'))
+
+    def __init__(self, max_workers: Optional[int] = None, file_timeout: Optional[float] = None):
+        self.max_workers = max_workers or self.MAX_WORKERS
+        self.file_timeout = file_timeout or self.FILE_TIMEOUT
+        self._executors = set()   # pools of loads in progress
+        self._lock = threading.Lock()   # guards _executors and stats (loads may run concurrently)
+        self.stats = {
+            'files_loaded': 0,
+            'files_failed': 0,
+            'files_timed_out': 0
+        }
+
+    def _count(self, key: str):
+        """Increment a stats counter"""
+        with self._lock:
+            self.stats[key] += 1
+
+    def load(self, tasks: List[Tuple[str, Callable[[], Any]]]) -> List[Tuple[str, Any]]:
+        """Run (name, loader) tasks concurrently and return (name, result) pairs in task order
+
+        Failed and timed-out tasks are logged and left out of the results. The timeout applies
+        to each file from the moment a worker starts it, not from submission; a timed-out read
+        is abandoned on its thread rather than stopped.
+        """
+        if not tasks:
+            return []
+        if self.max_workers <= 1:
+            return [(name, result) for name, result in (self._run_inline(name, loader) for name, loader in tasks)
+                    if result is not None]
+
+        started = {}
+
+        def run(index: int, loader: Callable[[], Any]):
+            started[index] = time.monotonic()
+            return loader()
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks)),
+                                      thread_name_prefix='tradepulse-loader')
+        with self._lock:
+            self._executors.add(executor)
+        try:
+            futures = [executor.submit(run, index, loader) for index, (_, loader) in enumerate(tasks)]
+            results = []
+            for index, ((name, _), future) in enumerate(zip(tasks, futures)):
+                try:
+                    results.append((name, self._wait(future, started, index)))
+                    self._count('files_loaded')
+                except FuturesTimeout:
+                    self._count('files_timed_out')
+                    logger.warning(f"⏱️ Loading {name} exceeded {self.file_timeout:g}s, skipping it")
+                except Exception as e:
+                    self._count('files_failed')
+                    logger.warning(f"⚠️ Failed to load {name}: {e}")
+            return results
+        finally:
+            # Nothing waits for reads still running after a timeout; their threads exit when they return
+            executor.shutdown(wait=False, cancel_futures=True)
+            with self._lock:
+                self._executors.discard(executor)
+
+    def _wait(self, future, started: dict, index: int) -> Any:
+        """Wait for a task until it has run for longer than the per-file timeout"""
+        while True:
+            start = started.get(index)
+            remaining = self.file_timeout if start is None else self.file_timeout - (time.monotonic() - start)
+            try:
+                return future.result(timeout=max(remaining, 0))
+            except FuturesTimeout:
+                start = started.get(index)
+                if start is not None and time.monotonic() - start >= self.file_timeout:
+                    raise
+
+    def _run_inline(self, name: str, loader: Callable[[], Any]) -> Tuple[str, Any]:
+        """Run a single task on the calling thread"""
+        try:
+            result = loader()
+            self._count('files_loaded')
+            return name, result
+        except Exception as e:
+            self._count('files_failed')
+            logger.warning(f"⚠️ Failed to load {name}: {e}")
+            return name, None
+
+    def shutdown(self):
+        """Cancel the queued tasks of loads in progress"""
+        with self._lock:
+            executors, self._executors = self._executors, set()
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
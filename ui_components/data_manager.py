@@ -43,6 +43,14 @@ class DataManager:
         """Add uploaded data to the global store for use by all modules across all instances"""
         return self.core.add_uploaded_data(key, data, metadata)
     
+    def add_uploaded_file(self, key: str, file_path: str, metadata: Optional[Dict] = None) -> str:
+        """Add an upload already written to an Arrow IPC file (streaming ingest)"""
+        return self.core.add_uploaded_file(key, file_path, metadata)
+    
+    def index_dataset_symbols(self, dataset_id: str, data=None) -> List[str]:
+        """Add a dataset to the symbol index"""
+        return self.core.index_dataset_symbols(dataset_id, data)
+    
     def get_dataset(self, dataset_id: str):
         """Get a specific dataset by ID"""
         return self.core.get_dataset(dataset_id)
@@ -87,6 +95,10 @@ class DataManager:
         """Get price data for a specific symbol as DataFrame"""
         return self.ops.get_price_data_for_symbol(symbol)
     
+    def get_price_data_version(self, symbol: str) -> int:
+        """Get how many times a symbol's price data was replaced (0 for the initial data)"""
+        return self.ops.get_price_data_version(symbol)
+    
     def get_portfolio_data(self) -> Dict[str, Any]:
         """Get portfolio data"""
         return self.ops.get_portfolio_data()
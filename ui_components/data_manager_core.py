@@ -10,7 +10,12 @@ from typing import Dict, List, Optional, Any
 import logging
 from datetime import datetime, timedelta
 import json
+import os
 from .global_data_store import get_global_data_store
+from .synthetic_ohlcv import SyntheticOHLCVGenerator
+from .dataset_compactor import DatasetCompactor
+from .symbol_index import get_symbol_index
+from .time_index import TimeIndex
 
 logger = logging.getLogger(__name__)
 
@@ -20,10 +25,14 @@ class DataManager:
     def __init__(self):
         self.symbols = ["AAPL", "GOOGL", "MSFT", "TSLA", "AMZN", "NVDA", "META", "NFLX"]
         self.price_data = {}
+        self.price_versions = {}  # symbol -> count of price data replacements
         self.portfolio_data = {}
         self.ml_predictions = {}
         self.alerts = []
         self.orders = []
+        self.price_generator = SyntheticOHLCVGenerator()
+        self.compactor = DatasetCompactor()
+        self.symbol_index = get_symbol_index()
         
         # Use global data store for uploaded datasets to ensure persistence across instances
         self.global_store = get_global_data_store()
@@ -75,27 +84,9 @@ class DataManager:
             start_date = end_date - timedelta(days=365)
             dates = pd.date_range(start=start_date, end=end_date, freq='D')
             
-            # Generate mock price data
-            np.random.seed(hash(symbol) % 2**32)
-            base_price = 100 + hash(symbol) % 900
-            
-            data = []
-            current_price = base_price
-            
-            for date in dates:
-                change = np.random.normal(0, 2)
-                current_price = max(1, current_price + change)
-                
-                data.append({
-                    'Date': date,
-                    'Open': current_price * (1 + np.random.normal(0, 0.01)),
-                    'High': current_price * (1 + abs(np.random.normal(0, 0.02))),
-                    'Low': current_price * (1 - abs(np.random.normal(0, 0.02))),
-                    'Close': current_price,
-                    'Volume': int(np.random.exponential(1000000))
-                })
-            
-            return pd.DataFrame(data)
+            # Generate mock price data with the vectorized, seeded generator
+            data = self.price_generator.to_frame(self.price_generator.generate([symbol], dates), [symbol])
+            return data.drop(columns=['Symbol'])
             
         except Exception as e:
             logger.error(f"❌ Failed to generate sample price data for {symbol}: {e}")
@@ -141,14 +132,25 @@ class DataManager:
             # Generate unique dataset ID
             dataset_id = f"dataset_{key}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             
+            # Parse and sort the time column once so range queries can binary-search it
+            data = TimeIndex.build(data)
+            time_column = data.attrs.get(TimeIndex.ATTR_COLUMN)
+            
+            # Narrow dtypes (categorical tickers, downcast ints) before the data is stored
+            memory_report = None
+            if self.compactor.ENABLED:
+                data, memory_report = self.compactor.compact(data)
+            
             # Prepare metadata with enhanced information
             enhanced_metadata = {
                 **(metadata or {}),
+                'memory_report': memory_report,
+                'time_column': time_column,
                 'upload_time': datetime.now(),
                 'shape': data.shape,
                 'columns': data.columns.tolist(),
                 'dtypes': data.dtypes.to_dict(),
-                'memory_usage': data.memory_usage(deep=True).sum(),
+                'memory_usage': memory_report['memory_after'] if memory_report else data.memory_usage(deep=True).sum(),
                 'access_count': 0,
                 'last_accessed': datetime.now()
             }
@@ -164,6 +166,7 @@ class DataManager:
                     'available': True,
                     'modules': list(self.module_data_access.keys())
                 }
+                self.index_dataset_symbols(dataset_id, data)
                 
                 logger.info(f"✅ Uploaded data added: {dataset_id} ({data.shape[0]} rows, {data.shape[1]} columns)")
                 return dataset_id
@@ -175,11 +178,105 @@ class DataManager:
             logger.error(f"❌ Failed to add uploaded data: {e}")
             return None
     
+    def add_uploaded_file(self, key: str, file_path: str, metadata: Optional[Dict] = None) -> str:
+        """Add an upload already written to an Arrow IPC file (streaming ingest)
+        
+        In columnar mode a file whose time column is already a sorted timestamp column (or that has
+        none) is moved into the store without being loaded. Otherwise the file is loaded once, goes
+        through the same time indexing and compaction as add_uploaded_data, and is then deleted.
+        """
+        try:
+            metadata = metadata or {}
+            time_column = self._sorted_time_column(file_path) if self.global_store.storage_mode == 'columnar' else False
+            if time_column is False:
+                import pyarrow as pa
+                with pa.memory_map(str(file_path), 'r') as source:
+                    data = pa.ipc.open_file(source).read_all().to_pandas()
+                dataset_id = self.add_uploaded_data(key, data, metadata)
+                if dataset_id:
+                    os.remove(file_path)
+                return dataset_id
+            
+            dataset_id = f"dataset_{key}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            schema = metadata.get('schema', {})
+            
+            enhanced_metadata = {
+                **metadata,
+                'time_column': time_column,
+                'upload_time': datetime.now(),
+                'shape': (metadata.get('rows', 0), len(schema)),
+                'columns': list(schema),
+                'dtypes': schema,
+                'memory_usage': metadata.get('output_bytes', 0),
+                'access_count': 0,
+                'last_accessed': datetime.now()
+            }
+            
+            if self.global_store.add_uploaded_file(dataset_id, file_path, enhanced_metadata):
+                self.dataset_registry[dataset_id] = {
+                    'name': key,
+                    'type': 'uploaded',
+                    'available': True,
+                    'modules': list(self.module_data_access.keys())
+                }
+                self.index_dataset_symbols(dataset_id)
+                
+                logger.info(f"✅ Uploaded file added: {dataset_id} ({enhanced_metadata['shape'][0]} rows, "
+                            f"{enhanced_metadata['shape'][1]} columns)")
+                return dataset_id
+            else:
+                logger.error(f"❌ Failed to add uploaded file to global store")
+                return None
+                
+        except Exception as e:
+            logger.error(f"❌ Failed to add uploaded file: {e}")
+            return None
+    
+    def _sorted_time_column(self, file_path: str):
+        """Get the time column of an Arrow file if it can be kept as is (None if there is none), else False"""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        with pa.memory_map(str(file_path), 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+            column = TimeIndex.find_time_column(table.schema.empty_table().to_pandas())
+            if column is None:
+                return None
+            times = table.column(column)
+            if not pa.types.is_timestamp(times.type) or times.null_count:
+                return False
+            times = times.combine_chunks()
+            if len(times) > 1 and not pc.all(pc.greater_equal(times.slice(1), times.slice(0, len(times) - 1))).as_py():
+                return False
+            return column
+    
+    def index_dataset_symbols(self, dataset_id: str, data: Optional[pd.DataFrame] = None) -> List[str]:
+        """Add a dataset to the symbol index (reading only its symbol/date columns when data is not given)"""
+        try:
+            if data is None and self.global_store.is_memory_mapped(dataset_id):
+                new_symbols = self.symbol_index.add_table(dataset_id, self.global_store.get_uploaded_table(dataset_id))
+            else:
+                # A shallow view: only the symbol and date columns are read
+                if data is None:
+                    data = self.global_store.get_dataset_view(dataset_id)
+                new_symbols = self.symbol_index.add_dataset(dataset_id, data)
+            
+            # Only symbols new to the universe touch the symbol list
+            known = set(self.symbols)
+            added = [symbol for symbol in new_symbols if symbol not in known]
+            if added:
+                self.symbols.extend(added)
+                self.symbols.sort()
+            return added
+            
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to index symbols for {dataset_id}: {e}")
+            return []
+    
     def get_dataset(self, dataset_id: str) -> pd.DataFrame:
         """Get a specific dataset by ID"""
         try:
-            # Get from global store
-            data = self.global_store.get_uploaded_data(dataset_id)
+            # Get a zero-copy view from the global store (copied only if the caller mutates it)
+            data = self.global_store.get_dataset_view(dataset_id)
             if data is not None:
                 # Update access statistics
                 self.global_store.update_dataset_access(dataset_id)
@@ -288,6 +385,8 @@ class DataManager:
             
             # Calculate memory usage
             total_memory = sum(metadata.get('memory_usage', 0) for metadata in available_datasets.values())
+            memory_saved = sum(metadata['memory_report']['memory_before'] - metadata['memory_report']['memory_after']
+                               for metadata in available_datasets.values() if metadata.get('memory_report'))
             
             # Get most accessed datasets
             access_counts = [(ds_id, metadata.get('access_count', 0)) 
@@ -299,9 +398,12 @@ class DataManager:
                 'total_rows': total_rows,
                 'total_columns': total_columns,
                 'total_memory_mb': total_memory / (1024 * 1024),
+                'compaction_saved_mb': memory_saved / (1024 * 1024),
                 'most_accessed': access_counts[:5],
                 'active_modules': list(self.active_datasets.keys()),
-                'total_active': sum(len(datasets) for datasets in self.active_datasets.values())
+                'total_active': sum(len(datasets) for datasets in self.active_datasets.values()),
+                'copy_stats': self.global_store.get_copy_stats(),
+                'spill_stats': self.global_store.get_spill_stats()
             }
             
         except Exception as e:
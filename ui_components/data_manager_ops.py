@@ -11,6 +11,8 @@ import logging
 from datetime import datetime, timedelta
 import json
 
+from .synthetic_ohlcv import SyntheticOHLCVGenerator
+
 logger = logging.getLogger(__name__)
 
 class DataManagerOps:
@@ -18,6 +20,7 @@ class DataManagerOps:
     
     def __init__(self, core_manager):
         self.core = core_manager
+        self.price_generator = SyntheticOHLCVGenerator()
     
     def cleanup_old_datasets(self, days_old: int = 30) -> int:
         """Clean up datasets older than specified days"""
@@ -77,20 +80,8 @@ class DataManagerOps:
     def generate_sample_price_data(self, symbol: str) -> pd.DataFrame:
         """Generate sample price data for a symbol"""
         dates = pd.date_range(start='2024-01-01', end='2024-12-31', freq='D')
-        data = []
-        
-        for date in dates:
-            base_price = 100 + np.random.normal(0, 20)
-            data.append({
-                'Date': date,
-                'Open': base_price + np.random.normal(0, 2),
-                'High': base_price + np.random.normal(2, 3),
-                'Low': base_price + np.random.normal(-2, 3),
-                'Close': base_price + np.random.normal(0, 2),
-                'Volume': int(1000000 + np.random.normal(0, 200000))
-            })
-        
-        return pd.DataFrame(data)
+        arrays = self.price_generator.generate([symbol], dates, base_prices=100.0)
+        return self.price_generator.to_frame(arrays, [symbol]).drop(columns=['Symbol'])
     
     def generate_sample_portfolio_data(self) -> Dict[str, Any]:
         """Generate sample portfolio data"""
@@ -125,6 +116,10 @@ class DataManagerOps:
         """Get price data for a specific symbol as DataFrame"""
         return self.core.price_data.get(symbol, pd.DataFrame())
     
+    def get_price_data_version(self, symbol: str) -> int:
+        """Get how many times a symbol's price data was replaced (0 for the initial data)"""
+        return self.core.price_versions.get(symbol, 0)
+    
     def get_portfolio_data(self) -> Dict[str, Any]:
         """Get portfolio data"""
         return self.core.portfolio_data
@@ -136,4 +131,5 @@ class DataManagerOps:
     def update_price_data(self, symbol: str, new_data: pd.DataFrame):
         """Update price data for a symbol"""
         self.core.price_data[symbol] = new_data
+        self.core.price_versions[symbol] = self.core.price_versions.get(symbol, 0) + 1
         logger.info(f"📊 Price data updated for {symbol}")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+TradePulse Dataset Compactor
+Ingest-time dtype compaction for uploaded datasets with a before/after memory report
+"""
+
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+from typing import Dict, Any, Tuple, Optional
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+class DatasetCompactor:
+    """Shrink uploaded frames by choosing narrower dtypes per column
+
+    - low-cardinality string columns (tickers, exchanges) become categoricals
+    - other string columns become Arrow-backed strings; columns that already are (pandas 3's
+      default str dtype) are kept and reported as already compact
+    - integers are narrowed to int32 when their range fits; never below int32, since arithmetic on
+      int8/int16 overflows silently, and never for columns named like volumes or quantities
+      (sums and products)
+    - price columns optionally become float32, only when every value survives the round trip
+      at PRICE_DECIMALS precision
+    """
+
+    ENABLED = os.getenv('TRADEPULSE_COMPACT_UPLOADS', 'true').lower() == 'true'
+    CATEGORY_MAX_RATIO = float(os.getenv('TRADEPULSE_CATEGORY_MAX_RATIO', '0.5'))
+    FLOAT32_PRICES = os.getenv('TRADEPULSE_FLOAT32_PRICES', 'false').lower() == 'true'
+    PRICE_DECIMALS = int(os.getenv('TRADEPULSE_PRICE_DECIMALS', '4'))
+    PRICE_COLUMNS = ['open', 'high', 'low', 'close', 'adj close', 'adj_close', 'price', 'vwap']
+    WIDE_INT_COLUMNS = ['volume', 'quantity', 'qty', 'shares', 'size', 'trades', 'open interest', 'open_interest']
+
+    def __init__(self, category_max_ratio: Optional[float] = None, float32_prices: Optional[bool] = None,
+                 price_decimals: Optional[int] = None):
+        self.category_max_ratio = self.CATEGORY_MAX_RATIO if category_max_ratio is None else category_max_ratio
+        self.float32_prices = self.FLOAT32_PRICES if float32_prices is None else float32_prices
+        self.price_decimals = self.PRICE_DECIMALS if price_decimals is None else price_decimals
+
+    def compact(self, data: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """Return a compacted frame and a report of the dtype changes and memory saved"""
+        memory_before = int(data.memory_usage(deep=True).sum())
+        converted = {}
+        changes = {}
+        already_compact = []
+
+        for column in data.columns:
+            series = data[column]
+            try:
+                compacted = self._compact_column(column, series)
+            except Exception as e:
+                logger.debug(f"Compaction skipped column {column}: {e}")
+                continue
+            if compacted is not None:
+                converted[column] = compacted
+                changes[str(column)] = f"{series.dtype} -> {compacted.dtype}"
+            elif self._is_arrow_string(series.dtype):
+                already_compact.append(str(column))
+
+        # Shallow copy: the caller's frame keeps its dtypes and unchanged columns are shared
+        result = data.copy(deep=False) if converted else data
+        for column, compacted in converted.items():
+            result[column] = compacted
+        memory_after = int(result.memory_usage(deep=True).sum())
+        report = {
+            'memory_before': memory_before,
+            'memory_after': memory_after,
+            'memory_saved_pct': round(100 * (1 - memory_after / memory_before), 1) if memory_before else 0.0,
+            'dtype_changes': changes,
+            'already_compact': already_compact
+        }
+        if changes:
+            logger.info(f"🗜️ Compacted {len(changes)} columns: {memory_before:,} -> {memory_after:,} bytes")
+        return result, report
+
+    def _is_wide_int_column(self, column) -> bool:
+        """Check whether a column holds volumes or quantities (e.g. 'Volume', 'volume_usd', 'Total Volume')"""
+        name = str(column).lower()
+        return any(token in name for token in self.WIDE_INT_COLUMNS)
+    
+    @staticmethod
+    def _is_arrow_string(dtype) -> bool:
+        """Check whether a dtype already stores strings in Arrow buffers (str on pandas 3, string[pyarrow])"""
+        if isinstance(dtype, pd.StringDtype):
+            return str(dtype.storage).startswith('pyarrow')
+        return isinstance(dtype, pd.ArrowDtype) and (pa.types.is_string(dtype.pyarrow_dtype)
+                                                     or pa.types.is_large_string(dtype.pyarrow_dtype))
+    
+    def _compact_column(self, column, series: pd.Series) -> Optional[pd.Series]:
+        """Get the compacted version of one column, or None to leave it unchanged"""
+        if series.dtype == object or isinstance(series.dtype, pd.StringDtype):
+            if series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) != 'string':
+                return None
+            non_null = series.count()
+            if non_null and series.nunique() / non_null <= self.category_max_ratio:
+                return series.astype('category')
+            if self._is_arrow_string(series.dtype):
+                return None
+            return series.astype(pd.ArrowDtype(pa.string()))
+
+        if pd.api.types.is_integer_dtype(series.dtype) and not isinstance(series.dtype, pd.ArrowDtype):
+            if series.dtype.itemsize <= 4 or self._is_wide_int_column(column):
+                return None
+            bounds = np.iinfo(np.int32)
+            if series.count() and (series.min() < bounds.min or series.max() > bounds.max):
+                return None
+            return series.astype('Int32' if isinstance(series.dtype, pd.api.extensions.ExtensionDtype) else np.int32)
+
+        if (self.float32_prices and series.dtype == np.float64
+                and str(column).lower() in self.PRICE_COLUMNS):
+            narrowed = series.astype(np.float32)
+            error = (narrowed.astype(np.float64) - series).abs().max()
+            # Precision guard: keep float64 unless every price survives at price_decimals
+            if pd.isna(error) or error < 0.5 * 10 ** -self.price_decimals:
+                return narrowed
+            logger.debug(f"Keeping {column} as float64, float32 error {error:g} exceeds tolerance")
+        return None
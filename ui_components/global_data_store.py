@@ -5,19 +5,35 @@ Provides shared data storage across all DataManager instances to solve data pers
 """
 
 import pandas as pd
-from typing import Dict, Any, Optional
+import numpy as np
+from typing import Dict, Any, Optional, Tuple
 import logging
 from datetime import datetime
 import threading
+import os
 
 logger = logging.getLogger(__name__)
 
+# Views handed out share the stored buffers; Copy-on-Write (always on from pandas 3) makes any
+# write to a view copy the touched column first, so the stored frame never changes
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
 class GlobalDataStore:
     """Singleton global data store for sharing data across all DataManager instances"""
     
     _instance = None
     _lock = threading.Lock()
     
+    # Storage mode: 'memory' keeps DataFrames in process, 'columnar' persists them as
+    # memory-mapped Arrow IPC files under DATA_DIR
+    STORAGE_MODE = os.getenv('TRADEPULSE_STORAGE_MODE', 'memory')
+    DATA_DIR = os.getenv('TRADEPULSE_DATA_DIR', 'data/datasets')
+    
+    # Memory budget for 'memory' mode; least-recently-used datasets beyond it spill to a per-process directory under SPILL_DIR (0 = unlimited)
+    MEMORY_BUDGET_BYTES = int(float(os.getenv('TRADEPULSE_MEMORY_BUDGET_MB', '0')) * 1024 * 1024)
+    SPILL_DIR = os.getenv('TRADEPULSE_SPILL_DIR', 'data/spill')
+    
     def __new__(cls):
         if cls._instance is None:
             with cls._lock:
@@ -28,17 +44,76 @@ class GlobalDataStore:
     
     def _initialize(self):
         """Initialize the global data store"""
-        self.uploaded_datasets = {}
+        self.storage_mode = 'memory'
         self.dataset_metadata = {}
         self.access_counts = {}
+        self.uploaded_datasets = self._create_memory_storage()
+        self.copy_stats = {
+            'deep_copies': 0,
+            'bytes_copied': 0,
+            'zero_copy_reads': 0
+        }
+        if self.STORAGE_MODE == 'columnar':
+            self._enable_columnar_storage(self.DATA_DIR)
         self.initialized = True
-        logger.info("🌐 Global Data Store initialized")
+        logger.info(f"🌐 Global Data Store initialized ({self.storage_mode} storage)")
+    
+    def _create_memory_storage(self):
+        """Create the in-memory dataset mapping with LRU spill-to-disk"""
+        from .global_data_store_spill import SpillableDatasetStore
+        return SpillableDatasetStore(self.SPILL_DIR, self.MEMORY_BUDGET_BYTES, self.access_counts)
+    
+    def _enable_columnar_storage(self, data_dir: str):
+        """Switch to Arrow IPC storage, migrating in-memory datasets and loading persisted ones"""
+        from .global_data_store_columnar import ColumnarDatasetStore
+        
+        columnar_store = ColumnarDatasetStore(data_dir)
+        for dataset_id, data in self.uploaded_datasets.items():
+            columnar_store[dataset_id] = data
+            columnar_store.write_metadata(dataset_id, self.dataset_metadata.get(dataset_id, {}))
+        for dataset_id in columnar_store:
+            if dataset_id not in self.dataset_metadata:
+                self.dataset_metadata[dataset_id] = columnar_store.read_metadata(dataset_id)
+                self.access_counts[dataset_id] = 0
+        
+        self.uploaded_datasets = columnar_store
+        self.storage_mode = 'columnar'
+    
+    def set_storage_mode(self, mode: str, data_dir: Optional[str] = None) -> bool:
+        """Switch between 'memory' and 'columnar' storage, migrating existing datasets"""
+        try:
+            with self._lock:
+                if mode == self.storage_mode:
+                    return True
+                if mode == 'columnar':
+                    self._enable_columnar_storage(data_dir or self.DATA_DIR)
+                elif mode == 'memory':
+                    memory_storage = self._create_memory_storage()
+                    for ds_id, data in self.uploaded_datasets.items():
+                        memory_storage[ds_id] = data.copy()
+                    self.uploaded_datasets = memory_storage
+                    self.storage_mode = 'memory'
+                else:
+                    raise ValueError(f"Unknown storage mode: {mode}")
+                
+                logger.info(f"🌐 Global Store: Switched to {mode} storage")
+                return True
+                
+        except Exception as e:
+            logger.error(f"❌ Global Store: Failed to switch to {mode} storage: {e}")
+            return False
     
     def add_uploaded_data(self, dataset_id: str, data: pd.DataFrame, metadata: Dict[str, Any]) -> bool:
         """Add uploaded data to the global store"""
         try:
             with self._lock:
-                self.uploaded_datasets[dataset_id] = data.copy()
+                if self.storage_mode == 'columnar':
+                    # Written straight to disk, so no in-process copy is kept
+                    self.uploaded_datasets[dataset_id] = data
+                    self.uploaded_datasets.write_metadata(dataset_id, metadata)
+                else:
+                    # An owned copy: later edits to the caller's frame never reach the store
+                    self.uploaded_datasets[dataset_id] = data.copy()
                 self.dataset_metadata[dataset_id] = metadata.copy()
                 self.access_counts[dataset_id] = 0
                 
@@ -49,28 +124,132 @@ class GlobalDataStore:
             logger.error(f"❌ Global Store: Failed to add dataset {dataset_id}: {e}")
             return False
     
-    def get_uploaded_data(self, dataset_id: Optional[str] = None) -> Dict[str, pd.DataFrame]:
-        """Get uploaded data from the global store"""
+    def add_uploaded_file(self, dataset_id: str, file_path: str, metadata: Dict[str, Any]) -> bool:
+        """Add a dataset already written to an Arrow IPC file (e.g. by streaming CSV ingest)
+        
+        In columnar mode the file is moved into the store and never loaded; in memory mode
+        it is read once and then managed by the spill budget like any other upload.
+        """
+        try:
+            with self._lock:
+                if self.storage_mode == 'columnar':
+                    self.uploaded_datasets.import_file(dataset_id, file_path)
+                    self.uploaded_datasets.write_metadata(dataset_id, metadata)
+                else:
+                    import pyarrow as pa
+                    with pa.memory_map(str(file_path), 'r') as source:
+                        self.uploaded_datasets[dataset_id] = pa.ipc.open_file(source).read_all().to_pandas()
+                self.dataset_metadata[dataset_id] = metadata.copy()
+                self.access_counts[dataset_id] = 0
+                
+                logger.info(f"🌐 Global Store: Added dataset {dataset_id} from {file_path}")
+                return True
+                
+        except Exception as e:
+            logger.error(f"❌ Global Store: Failed to add dataset {dataset_id} from {file_path}: {e}")
+            return False
+    
+    def get_uploaded_data(self, dataset_id: Optional[str] = None, copy: bool = False) -> Dict[str, pd.DataFrame]:
+        """Get uploaded data from the global store
+        
+        Returns zero-copy views by default. They are copy-on-write, so in-place writes
+        (df.loc[...] = ..., fillna(inplace=True)) copy the touched columns into the view and
+        never change the stored dataset. Pass copy=True for an independent deep copy.
+        """
         try:
             with self._lock:
                 if dataset_id:
                     if dataset_id in self.uploaded_datasets:
                         self.access_counts[dataset_id] += 1
-                        return {dataset_id: self.uploaded_datasets[dataset_id].copy()}
+                        return {dataset_id: self._read_dataset(dataset_id, copy)}
                     else:
                         return {}
                 else:
                     # Return all datasets
                     result = {}
-                    for ds_id, data in self.uploaded_datasets.items():
+                    for ds_id in self.uploaded_datasets:
                         self.access_counts[ds_id] += 1
-                        result[ds_id] = data.copy()
+                        result[ds_id] = self._read_dataset(ds_id, copy)
                     return result
                     
         except Exception as e:
             logger.error(f"❌ Global Store: Failed to get dataset {dataset_id}: {e}")
             return {}
     
+    def get_dataset_view(self, dataset_id: str) -> Optional[pd.DataFrame]:
+        """Get a single dataset as a zero-copy, copy-on-write view (None if not found)"""
+        return self.get_uploaded_data(dataset_id).get(dataset_id)
+    
+    def _read_dataset(self, dataset_id: str, copy: bool = False) -> pd.DataFrame:
+        """Read a dataset, copying only when explicitly requested"""
+        data = self.uploaded_datasets[dataset_id]
+        if copy:
+            self.copy_stats['deep_copies'] += 1
+            self.copy_stats['bytes_copied'] += int(data.memory_usage(deep=False).sum())
+            return data.copy()
+        
+        self.copy_stats['zero_copy_reads'] += 1
+        if self.storage_mode == 'columnar':
+            # Columnar reads are already fresh frames over the memory-mapped file
+            return data
+        # A shallow copy: writes to the view are copied on write and never reach the store
+        return data.copy(deep=False)
+    
+    def update_dataset_access(self, dataset_id: str):
+        """Record an access in the dataset metadata"""
+        with self._lock:
+            metadata = self.dataset_metadata.get(dataset_id)
+            if metadata is not None:
+                metadata['access_count'] = metadata.get('access_count', 0) + 1
+                metadata['last_accessed'] = datetime.now()
+    
+    def set_memory_budget(self, budget_bytes: int) -> bool:
+        """Set the in-memory byte budget (0 = unlimited), spilling datasets that no longer fit"""
+        try:
+            with self._lock:
+                self.MEMORY_BUDGET_BYTES = budget_bytes
+                if self.storage_mode == 'memory':
+                    self.uploaded_datasets.set_budget(budget_bytes)
+                logger.info(f"🌐 Global Store: Memory budget set to {budget_bytes / (1024 * 1024):.1f} MB")
+                return True
+                
+        except Exception as e:
+            logger.error(f"❌ Global Store: Failed to set memory budget: {e}")
+            return False
+    
+    def get_spill_stats(self) -> Dict[str, Any]:
+        """Get spill, reload and hit-rate statistics for the in-memory storage"""
+        if self.storage_mode != 'memory':
+            return {}
+        return self.uploaded_datasets.get_stats()
+    
+    def get_copy_stats(self) -> Dict[str, int]:
+        """Get counters for deep copies and zero-copy reads served by the store"""
+        with self._lock:
+            return self.copy_stats.copy()
+    
+    def is_memory_mapped(self, dataset_id: str) -> bool:
+        """Check whether a dataset is served from a memory-mapped Arrow file (columnar mode)"""
+        with self._lock:
+            return (self.storage_mode == 'columnar' and dataset_id in self.uploaded_datasets
+                    and self.uploaded_datasets.is_mapped(dataset_id))
+    
+    def get_uploaded_table(self, dataset_id: str):
+        """Get a dataset as a read-only Arrow table (memory-mapped in columnar mode)"""
+        try:
+            with self._lock:
+                if dataset_id not in self.uploaded_datasets:
+                    return None
+                self.access_counts[dataset_id] += 1
+                if self.storage_mode == 'columnar' and self.uploaded_datasets.is_mapped(dataset_id):
+                    return self.uploaded_datasets.read_table(dataset_id)
+                import pyarrow as pa
+                return pa.Table.from_pandas(self.uploaded_datasets[dataset_id])
+                
+        except Exception as e:
+            logger.error(f"❌ Global Store: Failed to get table {dataset_id}: {e}")
+            return None
+    
     def get_dataset_metadata(self, dataset_id: str) -> Optional[Dict[str, Any]]:
         """Get metadata for a specific dataset"""
         try:
@@ -128,26 +307,34 @@ class GlobalDataStore:
             logger.error(f"❌ Global Store: Failed to clear data: {e}")
             return False
     
+    def _storage_totals(self) -> Tuple[int, int, int]:
+        """Get resident bytes, row count and bytes on disk; caller holds the lock
+        
+        Neither storage loads data for this: spilled sizes are tracked on insert, and columnar
+        row counts come from the Arrow file footers, so mapped pages are not touched.
+        """
+        storage = self.uploaded_datasets
+        total_records = sum(storage.num_rows(ds_id) for ds_id in storage)
+        total_disk = storage.disk_usage() if self.storage_mode == 'columnar' else 0
+        return int(storage.resident_bytes()), total_records, total_disk
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the global data store"""
         try:
             with self._lock:
                 total_datasets = len(self.uploaded_datasets)
-                total_memory = sum(
-                    data.memory_usage(deep=True).sum() 
-                    for data in self.uploaded_datasets.values()
-                )
-                total_records = sum(
-                    data.shape[0] 
-                    for data in self.uploaded_datasets.values()
-                )
+                total_memory, total_records, total_disk = self._storage_totals()
                 
                 return {
+                    'storage_mode': self.storage_mode,
                     'total_datasets': total_datasets,
                     'total_memory_bytes': total_memory,
+                    'total_disk_bytes': total_disk,
                     'total_records': total_records,
                     'dataset_ids': list(self.uploaded_datasets.keys()),
-                    'access_counts': self.access_counts.copy()
+                    'access_counts': self.access_counts.copy(),
+                    'copy_stats': self.copy_stats.copy(),
+                    'spill_stats': self.get_spill_stats()
                 }
                 
         except Exception as e:
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+TradePulse Global Data Store - Columnar Storage
+Arrow IPC (Feather v2) backed dataset storage with memory-mapped, read-only reads
+"""
+
+import pandas as pd
+import pyarrow as pa
+from typing import Dict, Any, Optional, Iterator
+from collections.abc import MutableMapping
+import logging
+import json
+import hashlib
+import shutil
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+class ColumnarDatasetStore(MutableMapping):
+    """Dict-like store that persists each dataset as an Arrow IPC file and serves memory-mapped reads
+
+    Datasets are written uncompressed so that reads map the file directly: resident memory
+    grows only with the pages that are actually touched, not with what was uploaded.
+    """
+
+    FILE_SUFFIX = '.arrow'
+    METADATA_SUFFIX = '.meta.json'
+
+    def __init__(self, data_dir: str):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._index = {}       # dataset_id -> Arrow IPC file path
+        self._in_memory = {}   # datasets Arrow could not convert (e.g. mixed object columns)
+        self._load_index()
+        logger.info(f"🗄️ Columnar store ready at {self.data_dir} ({len(self._index)} datasets on disk)")
+
+    def _load_index(self):
+        """Index dataset files already present in the data directory"""
+        for path in self.data_dir.glob(f"*{self.FILE_SUFFIX}"):
+            stem = path.name[:-len(self.FILE_SUFFIX)]
+            metadata = self._load_json(path.with_name(stem + self.METADATA_SUFFIX))
+            self._index[metadata.get('dataset_id', stem)] = path
+
+    def _load_json(self, path: Path) -> Dict[str, Any]:
+        """Load a JSON sidecar file, returning an empty dict when missing or unreadable"""
+        if not path.exists():
+            return {}
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ Columnar store: Could not read {path}: {e}")
+            return {}
+
+    def _path_for(self, dataset_id: str) -> Path:
+        """Get the Arrow IPC file path for a dataset
+
+        Ids that need sanitizing get a hash of the original id appended, so 'a/b' and 'a_b' do not
+        share a file. Datasets already on disk keep the path they were indexed under.
+        """
+        if dataset_id in self._index:
+            return self._index[dataset_id]
+        safe_id = "".join(c if c.isalnum() or c in '-_.' else '_' for c in dataset_id)
+        if safe_id != dataset_id:
+            safe_id += '-' + hashlib.sha1(dataset_id.encode('utf-8')).hexdigest()[:12]
+        return self.data_dir / f"{safe_id}{self.FILE_SUFFIX}"
+
+    def _metadata_path_for(self, dataset_id: str) -> Path:
+        """Get the metadata sidecar path for a dataset"""
+        path = self._path_for(dataset_id)
+        return path.with_name(path.name[:-len(self.FILE_SUFFIX)] + self.METADATA_SUFFIX)
+
+    def write_table(self, dataset_id: str, table: pa.Table) -> Path:
+        """Write an Arrow table to disk atomically"""
+        path = self._path_for(dataset_id)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with pa.OSFile(str(tmp_path), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+        self._index[dataset_id] = path
+        self._in_memory.pop(dataset_id, None)
+        return path
+
+    def import_file(self, dataset_id: str, file_path: str) -> Path:
+        """Move an Arrow IPC file written elsewhere (e.g. by streaming ingest) into the store"""
+        path = self._path_for(dataset_id)
+        tmp_path = path.with_name(path.name + '.tmp')
+        shutil.move(str(file_path), str(tmp_path))
+        os.replace(tmp_path, path)
+        self._index[dataset_id] = path
+        self._in_memory.pop(dataset_id, None)
+        return path
+
+    def read_table(self, dataset_id: str) -> pa.Table:
+        """Read a dataset as a memory-mapped, read-only Arrow table (no copy)"""
+        path = self._index[dataset_id]
+        source = pa.memory_map(str(path), 'r')
+        return pa.ipc.open_file(source).read_all()
+
+    def read_dataframe(self, dataset_id: str) -> pd.DataFrame:
+        """Read a dataset as an Arrow-backed DataFrame over the memory-mapped file"""
+        if dataset_id in self._in_memory:
+            return self._in_memory[dataset_id]
+        return self.read_table(dataset_id).to_pandas(types_mapper=pd.ArrowDtype)
+
+    def write_metadata(self, dataset_id: str, metadata: Dict[str, Any]):
+        """Persist dataset metadata next to the data file"""
+        try:
+            with open(self._metadata_path_for(dataset_id), 'w') as f:
+                json.dump({**metadata, 'dataset_id': dataset_id}, f, default=str)
+        except Exception as e:
+            logger.warning(f"⚠️ Columnar store: Could not persist metadata for {dataset_id}: {e}")
+
+    def read_metadata(self, dataset_id: str) -> Dict[str, Any]:
+        """Load persisted dataset metadata, if any"""
+        return self._load_json(self._metadata_path_for(dataset_id))
+
+    def disk_usage(self, dataset_id: Optional[str] = None) -> int:
+        """Get bytes on disk for one dataset or for the whole store"""
+        ids = [dataset_id] if dataset_id else list(self._index)
+        return sum(self._index[ds_id].stat().st_size for ds_id in ids if ds_id in self._index)
+
+    def is_mapped(self, dataset_id: str) -> bool:
+        """Check whether a dataset is served from a memory-mapped file"""
+        return dataset_id in self._index
+
+    def resident_bytes(self) -> int:
+        """Get bytes held in process by datasets that could not be stored columnar"""
+        return sum(data.memory_usage(deep=True).sum() for data in self._in_memory.values())
+
+    def num_rows(self, dataset_id: str) -> int:
+        """Get the row count of a dataset without touching its data pages"""
+        if dataset_id in self._in_memory:
+            return len(self._in_memory[dataset_id])
+        with pa.memory_map(str(self._index[dataset_id]), 'r') as source:
+            reader = pa.ipc.open_file(source)
+            return sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+
+    def __setitem__(self, dataset_id: str, data: pd.DataFrame):
+        try:
+            self.write_table(dataset_id, pa.Table.from_pandas(data))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            logger.warning(f"⚠️ Columnar store: Keeping {dataset_id} in memory, Arrow conversion failed: {e}")
+            # A previous version on disk would otherwise be reloaded in its place after a restart
+            path = self._index.pop(dataset_id, None)
+            if path is not None:
+                path.unlink(missing_ok=True)
+            self._in_memory[dataset_id] = data.copy()
+
+    def __getitem__(self, dataset_id: str) -> pd.DataFrame:
+        if dataset_id not in self:
+            raise KeyError(dataset_id)
+        return self.read_dataframe(dataset_id)
+
+    def __delitem__(self, dataset_id: str):
+        if dataset_id not in self:
+            raise KeyError(dataset_id)
+        # The sidecar is written for every dataset, including those kept in memory
+        self._metadata_path_for(dataset_id).unlink(missing_ok=True)
+        if self._in_memory.pop(dataset_id, None) is None:
+            self._index.pop(dataset_id).unlink(missing_ok=True)
+
+    def clear(self):
+        for dataset_id in list(self):
+            del self[dataset_id]
+
+    def __contains__(self, dataset_id) -> bool:
+        return dataset_id in self._index or dataset_id in self._in_memory
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._index)
+        yield from list(self._in_memory)
+
+    def __len__(self) -> int:
+        return len(self._index) + len(self._in_memory)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+TradePulse Global Data Store - Spill Storage
+In-memory dataset storage with a byte budget and LRU spill-to-disk
+"""
+
+import pandas as pd
+import pyarrow as pa
+from typing import Dict, Any, Optional, Iterator
+from collections.abc import MutableMapping
+import logging
+import threading
+import time
+import atexit
+import os
+import shutil
+import uuid
+
+from .global_data_store_columnar import ColumnarDatasetStore
+
+logger = logging.getLogger(__name__)
+
+class SpillableDatasetStore(MutableMapping):
+    """Dict-like in-memory store that spills least-recently-used datasets to an Arrow cache
+
+    Spilled datasets stay visible through the mapping and are reloaded transparently on the
+    next access. A budget of 0 disables spilling.
+    """
+
+    def __init__(self, spill_dir: str, budget_bytes: int = 0, access_counts: Optional[Dict[str, int]] = None):
+        self.spill_dir = spill_dir
+        self.budget_bytes = budget_bytes
+        self.access_counts = access_counts if access_counts is not None else {}
+        self._resident = {}      # dataset_id -> DataFrame
+        self._sizes = {}         # dataset_id -> bytes in memory
+        self._rows = {}          # dataset_id -> row count
+        self._last_access = {}   # dataset_id -> monotonic timestamp
+        self._spilled = set()
+        self._spill_store = None
+        self._lock = threading.RLock()
+        self.stats = {
+            'spills': 0,
+            'reloads': 0,
+            'hits': 0,
+            'misses': 0,
+            'bytes_spilled': 0,
+            'bytes_reloaded': 0
+        }
+
+    def _get_spill_store(self) -> ColumnarDatasetStore:
+        """Create this process's own spill cache on first use (workers sharing spill_dir never collide)"""
+        if self._spill_store is None:
+            process_dir = os.path.join(self.spill_dir, f"{os.getpid()}-{uuid.uuid4().hex[:8]}")
+            self._spill_store = ColumnarDatasetStore(process_dir)
+            atexit.register(self.cleanup)
+        return self._spill_store
+
+    def cleanup(self):
+        """Delete this process's spill directory and forget the datasets in it (runs at exit)"""
+        with self._lock:
+            if self._spill_store is None:
+                return
+            shutil.rmtree(self._spill_store.data_dir, ignore_errors=True)
+            self._spill_store = None
+            for ds_id in self._spilled:
+                for table in (self._sizes, self._rows, self._last_access):
+                    table.pop(ds_id, None)
+            self._spilled.clear()
+
+    def set_budget(self, budget_bytes: int):
+        """Change the memory budget and enforce it immediately"""
+        with self._lock:
+            self.budget_bytes = budget_bytes
+            self._enforce_budget()
+
+    def resident_bytes(self) -> int:
+        """Get bytes held in memory by resident datasets"""
+        return sum(self._sizes[ds_id] for ds_id in self._resident)
+
+    def num_rows(self, dataset_id: str) -> int:
+        """Get the row count of a dataset without reloading it"""
+        return self._rows[dataset_id]
+
+    def is_spilled(self, dataset_id: str) -> bool:
+        """Check whether a dataset currently lives in the spill cache"""
+        return dataset_id in self._spilled
+
+    def _eviction_order(self, exclude: str):
+        """Resident datasets ordered least recently used first, ties broken by fewest accesses"""
+        candidates = [ds_id for ds_id in self._resident if ds_id != exclude]
+        return sorted(candidates, key=lambda ds_id: (self._last_access.get(ds_id, 0),
+                                                     self.access_counts.get(ds_id, 0)))
+
+    def _enforce_budget(self, exclude: Optional[str] = None):
+        """Spill LRU datasets until resident memory fits the budget"""
+        if not self.budget_bytes:
+            return
+        for ds_id in self._eviction_order(exclude):
+            if self.resident_bytes() <= self.budget_bytes:
+                break
+            self._spill(ds_id)
+        if self.resident_bytes() > self.budget_bytes:
+            logger.warning(f"⚠️ Spill store: Datasets in use exceed the memory budget, keeping them resident")
+
+    def _spill(self, dataset_id: str):
+        """Move a resident dataset to the spill cache"""
+        data = self._resident[dataset_id]
+        try:
+            self._get_spill_store().write_table(dataset_id, pa.Table.from_pandas(data))
+        except Exception as e:
+            logger.warning(f"⚠️ Spill store: Could not spill {dataset_id}, keeping it resident: {e}")
+            return
+        del self._resident[dataset_id]
+        self._spilled.add(dataset_id)
+        self.stats['spills'] += 1
+        self.stats['bytes_spilled'] += self._sizes[dataset_id]
+        logger.info(f"💾 Spill store: Spilled {dataset_id} ({self._sizes[dataset_id] / (1024 * 1024):.1f} MB)")
+
+    def _reload(self, dataset_id: str) -> pd.DataFrame:
+        """Load a spilled dataset back into memory"""
+        data = self._spill_store.read_table(dataset_id).to_pandas()
+        del self._spill_store[dataset_id]
+        self._spilled.discard(dataset_id)
+        self._resident[dataset_id] = data
+        self.stats['reloads'] += 1
+        self.stats['bytes_reloaded'] += self._sizes[dataset_id]
+        logger.info(f"📤 Spill store: Reloaded {dataset_id}")
+        return data
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get spill, reload and hit-rate statistics"""
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return {
+                **self.stats,
+                'hit_rate': self.stats['hits'] / lookups if lookups else 1.0,
+                'budget_bytes': self.budget_bytes,
+                'resident_bytes': self.resident_bytes(),
+                'resident_datasets': len(self._resident),
+                'spilled_datasets': len(self._spilled),
+                'spilled_disk_bytes': self._spill_store.disk_usage() if self._spill_store else 0
+            }
+
+    def __setitem__(self, dataset_id: str, data: pd.DataFrame):
+        with self._lock:
+            if dataset_id in self._spilled:
+                del self._spill_store[dataset_id]
+                self._spilled.discard(dataset_id)
+            self._resident[dataset_id] = data
+            self._sizes[dataset_id] = int(data.memory_usage(deep=True).sum())
+            self._rows[dataset_id] = len(data)
+            self._last_access[dataset_id] = time.monotonic()
+            self._enforce_budget(exclude=dataset_id)
+
+    def __getitem__(self, dataset_id: str) -> pd.DataFrame:
+        with self._lock:
+            if dataset_id in self._resident:
+                self.stats['hits'] += 1
+                data = self._resident[dataset_id]
+            elif dataset_id in self._spilled:
+                self.stats['misses'] += 1
+                data = self._reload(dataset_id)
+                self._enforce_budget(exclude=dataset_id)
+            else:
+                raise KeyError(dataset_id)
+            self._last_access[dataset_id] = time.monotonic()
+            return data
+
+    def __delitem__(self, dataset_id: str):
+        with self._lock:
+            if dataset_id in self._spilled:
+                del self._spill_store[dataset_id]
+                self._spilled.discard(dataset_id)
+            elif dataset_id in self._resident:
+                del self._resident[dataset_id]
+            else:
+                raise KeyError(dataset_id)
+            self._sizes.pop(dataset_id, None)
+            self._rows.pop(dataset_id, None)
+            self._last_access.pop(dataset_id, None)
+
+    def __contains__(self, dataset_id) -> bool:
+        return dataset_id in self._resident or dataset_id in self._spilled
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._sizes))
+
+    def __len__(self) -> int:
+        return len(self._sizes)
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+TradePulse Streaming Indicator Engine
+Stateful RSI, SMA, EMA, MACD and Bollinger Bands updated bar by bar per symbol and timeframe
+"""
+
+import pandas as pd
+import numpy as np
+from collections import deque
+from typing import Dict, Optional, Any
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+class StreamingIndicatorEngine:
+    """Keep per-series indicator state so each refresh only computes the newest bars
+
+    State is kept per (symbol, timeframe) and tagged with the version of the source it was
+    computed from (e.g. a dataset id or file version); a different version starts over.
+
+    Every bar except the last is committed: its running state (SMA/Bollinger window sums,
+    Wilder RSI averages, EMA numerator/denominator) is kept and never recomputed. The last bar
+    is provisional, because ticks keep revising its close, and is recomputed from the committed
+    state on every update. A full vectorized recompute only happens on first load or backfill
+    (history that no longer matches the committed bars).
+    """
+
+    RSI_PERIOD = 14
+    SMA_PERIOD = 20
+    EMA_FAST = 12
+    EMA_SLOW = 26
+    SIGNAL_PERIOD = 9
+    BB_STD = 2.0
+    COLUMNS = ['RSI', 'SMA_20', 'EMA_12', 'EMA_26', 'MACD', 'MACD_Signal', 'BB_Upper', 'BB_Lower']
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._series = {}   # (symbol, timeframe) -> {'state', 'values', 'count', 'version', 'last_date', 'last_close'}
+        self.stats = {'backfills': 0, 'incremental': 0, 'bars': 0}
+        self._columns = pd.Index(self.COLUMNS)   # built once; string Index construction is not free
+
+    def update(self, symbol: str, data: pd.DataFrame, timeframe: Optional[str] = None,
+               version: Any = None) -> pd.DataFrame:
+        """Get indicators aligned to a symbol's bars, computing only new or revised bars
+
+        Bars from another timeframe never share state, and a version that differs from the one
+        the state was built from (the source data was replaced) forces a backfill.
+
+        The result is a read-only view over the engine's buffer; its last row is the provisional bar.
+        """
+        if data is None or data.empty or 'Close' not in data.columns:
+            return pd.DataFrame(columns=self.COLUMNS)
+
+        key = (symbol, timeframe)
+        with self._lock:
+            entry = self._series.get(key)
+            if entry is not None and entry['version'] != version:
+                entry = None
+            # Only bars from the last committed one on are converted; closes[0] is data row `start`
+            start = entry['count'] - 1 if entry and 0 < entry['count'] < len(data) else 0
+            closes = self._closes(data['Close'].iloc[start:], entry['last_close'] if start else None)
+            if not self._continues(entry, data, closes, start):
+                if start:
+                    closes, start = self._closes(data['Close']), 0
+                entry = self._series[key] = self._backfill(closes[:-1])
+                entry['version'] = version
+                self.stats['backfills'] += 1
+            else:
+                for close in closes[entry['count'] - start:-1]:
+                    self._commit(entry, close)
+                self.stats['incremental'] += 1
+            committed = entry['count']
+            entry['last_close'] = closes[committed - 1 - start] if committed else None
+            entry['last_date'] = data['Date'].iloc[committed - 1] if committed and 'Date' in data.columns else None
+            # Provisional last bar, recomputed from the committed state on every tick
+            _, row = self._step(entry['state'], closes[-1])
+            self._reserve(entry, committed + 1)
+            entry['values'][committed] = row
+            values = entry['values'][:committed + 1].view()
+            values.flags.writeable = False
+
+        return pd.DataFrame(values, columns=self._columns, index=data.index, copy=False)
+
+    @staticmethod
+    def _closes(close: pd.Series, seed: Optional[float] = None) -> np.ndarray:
+        """Convert closes to float64, forward-filling gaps (leading gaps from seed, the prior close)"""
+        closes = pd.to_numeric(close, errors='coerce').ffill()
+        if seed is not None:
+            closes = closes.fillna(seed)
+        return closes.to_numpy(dtype=np.float64)
+
+    def _continues(self, entry, data: pd.DataFrame, closes: np.ndarray, start: int) -> bool:
+        """Check whether new data extends the committed bars (else a backfill is needed)"""
+        if entry is None or len(data) <= entry['count']:
+            return False
+        committed = entry['count']
+        if not committed:
+            return True
+        if 'Date' in data.columns and entry['last_date'] is not None and \
+                data['Date'].iloc[committed - 1] != entry['last_date']:
+            return False
+        return closes[committed - 1 - start] == entry['last_close']
+
+    def _initial_state(self) -> Dict[str, Any]:
+        """Get the state before any bar"""
+        return {'prev': None, 'deltas': 0, 'gain': 0.0, 'loss': 0.0, 'window': deque(maxlen=self.SMA_PERIOD),
+                'sum': 0.0, 'sumsq': 0.0, 'fast': (0.0, 0.0), 'slow': (0.0, 0.0), 'signal': (0.0, 0.0)}
+
+    @staticmethod
+    def _ema(pair, value: float, span: int):
+        """Advance an adjusted EMA (pandas ewm(span, adjust=True)) held as (numerator, denominator)"""
+        decay = 1.0 - 2.0 / (span + 1)
+        num, den = value + decay * pair[0], 1.0 + decay * pair[1]
+        return (num, den), num / den
+
+    def _step(self, state: Dict[str, Any], close: float):
+        """Get the state after one more bar and that bar's indicator row (state is not modified)"""
+        if np.isnan(close) and state['prev'] is not None:
+            close = state['prev']
+        nxt = dict(state)
+        rsi = np.nan
+        if state['prev'] is not None:
+            delta = close - state['prev']
+            gain, loss, n = max(delta, 0.0), max(-delta, 0.0), self.RSI_PERIOD
+            nxt['deltas'] = state['deltas'] + 1
+            if nxt['deltas'] < n:
+                nxt['gain'], nxt['loss'] = state['gain'] + gain, state['loss'] + loss   # warm-up sums
+            elif nxt['deltas'] == n:
+                nxt['gain'], nxt['loss'] = (state['gain'] + gain) / n, (state['loss'] + loss) / n
+            else:
+                # Wilder smoothing
+                nxt['gain'] = (state['gain'] * (n - 1) + gain) / n
+                nxt['loss'] = (state['loss'] * (n - 1) + loss) / n
+            if nxt['deltas'] >= n:
+                rsi = 100.0 if nxt['loss'] == 0 else 100.0 - 100.0 / (1.0 + nxt['gain'] / nxt['loss'])
+        nxt['prev'] = close
+
+        # Rolling window sums; the window deque itself is only advanced on commit
+        window = state['window']
+        dropped = window[0] if len(window) == window.maxlen else 0.0
+        nxt['sum'] = state['sum'] - dropped + close
+        nxt['sumsq'] = state['sumsq'] - dropped * dropped + close * close
+        size = min(len(window) + 1, self.SMA_PERIOD)
+        sma = upper = lower = np.nan
+        if size == self.SMA_PERIOD:
+            sma = nxt['sum'] / size
+            std = np.sqrt(max(nxt['sumsq'] - nxt['sum'] * sma, 0.0) / (size - 1))
+            upper, lower = sma + self.BB_STD * std, sma - self.BB_STD * std
+
+        nxt['fast'], fast = self._ema(state['fast'], close, self.EMA_FAST)
+        nxt['slow'], slow = self._ema(state['slow'], close, self.EMA_SLOW)
+        nxt['signal'], signal = self._ema(state['signal'], fast - slow, self.SIGNAL_PERIOD)
+        return nxt, np.array([rsi, sma, fast, slow, fast - slow, signal, upper, lower])
+
+    def _commit(self, entry: Dict[str, Any], close: float):
+        """Append one finished bar to a symbol's committed state and values"""
+        state, row = self._step(entry['state'], close)
+        state['window'].append(state['prev'])   # shared with the old state, which is discarded
+        entry['state'] = state
+        self._reserve(entry, entry['count'] + 1)
+        entry['values'][entry['count']] = row
+        entry['count'] += 1
+        self.stats['bars'] += 1
+
+    def _reserve(self, entry: Dict[str, Any], size: int):
+        """Grow a symbol's values buffer to hold at least size rows (earlier views keep the old buffer)"""
+        if size > len(entry['values']):
+            grown = np.empty((max(2 * len(entry['values']), size, 64), len(self.COLUMNS)))
+            grown[:entry['count']] = entry['values'][:entry['count']]
+            entry['values'] = grown
+
+    def _backfill(self, closes: np.ndarray) -> Dict[str, Any]:
+        """Compute committed values for full history with vectorized pandas and derive the running state"""
+        state = self._initial_state()
+        count = len(closes)
+        values = np.full((max(count * 2, 64), len(self.COLUMNS)), np.nan)
+        if not count:
+            return {'state': state, 'values': values, 'count': 0, 'last_date': None, 'last_close': None}
+        close = pd.Series(closes)
+        n, period = self.RSI_PERIOD, self.SMA_PERIOD
+
+        delta = close.diff().iloc[1:]
+        gains, losses = delta.clip(lower=0.0), (-delta).clip(lower=0.0)
+        if len(delta) >= n:
+            # Wilder averages: seeded with the mean of the first n deltas, then alpha = 1/n
+            smooth = lambda s: pd.concat([pd.Series([s.iloc[:n].mean()]), s.iloc[n:]]).ewm(alpha=1 / n, adjust=False).mean()
+            avg_gain, avg_loss = smooth(gains).to_numpy(), smooth(losses).to_numpy()
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rsi = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+            values[n:count, 0] = rsi
+            state['gain'], state['loss'] = avg_gain[-1], avg_loss[-1]
+        else:
+            state['gain'], state['loss'] = gains.sum(), losses.sum()
+        state['deltas'], state['prev'] = len(delta), closes[-1]
+
+        values[:count, 1] = close.rolling(period).mean()
+        std = close.rolling(period).std()
+        values[:count, 6] = values[:count, 1] + self.BB_STD * std
+        values[:count, 7] = values[:count, 1] - self.BB_STD * std
+        window = closes[-period:]
+        state['window'].extend(window)
+        state['sum'], state['sumsq'] = float(window.sum()), float((window * window).sum())
+
+        fast = close.ewm(span=self.EMA_FAST, adjust=True).mean()
+        slow = close.ewm(span=self.EMA_SLOW, adjust=True).mean()
+        macd = fast - slow
+        signal = macd.ewm(span=self.SIGNAL_PERIOD, adjust=True).mean()
+        values[:count, 2:6] = np.column_stack([fast, slow, macd, signal])
+        for key, span, ema in [('fast', self.EMA_FAST, fast), ('slow', self.EMA_SLOW, slow),
+                               ('signal', self.SIGNAL_PERIOD, signal)]:
+            # Adjusted EMA denominator after count bars is the geometric sum of the decay
+            decay = 1.0 - 2.0 / (span + 1)
+            den = (1.0 - decay ** count) / (1.0 - decay)
+            state[key] = (ema.iloc[-1] * den, den)
+        return {'state': state, 'values': values, 'count': count, 'last_date': None, 'last_close': None}
+
+    def reset(self, symbol: Optional[str] = None, timeframe: Optional[str] = None):
+        """Drop a symbol's state for one timeframe or all of them (forces a backfill), or all state"""
+        with self._lock:
+            if symbol is None:
+                self._series.clear()
+            else:
+                for key in [key for key in self._series if key[0] == symbol and timeframe in (None, key[1])]:
+                    del self._series[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get engine statistics"""
+        with self._lock:
+            return {**self.stats, 'symbols': len({symbol for symbol, _ in self._series}), 'series': len(self._series)}
+
+# Global instance
+_indicator_engine = None
+
+def get_indicator_engine() -> StreamingIndicatorEngine:
+    """Get the global streaming indicator engine instance"""
+    global _indicator_engine
+    if _indicator_engine is None:
+        _indicator_engine = StreamingIndicatorEngine()
+    return _indicator_engine
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+TradePulse Live Charts
+Bokeh charts kept current with ColumnDataSource stream/patch updates instead of full redraws
+"""
+
+import panel as pn
+import pandas as pd
+import numpy as np
+from bokeh.models import ColumnDataSource, DataRange1d, LinearAxis
+from bokeh.plotting import figure
+from typing import Dict, List, Optional, Any, Hashable, Tuple
+import logging
+import os
+
+from .bar_pyramid import get_bar_pyramid
+
+logger = logging.getLogger(__name__)
+
+class LiveChartFeed:
+    """Keep a ColumnDataSource in step with a growing, time-ordered bar frame
+
+    The first frame for a key (symbol, timeframe) replaces the source data. Later frames for the
+    same key only send what changed: bars after the last sent one are streamed, and the last sent
+    bar is patched when its values were revised (an open candle ticking). If the first or last sent
+    bar no longer matches the frame (history was reloaded), the source is replaced again.
+    """
+
+    MAX_BARS = int(os.getenv('TRADEPULSE_LIVE_CHART_MAX_BARS', '5000'))
+
+    def __init__(self, columns: List[str], max_bars: Optional[int] = None):
+        self.columns = ['Date'] + [c for c in columns if c != 'Date']
+        self.max_bars = max_bars or self.MAX_BARS
+        self.source = ColumnDataSource({c: [] for c in self.columns})
+        self.key = None
+        self._first = None  # first bar in the source as {column: value}
+        self._last = None   # last sent bar as {column: value}
+        self._size = 0      # rows in the source, after rollover
+        self.stats = {'resets': 0, 'streams': 0, 'patches': 0, 'unchanged': 0}
+
+    def update(self, key: Hashable, data: pd.DataFrame) -> str:
+        """Bring the source up to date with data; returns 'reset', 'stream', 'patch' or 'unchanged'"""
+        dates = data['Date'] if len(data) else None
+        position = -1
+        if key == self.key and self._last is not None and dates is not None:
+            # Series.searchsorted compares Timestamps with datetime64 values, np.searchsorted does not
+            position = int(dates.searchsorted(self._last['Date']))
+            start = position - (self._size - 1)
+            if position >= len(dates) or dates.iloc[position] != self._last['Date'] or start < 0 or \
+                    not all(self._same(v, self._first[c]) for c, v in self._row(data, start).items()):
+                position = -1
+        if position < 0:
+            self._reset(key, data)
+            return 'reset'
+
+        revised = self._row(data, position)
+        patch = {c: [(self._size - 1, v)] for c, v in revised.items() if not self._same(v, self._last[c])}
+        new_rows = data.iloc[position + 1:]
+        stream = {c: new_rows[c].to_numpy(copy=True) for c in self.columns} if len(new_rows) else None
+        if patch:
+            self.dispatch(self.source.patch, patch)
+            self.stats['patches'] += 1
+        if stream:
+            self.dispatch(self.source.stream, stream, self.max_bars)
+            self._size = min(self._size + len(new_rows), self.max_bars)
+            self.stats['streams'] += 1
+        self._first, self._last = self._row(data, len(data) - self._size), self._row(data, len(data) - 1)
+        if not patch and not stream:
+            self.stats['unchanged'] += 1
+            return 'unchanged'
+        return 'stream' if stream else 'patch'
+
+    def _reset(self, key: Hashable, data: pd.DataFrame):
+        """Replace the source data with the latest max_bars bars"""
+        tail = data.iloc[-self.max_bars:]
+        self.dispatch(setattr, self.source, 'data', {c: tail[c].to_numpy(copy=True) for c in self.columns})
+        self.key, self._size = key, len(tail)
+        self._first = self._row(tail, 0) if len(tail) else None
+        self._last = self._row(tail, len(tail) - 1) if len(tail) else None
+        self.stats['resets'] += 1
+        logger.info(f"📡 Live chart: {key} reset with {len(tail)} bars")
+
+    def _row(self, data: pd.DataFrame, position: int) -> Dict[str, Any]:
+        """Get one bar as plain values for comparisons"""
+        return {c: data[c].iloc[position] for c in self.columns}
+
+    @staticmethod
+    def _same(old, new) -> bool:
+        """Compare two cell values (missing values are equal to each other)"""
+        return old == new or (pd.isna(old) and pd.isna(new))
+
+    def dispatch(self, method, *args):
+        """Apply a source change on the document's event loop when it is served, else directly"""
+        document = self.source.document
+        if document is not None and pn.state.curdoc is not document:
+            document.add_next_tick_callback(lambda: method(*args))
+        else:
+            method(*args)
+
+class LiveCandlestickChart:
+    """Candlestick and volume charts sharing one live feed"""
+
+    UP_COLOR = '#26a69a'
+    DOWN_COLOR = '#ef5350'
+    BAR_WIDTH = 0.7   # fraction of the bar interval
+
+    def __init__(self, max_bars: Optional[int] = None, height: int = 400, volume_height: int = 200):
+        self.feed = LiveChartFeed(['Open', 'High', 'Low', 'Close', 'Volume', 'Color'], max_bars)
+        source = self.feed.source
+        self.price = figure(x_axis_type='datetime', height=height, sizing_mode='stretch_width',
+                            title='Price', tools='pan,wheel_zoom,box_zoom,reset')
+        self.price.segment('Date', 'High', 'Date', 'Low', color='Color', source=source)
+        self.body = self.price.vbar('Date', 0, 'Open', 'Close', fill_color='Color', line_color='Color', source=source)
+        self.volume = figure(x_axis_type='datetime', height=volume_height, sizing_mode='stretch_width',
+                             title='Volume', x_range=self.price.x_range, tools='')
+        self.volume_bars = self.volume.vbar('Date', 0, 'Volume', 0, fill_color='Color', line_color='Color',
+                                            alpha=0.6, source=source)
+        self.price_pane = pn.pane.Bokeh(self.price, sizing_mode='stretch_width')
+        self.volume_pane = pn.pane.Bokeh(self.volume, sizing_mode='stretch_width')
+
+    def prepare(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Normalize raw bars (any OHLCV column case, Date column or DatetimeIndex) for the feed"""
+        bars = get_bar_pyramid().normalize(data).rename_axis('Date').reset_index()
+        bars['Color'] = np.where(bars['Close'] >= bars['Open'], self.UP_COLOR, self.DOWN_COLOR)
+        return bars
+
+    def update(self, symbol: str, data: pd.DataFrame, timeframe: Optional[str] = None) -> str:
+        """Show bars for a symbol; a new symbol or timeframe redraws, otherwise only changes are sent"""
+        if data is None or data.empty:
+            return 'unchanged'
+        bars = self.prepare(data)
+        key = (symbol, timeframe)
+        if key != self.feed.key:
+            title = f"{symbol} - Price" + (f" ({timeframe})" if timeframe else '')
+            spacing = bars['Date'].diff().median() if len(bars) > 1 else pd.Timedelta(days=1)
+            width = self.BAR_WIDTH * spacing / pd.Timedelta(milliseconds=1)
+            self.feed.dispatch(self._restyle, title, width)
+        return self.feed.update(key, bars)
+
+    def _restyle(self, title: str, width: float):
+        """Set the title and candle width for a new symbol or timeframe"""
+        self.price.title.text = title
+        self.body.glyph.width = self.volume_bars.glyph.width = width
+
+    def get_layout(self) -> pn.Column:
+        """Get the price and volume panes"""
+        return pn.Column(self.price_pane, self.volume_pane, sizing_mode='stretch_width')
+
+class LiveLineChart:
+    """Line series on a live feed, each on its own y-axis (e.g. RSI, MACD and SMA together)"""
+
+    def __init__(self, series: List[Tuple[str, str, str]], title: str = '', height: int = 300,
+                 max_bars: Optional[int] = None):
+        self.feed = LiveChartFeed([column for column, _, _ in series], max_bars)
+        self.figure = figure(x_axis_type='datetime', height=height, sizing_mode='stretch_width',
+                             title=title, tools='pan,wheel_zoom,box_zoom,reset')
+        for i, (column, label, color) in enumerate(series):
+            renderer = self.figure.line('Date', column, color=color, legend_label=label, source=self.feed.source,
+                                        y_range_name='default' if i == 0 else column)
+            if i == 0:
+                self.figure.y_range.renderers = [renderer]
+                self.figure.yaxis.axis_label = label
+            else:
+                self.figure.extra_y_ranges[column] = DataRange1d(renderers=[renderer])
+                self.figure.add_layout(LinearAxis(y_range_name=column, axis_label=label), 'right')
+        self.pane = pn.pane.Bokeh(self.figure, sizing_mode='stretch_width')
+
+    def update(self, key: Hashable, data: pd.DataFrame) -> str:
+        """Show series from a frame with a Date column; only changes are sent for the same key"""
+        if data is None or data.empty:
+            return 'unchanged'
+        return self.feed.update(key, data)
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+TradePulse Symbol Index
+Symbol universe maintained at ingest time, with integer symbol IDs and per-dataset coverage
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Any
+import bisect
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Exchange suffix some sources append to tickers (Redline files hold e.g. COIN.US)
+EXCHANGE_SUFFIX = '.US'
+
+def symbol_variants(symbol: str) -> List[str]:
+    """Get the upper-case tickers a requested symbol matches in data files: itself and its .US form
+
+    Any other suffix names a different instrument (BRK does not match BRK.A or BRK.B).
+    """
+    base = symbol.strip().upper()
+    if base.endswith(EXCHANGE_SUFFIX):
+        base = base[:-len(EXCHANGE_SUFFIX)]
+    return [base, base + EXCHANGE_SUFFIX]
+
+class SymbolIndex:
+    """Map every symbol to a stable integer ID and to the datasets (and date ranges) holding it
+
+    A dataset is indexed once, when it is ingested: its symbol column is grouped in a single
+    pass and only new symbols are inserted into the sorted universe. Lookups never rescan data,
+    and other modules can encode symbol columns to compact int32 keys for joins.
+    """
+
+    SYMBOL_COLUMNS = ['ticker', 'symbol', 'code']   # matched case-insensitively, in priority order
+    DATE_COLUMNS = ['date', 'timestamp', 'datetime', 'time']
+    SYMBOL_PATTERN = r'^[A-Z]{1,5}(\.US)?$'
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._ids = {}          # symbol -> id
+        self._symbols = []      # id -> symbol
+        self._sorted = []       # symbols in sorted order
+        self._coverage = {}     # id -> {dataset_id: {'start', 'end', 'rows'}}
+        self._datasets = {}     # dataset_id -> [ids]
+
+    def find_symbol_column(self, data: pd.DataFrame) -> Optional[str]:
+        """Get the column holding symbols: a known name first, else a string column of ticker-like values"""
+        lowered = {str(col).lower(): col for col in data.columns}
+        for name in self.SYMBOL_COLUMNS:
+            if name in lowered:
+                return lowered[name]
+        for col in data.columns:
+            if data[col].dtype == object or isinstance(data[col].dtype, (pd.StringDtype, pd.CategoricalDtype)):
+                sample = data[col].dropna().head(100).astype(str)
+                if len(sample) and sample.str.match(self.SYMBOL_PATTERN).any():
+                    return col
+        return None
+
+    def _date_column(self, data: pd.DataFrame) -> Optional[str]:
+        """Get the column holding bar dates, if any"""
+        lowered = {str(col).lower(): col for col in data.columns}
+        return next((lowered[name] for name in self.DATE_COLUMNS if name in lowered), None)
+
+    def normalize(self, value) -> Optional[str]:
+        """Clean a raw symbol (upper case, stripped); None when it does not look like a symbol"""
+        if not isinstance(value, str):
+            return None
+        symbol = value.strip().upper()
+        if symbol.endswith(EXCHANGE_SUFFIX) or (0 < len(symbol) <= 5 and symbol.isalpha()):
+            return symbol
+        return None
+
+    def add_dataset(self, dataset_id: str, data: pd.DataFrame) -> List[str]:
+        """Index one dataset's symbols and date coverage; returns the symbols new to the universe"""
+        symbol_col = None if data is None or data.empty else self.find_symbol_column(data)
+        if symbol_col is None:
+            with self._lock:
+                self.remove_dataset(dataset_id)
+                self._datasets[dataset_id] = []   # indexed, no symbols
+            return []
+
+        # One grouped pass over the symbol column; normalization runs on the unique values only
+        date_col = self._date_column(data)
+        frame = pd.DataFrame({'symbol': data[symbol_col].astype(object).values})
+        if date_col is not None:
+            frame['date'] = pd.to_datetime(data[date_col], errors='coerce').values
+            grouped = frame.groupby('symbol', sort=False)['date'].agg(['min', 'max', 'size'])
+        else:
+            grouped = frame.groupby('symbol', sort=False).size().to_frame('size')
+
+        new_symbols = []
+        with self._lock:
+            self.remove_dataset(dataset_id)
+            ids = []
+            for raw, row in grouped.iterrows():
+                symbol = self.normalize(raw)
+                if symbol is None:
+                    continue
+                symbol_id = self._ids.get(symbol)
+                if symbol_id is None:
+                    symbol_id = self._ids[symbol] = len(self._symbols)
+                    self._symbols.append(symbol)
+                    bisect.insort(self._sorted, symbol)
+                    new_symbols.append(symbol)
+                coverage = self._coverage.setdefault(symbol_id, {})
+                previous = coverage.get(dataset_id, {'start': None, 'end': None, 'rows': 0})
+                coverage[dataset_id] = {
+                    'start': self._widen(previous['start'], row.get('min'), min),
+                    'end': self._widen(previous['end'], row.get('max'), max),
+                    'rows': previous['rows'] + int(row['size'])
+                }
+                ids.append(symbol_id)
+            self._datasets[dataset_id] = sorted(set(ids))
+
+        logger.info(f"🔤 Symbol index: {dataset_id} has {len(self._datasets[dataset_id])} symbols "
+                    f"({len(new_symbols)} new, {len(self._symbols)} total)")
+        return new_symbols
+
+    def add_table(self, dataset_id: str, table) -> List[str]:
+        """Index an Arrow table (e.g. memory-mapped columnar upload), reading only the symbol and date columns"""
+        symbol_col = None if table is None else self.find_symbol_column(table.slice(0, 100).to_pandas())
+        if symbol_col is None:
+            return self.add_dataset(dataset_id, None)
+        date_col = self._date_column(table.slice(0, 0).to_pandas())
+        columns = [symbol_col] + ([date_col] if date_col is not None else [])
+        return self.add_dataset(dataset_id, table.select(columns).to_pandas())
+
+    def sync(self, dataset_ids) -> int:
+        """Forget datasets that no longer exist; returns how many were dropped"""
+        with self._lock:
+            stale = [dataset_id for dataset_id in self._datasets if dataset_id not in dataset_ids]
+            for dataset_id in stale:
+                self.remove_dataset(dataset_id)
+        return len(stale)
+
+    def is_indexed(self, dataset_id: str) -> bool:
+        """Check whether a dataset has been indexed"""
+        return dataset_id in self._datasets
+
+    @staticmethod
+    def _widen(current, value, pick):
+        """Widen a coverage bound with a new date (missing dates are ignored)"""
+        if value is None or pd.isna(value):
+            return current
+        return value if current is None else pick(current, value)
+
+    def remove_dataset(self, dataset_id: str):
+        """Drop a dataset's coverage; symbols keep their IDs so encoded keys stay valid"""
+        with self._lock:
+            for symbol_id in self._datasets.pop(dataset_id, []):
+                self._coverage.get(symbol_id, {}).pop(dataset_id, None)
+
+    def get_id(self, symbol: str) -> Optional[int]:
+        """Get the integer ID of a symbol"""
+        return self._ids.get(self.normalize(symbol))
+
+    def get_symbol(self, symbol_id: int) -> Optional[str]:
+        """Get the symbol for an integer ID"""
+        return self._symbols[symbol_id] if 0 <= symbol_id < len(self._symbols) else None
+
+    def encode(self, values) -> np.ndarray:
+        """Encode symbols to int32 IDs (-1 for unknown symbols)"""
+        with self._lock:
+            codes = pd.Index(self._symbols).get_indexer(pd.Series(values, dtype=object).str.strip().str.upper())
+        return codes.astype(np.int32)
+
+    def decode(self, ids) -> List[Optional[str]]:
+        """Decode integer IDs back to symbols"""
+        return [self.get_symbol(int(symbol_id)) for symbol_id in ids]
+
+    def get_symbols(self, with_data_only: bool = True) -> List[str]:
+        """Get the sorted symbol universe, by default only symbols present in some dataset"""
+        with self._lock:
+            if not with_data_only:
+                return list(self._sorted)
+            return [s for s in self._sorted if self._coverage.get(self._ids[s])]
+
+    def get_coverage(self, symbol: str) -> Dict[str, Dict[str, Any]]:
+        """Get {dataset_id: {'start', 'end', 'rows'}} for a symbol"""
+        with self._lock:
+            symbol_id = self.get_id(symbol)
+            return {k: v.copy() for k, v in self._coverage.get(symbol_id, {}).items()}
+
+    def get_datasets(self, symbol: str) -> List[str]:
+        """Get the datasets that contain a symbol"""
+        return list(self.get_coverage(symbol))
+
+    def get_dataset_symbols(self, dataset_id: str) -> List[str]:
+        """Get the symbols indexed for a dataset"""
+        with self._lock:
+            return sorted(self._symbols[i] for i in self._datasets.get(dataset_id, []))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics"""
+        with self._lock:
+            return {'symbols': len(self._symbols), 'datasets': len(self._datasets),
+                    'symbols_with_data': sum(1 for c in self._coverage.values() if c)}
+
+# Global instance
+_symbol_index = None
+
+def get_symbol_index() -> SymbolIndex:
+    """Get the global symbol index instance"""
+    global _symbol_index
+    if _symbol_index is None:
+        _symbol_index = SymbolIndex()
+    return _symbol_index
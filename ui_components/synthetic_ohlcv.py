@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+TradePulse Synthetic OHLCV Generator
+Vectorized, seeded price generation for many symbols at once
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Iterator, Union
+import logging
+import zlib
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_YEAR = 365 * 24 * 3600
+
+class SyntheticOHLCVGenerator:
+    """Geometric Brownian motion OHLCV bars built with cumulative sums over a bars × symbols matrix
+
+    Seeds and base prices derive from the symbols themselves, so the same symbol list, seed and
+    chunk size always produce the same bars.
+    """
+
+    FREQ_MAPPING = {
+        '1m': '1min',
+        '5m': '5min',
+        '15m': '15min',
+        '30m': '30min',
+        '1h': '1h',
+        '4h': '4h',
+        '1d': 'D'
+    }
+
+    def __init__(self, annual_volatility: float = 0.3, annual_drift: float = 0.05,
+                 mean_volume: float = 1_000_000, seed: Optional[int] = None):
+        self.annual_volatility = annual_volatility
+        self.annual_drift = annual_drift
+        self.mean_volume = mean_volume
+        self.seed = seed
+
+    def symbol_seed(self, symbol: str) -> int:
+        """Stable seed for a symbol (Python's str hash changes between processes)"""
+        return zlib.crc32(symbol.encode('utf-8'))
+
+    def base_price(self, symbol: str) -> float:
+        """Stable starting price between 100 and 1000 for a symbol"""
+        return float(100 + self.symbol_seed(symbol) % 900)
+
+    def make_dates(self, start, end, timeframe: str = '1d') -> pd.DatetimeIndex:
+        """Build the bar timestamps for a timeframe between two dates"""
+        return pd.date_range(start=start, end=end, freq=self.FREQ_MAPPING.get(timeframe, timeframe))
+
+    def _rng(self, symbols: List[str]) -> np.random.Generator:
+        """Random generator seeded from the generator seed and the symbol list"""
+        entropy = [self.symbol_seed(symbol) for symbol in symbols]
+        if self.seed is not None:
+            entropy.append(self.seed)
+        return np.random.default_rng(entropy)
+
+    def _bar_years(self, dates: pd.DatetimeIndex) -> float:
+        """Length of one bar as a fraction of a year"""
+        if len(dates) < 2:
+            return 1 / 365
+        step = (dates[1:] - dates[:-1]).median().total_seconds()
+        return step / SECONDS_PER_YEAR
+
+    def generate(self, symbols: List[str], dates: pd.DatetimeIndex,
+                 last_close: Optional[np.ndarray] = None,
+                 rng: Optional[np.random.Generator] = None,
+                 base_prices: Optional[Union[float, np.ndarray]] = None,
+                 bar_years: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """Generate OHLCV matrices of shape (len(dates), len(symbols))
+
+        last_close continues an earlier walk (used for chunked streaming).
+        """
+        rng = rng or self._rng(symbols)
+        n_bars, n_symbols = len(dates), len(symbols)
+        dt = bar_years or self._bar_years(dates)
+        sigma = self.annual_volatility * np.sqrt(dt)
+        mu = (self.annual_drift - 0.5 * self.annual_volatility ** 2) * dt
+
+        if last_close is None:
+            if base_prices is None:
+                base_prices = np.array([self.base_price(symbol) for symbol in symbols])
+            last_close = np.broadcast_to(np.asarray(base_prices, dtype=float), (n_symbols,))
+
+        log_returns = mu + sigma * rng.standard_normal((n_bars, n_symbols))
+        close = last_close * np.exp(np.cumsum(log_returns, axis=0))
+        open_ = np.vstack([last_close, close[:-1]]) if n_bars else close
+        wick = np.abs(rng.standard_normal((2, n_bars, n_symbols))) * (sigma / 2)
+        high = np.maximum(open_, close) * (1 + wick[0])
+        low = np.minimum(open_, close) * (1 - wick[1])
+        volume = rng.exponential(self.mean_volume, (n_bars, n_symbols)).astype(np.int64)
+
+        return {
+            'dates': dates.values,
+            'open': open_,
+            'high': high,
+            'low': low,
+            'close': close,
+            'volume': volume
+        }
+
+    def to_frame(self, arrays: Dict[str, np.ndarray], symbols: List[str]) -> pd.DataFrame:
+        """Flatten OHLCV matrices into a long Date/Open/High/Low/Close/Volume/Symbol frame"""
+        n_bars, n_symbols = arrays['close'].shape
+        # Symbol-major order keeps each symbol's bars contiguous and sorted by date
+        return pd.DataFrame({
+            'Date': np.tile(arrays['dates'], n_symbols),
+            'Open': arrays['open'].T.ravel(),
+            'High': arrays['high'].T.ravel(),
+            'Low': arrays['low'].T.ravel(),
+            'Close': arrays['close'].T.ravel(),
+            'Volume': arrays['volume'].T.ravel(),
+            'Symbol': np.repeat(np.array(symbols, dtype=object), n_bars)
+        })
+
+    def generate_frame(self, symbols: Union[str, List[str]], start, end, timeframe: str = '1d',
+                       base_prices: Optional[Union[float, np.ndarray]] = None) -> pd.DataFrame:
+        """Generate a long OHLCV frame for one or many symbols"""
+        symbols = [symbols] if isinstance(symbols, str) else list(symbols)
+        dates = self.make_dates(start, end, timeframe)
+        return self.to_frame(self.generate(symbols, dates, base_prices=base_prices), symbols)
+
+    def iter_chunks(self, symbols: List[str], start, end, timeframe: str = '1m',
+                    chunk_bars: int = 100_000) -> Iterator[pd.DataFrame]:
+        """Stream the walk in chunks of chunk_bars bars per symbol, continuing prices across chunks"""
+        dates = self.make_dates(start, end, timeframe)
+        rng = self._rng(symbols)
+        bar_years = self._bar_years(dates)
+        last_close = None
+        for offset in range(0, len(dates), chunk_bars):
+            arrays = self.generate(symbols, dates[offset:offset + chunk_bars], last_close, rng, bar_years=bar_years)
+            last_close = arrays['close'][-1]
+            yield self.to_frame(arrays, symbols)
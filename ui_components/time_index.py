@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+TradePulse Time Index
+Pre-sorted datetime columns built once at ingest, sliced with binary search
+"""
+
+import pandas as pd
+from typing import Optional
+import logging
+import warnings
+
+logger = logging.getLogger(__name__)
+
+class TimeIndex:
+    """Build and query a dataset's sorted time column
+
+    build() converts the time column to datetime64 and stable-sorts the rows once at ingest
+    (only when every value parses), recording the column in DataFrame.attrs. Range queries on a sorted frame are two searchsorted
+    calls and a positional slice. The sorted check is cached in attrs against the column's buffer
+    address and length, since attrs alone survive reordering operations but a reordered column is
+    a new buffer; a frame whose buffer differs is checked once and the result cached again.
+    """
+
+    TIME_COLUMNS = ['date', 'datetime', 'timestamp', 'time']
+    ATTR_COLUMN = 'time_column'
+    ATTR_SORTED = 'time_sorted'
+
+    @staticmethod
+    def find_time_column(data: pd.DataFrame) -> Optional[str]:
+        """Get the column holding timestamps (marked column first, then common names)"""
+        column = data.attrs.get(TimeIndex.ATTR_COLUMN)
+        if column in data.columns:
+            return column
+        lowered = {str(col).lower(): col for col in data.columns}
+        return next((lowered[name] for name in TimeIndex.TIME_COLUMNS if name in lowered), None)
+
+    @staticmethod
+    def parse(series: pd.Series) -> Optional[pd.Series]:
+        """Convert a column to datetime64, or None unless every non-null value parses"""
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series
+        if pd.api.types.is_bool_dtype(series) or pd.api.types.is_float_dtype(series):
+            return None
+        try:
+            if pd.api.types.is_integer_dtype(series):
+                # Integer dates are YYYYMMDD, never epoch offsets
+                parsed = pd.to_datetime(series.astype('string'), format='%Y%m%d', errors='coerce')
+            else:
+                with warnings.catch_warnings():
+                    # Format inference warnings are moot: a partial parse is rejected below
+                    warnings.simplefilter('ignore', UserWarning)
+                    parsed = pd.to_datetime(series, errors='coerce')
+        except (TypeError, ValueError, OverflowError):
+            return None
+        if (parsed.isna() & series.notna()).any():
+            return None
+        return parsed
+
+    @staticmethod
+    def build(data: pd.DataFrame, column: Optional[str] = None) -> pd.DataFrame:
+        """Get the frame with a datetime64 time column in ascending order (the input is not modified)
+
+        Rows are never dropped or rewritten: a column that does not fully parse is left as it
+        is and no time index is recorded, and a column with missing times keeps its row order.
+        """
+        column = column or TimeIndex.find_time_column(data)
+        if data is None or column is None:
+            return data
+        parsed = TimeIndex.parse(data[column])
+        if parsed is None:
+            logger.info(f"ℹ️ Time index: {column} is not a date column, leaving it unindexed")
+            return data
+        result = data
+        if parsed is not data[column]:
+            result = data.copy(deep=False)
+            result[column] = parsed
+        if not parsed.is_monotonic_increasing and not parsed.isna().any():
+            # Stable, so equal timestamps keep their upload order
+            result = result.sort_values(column, kind='mergesort')
+        result.attrs[TimeIndex.ATTR_COLUMN] = column
+        TimeIndex.is_sorted(result, column)   # cache the order check for later slices
+        return result
+
+    @staticmethod
+    def is_sorted(data: pd.DataFrame, column: str) -> bool:
+        """Check whether a frame's time column can be binary-searched (O(1) once cached for this buffer)"""
+        series = data[column]
+        if not pd.api.types.is_datetime64_any_dtype(series):
+            return False
+        token = (column, TimeIndex._buffer_key(series))
+        if data.attrs.get(TimeIndex.ATTR_SORTED) == token:
+            return True
+        if not series.is_monotonic_increasing:
+            return False
+        data.attrs[TimeIndex.ATTR_SORTED] = token
+        return True
+
+    @staticmethod
+    def _buffer_key(series: pd.Series) -> tuple:
+        """Identify a datetime column's values by buffer address and length"""
+        values = series.array.asi8
+        return values.__array_interface__['data'][0], len(values)
+
+    @staticmethod
+    def slice(data: pd.DataFrame, start=None, end=None, column: Optional[str] = None) -> pd.DataFrame:
+        """Get rows with start <= time <= end; a positional slice when the time column is sorted"""
+        if data is None or data.empty:
+            return data
+        column = column or TimeIndex.find_time_column(data)
+        if column is None or (start is None and end is None):
+            return data
+
+        if TimeIndex.is_sorted(data, column):
+            times = data[column]
+            i = times.searchsorted(TimeIndex._bound(start, times), 'left') if start is not None else 0
+            j = times.searchsorted(TimeIndex._bound(end, times), 'right') if end is not None else len(times)
+            return data.iloc[i:j]
+
+        # Unsorted or unparsed data: one mask scan over a converted copy of the column; rows
+        # without a valid time are left out of the result only, never out of the stored frame
+        times = TimeIndex.parse(data[column])
+        if times is None:
+            times = pd.to_datetime(data[column], errors='coerce')
+        mask = pd.Series(True, index=data.index)
+        if start is not None:
+            mask &= times >= pd.Timestamp(start)
+        if end is not None:
+            mask &= times <= pd.Timestamp(end)
+        return data[mask]
+
+    @staticmethod
+    def _bound(value, times: pd.Series) -> pd.Timestamp:
+        """Convert a range bound to the time column's timezone for searchsorted"""
+        bound = pd.Timestamp(value)
+        tz = times.dt.tz
+        if tz is not None:
+            return bound.tz_localize(tz) if bound.tzinfo is None else bound.tz_convert(tz)
+        return bound.tz_convert(None) if bound.tzinfo is not None else bound
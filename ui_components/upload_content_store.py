@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+TradePulse Upload Content Store
+Content-addressed (SHA-256) upload storage that links repeat imports to their parsed dataset
+"""
+
+from typing import Dict, Any, Optional
+import hashlib
+import logging
+import threading
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+class UploadContentStore:
+    """Store each distinct upload once as <upload_dir>/<digest prefix>_<filename>
+
+    Files are hashed before anything is copied, so a duplicate costs one read. The index
+    remembers every digest's stored path and the dataset it was parsed into, plus a
+    (path, size, mtime) → digest cache so re-importing an unchanged source file skips even the
+    hashing pass.
+    """
+
+    INDEX_NAME = '.content_index.json'   # dotfile, so the upload-data scan never globs it
+    BLOCK_SIZE = 8 * 1024 * 1024
+    DIGEST_PREFIX = 16
+    # A file modified this recently may change again without its coarse-grained mtime moving
+    RACY_SECONDS = 2.0
+
+    def __init__(self, upload_dir: str = "uploads"):
+        self.upload_dir = Path(upload_dir)
+        self.index_path = self.upload_dir / self.INDEX_NAME
+        self._lock = threading.Lock()
+        index = self._load()
+        self.blobs = index.get('blobs', {})       # digest -> {'path', 'size', 'filenames', 'dataset_id'}
+        self.sources = index.get('sources', {})   # abs source path -> {'size', 'mtime', 'digest'}
+        self.stats = {'stored': 0, 'duplicates': 0, 'bytes_saved': 0}
+
+    def _load(self) -> Dict[str, Any]:
+        """Load the content index from disk"""
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ Upload content store: Could not read index, starting empty: {e}")
+            return {}
+
+    def _save(self):
+        """Write the index atomically; caller holds the lock"""
+        self.upload_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name(self.index_path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'blobs': self.blobs, 'sources': self.sources}, f, default=str)
+        os.replace(tmp_path, self.index_path)
+
+    def _cached_digest(self, source: str, stat: os.stat_result) -> Optional[str]:
+        """Get the digest of an unchanged, previously imported source file"""
+        cached = self.sources.get(source)
+        if cached and cached['size'] == stat.st_size and cached['mtime'] == stat.st_mtime:
+            return cached['digest']
+        return None
+
+    def _existing(self, digest: str) -> Optional[Dict[str, Any]]:
+        """Get the index entry for a digest whose stored file (if any) is still on disk"""
+        entry = self.blobs.get(digest)
+        if entry and entry.get('path') and not os.path.exists(entry['path']):
+            return None
+        return entry
+
+    def store_file(self, file_path: str) -> Dict[str, Any]:
+        """Copy a file into the store unless identical content is already there"""
+        source = os.path.abspath(file_path)
+        size = os.path.getsize(source)
+        filename = Path(source).name
+
+        # Hash first so a duplicate is never copied
+        digest = self.digest_file(source)
+        with self._lock:
+            entry = self._existing(digest)
+            if entry and entry.get('path'):
+                return self._duplicate(digest, entry, filename, size)
+
+        self.upload_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.upload_dir / f".{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            shutil.copyfile(source, tmp_path)
+            with self._lock:
+                entry = self._existing(digest)
+                if entry and entry.get('path'):
+                    return self._duplicate(digest, entry, filename, size)
+                return self._add(digest, tmp_path, filename, size)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def store_bytes(self, content: bytes, filename: str) -> Dict[str, Any]:
+        """Write in-memory upload content into the store unless identical content is already there"""
+        digest = self.digest_bytes(content)
+        with self._lock:
+            entry = self._existing(digest)
+            if entry and entry.get('path'):
+                return self._duplicate(digest, entry, filename, len(content))
+
+            self.upload_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.upload_dir / f".{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(content)
+                return self._add(digest, tmp_path, filename, len(content))
+            finally:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+
+    def _add(self, digest: str, tmp_path: Path, filename: str, size: int) -> Dict[str, Any]:
+        """Move a written copy to its final name and index it; caller holds the lock"""
+        destination = self.upload_dir / f"{digest[:self.DIGEST_PREFIX]}_{filename}"
+        os.replace(tmp_path, destination)
+        entry = self.blobs.setdefault(digest, {'dataset_id': None, 'filenames': []})
+        entry.update({'path': str(destination), 'size': size, 'stored_at': datetime.now().isoformat()})
+        if filename not in entry['filenames']:
+            entry['filenames'].append(filename)
+        self.stats['stored'] += 1
+        self._save()
+        return {'digest': digest, 'duplicate': False, **entry}
+
+    def _duplicate(self, digest: str, entry: Dict[str, Any], filename: str, size: int) -> Dict[str, Any]:
+        """Record a repeat import of stored content; caller holds the lock"""
+        if filename not in entry.setdefault('filenames', []):
+            entry['filenames'].append(filename)
+        self.stats['duplicates'] += 1
+        self.stats['bytes_saved'] += size
+        self._save()
+        logger.info(f"♻️ Upload content store: {filename} matches stored {entry['path']}, skipping copy")
+        return {'digest': digest, 'duplicate': True, **entry}
+
+    def digest_file(self, file_path: str) -> str:
+        """Hash a file in place (no copy), reusing the digest of an unchanged source"""
+        source = os.path.abspath(file_path)
+        stat = os.stat(source)
+        with self._lock:
+            digest = self._cached_digest(source, stat)
+        if digest:
+            return digest
+        hasher = hashlib.sha256()
+        with open(source, 'rb') as f:
+            for block in iter(lambda: f.read(self.BLOCK_SIZE), b''):
+                hasher.update(block)
+        digest = hasher.hexdigest()
+        if time.time() - stat.st_mtime >= self.RACY_SECONDS:
+            with self._lock:
+                self.sources[source] = {'size': stat.st_size, 'mtime': stat.st_mtime, 'digest': digest}
+                self._save()
+        return digest
+
+    def digest_bytes(self, content: bytes) -> str:
+        """Hash in-memory upload content (e.g. from a browser file input)"""
+        return hashlib.sha256(content).hexdigest()
+
+    def get_dataset_id(self, digest: str) -> Optional[str]:
+        """Get the dataset previously parsed from this content, if any"""
+        with self._lock:
+            entry = self._existing(digest)
+            return entry.get('dataset_id') if entry else None
+
+    def link_dataset(self, digest: str, dataset_id: str, filename: Optional[str] = None):
+        """Remember the dataset that content was parsed into"""
+        with self._lock:
+            entry = self.blobs.setdefault(digest, {'path': None, 'size': None, 'filenames': []})
+            entry['dataset_id'] = dataset_id
+            if filename and filename not in entry['filenames']:
+                entry['filenames'].append(filename)
+            self._save()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get dedup statistics"""
+        with self._lock:
+            return {
+                **self.stats,
+                'unique_blobs': sum(1 for entry in self.blobs.values() if entry.get('path')),
+                'stored_bytes': sum(entry.get('size') or 0 for entry in self.blobs.values() if entry.get('path'))
+            }
+
+# Shared instances, one per upload directory, so every caller sees the same index
+_content_stores = {}
+_content_stores_lock = threading.Lock()
+
+def get_upload_content_store(upload_dir: str = "uploads") -> UploadContentStore:
+    """Get the shared content store for an upload directory"""
+    key = os.path.abspath(upload_dir)
+    with _content_stores_lock:
+        if key not in _content_stores:
+            _content_stores[key] = UploadContentStore(upload_dir)
+        return _content_stores[key]